@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks des chemins critiques du package core.
+
+Chaque benchmark mesure un débit (opérations par seconde, meilleur de
+plusieurs répétitions) et les allocations mémoire (tracemalloc) d'une
+opération : octets conservés par opération et pic mémoire d'une série.
+
+Utilisation :
+    python benchmarks/bench_core.py              # compare à la référence
+    python benchmarks/bench_core.py --save       # enregistre la référence
+    python benchmarks/bench_core.py deck_draw    # un seul benchmark
+
+Le script retourne un code de sortie 1 si un benchmark régresse au-delà du
+seuil par rapport à la référence JSON (``baseline.json``). La référence
+dépend de la machine : l'enregistrer sur la machine qui compare. Le débit
+des benchmarks d'écriture sur disque (fsync) varie trop d'une machine à
+l'autre : il est affiché mais seule leur mémoire est comparée.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from core.card import CARDS
+from core.deck import Deck
+from core.game import Game, GameState
+from core.hand import Hand
+from core.player import Player
+
+#: Fichier de référence des résultats
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+#: Baisse de débit tolérée avant de signaler une régression (25 %)
+DEFAULT_THRESHOLD = 0.25
+
+#: Octets par opération tolérés en plus de la référence (bruit de tracemalloc)
+MEMORY_SLACK = 64
+
+#: Durée minimale d'une répétition, en secondes
+MIN_TIME = 0.1
+
+#: Nombre maximal d'opérations par répétition
+MAX_NUMBER = 200_000
+
+#: Nombre de parties distinctes préparées pour les benchmarks de Game
+POOL_SIZE = 64
+
+#: Nombre de répétitions (le meilleur débit est retenu)
+REPEAT = 5
+
+#: Nouvelles mesures d'un benchmark en régression apparente, pour écarter
+#: le bruit de la machine
+RETRIES = 2
+
+#: Benchmarks limités par le disque : débit non comparé à la référence
+IO_BENCHMARKS = {"player_save"}
+
+#: Répertoire temporaire des benchmarks d'écriture, créé et supprimé par main()
+_work_dir = None
+
+
+def _hands(n):
+    """Mains variées (dures, souples, bust) pour les mesures de Hand."""
+    hands = []
+    for i in range(n):
+        hand = Hand()
+        hand.add_cards([CARDS[(i * 7) % 52], CARDS[(i * 11 + 3) % 52], CARDS[(i * 5 + 1) % 52]])
+        hands.append(hand)
+    return hands
+
+
+def _dealt_games(n):
+    """Parties distribuées et deux cartes du croupier, pour dealer_play."""
+    pool = []
+    for i in range(POOL_SIZE):
+        game = Game(num_decks=1, rng=i)
+        game.deal_initial_cards()
+        game.state = GameState.DEALER_TURN
+        pool.append((game, list(game.dealer_hand.cards)))
+    return [pool[i % POOL_SIZE] for i in range(n)]
+
+
+def _finished_games(n):
+    """Parties dont le croupier a fini de jouer."""
+    pool = []
+    for game, _ in _dealt_games(POOL_SIZE):
+        game.dealer_play()
+        pool.append(game)
+    return [pool[i % POOL_SIZE] for i in range(n)]
+
+
+def _player(n):
+    """Un joueur et un fichier du répertoire temporaire pour Player.save."""
+    path = os.path.join(_work_dir, "player_stats.json")
+    return [(Player(), path)] * n
+
+
+def _repeat(obj):
+    """Fabrique de préparation qui répète le même objet."""
+    return lambda n: [obj] * n
+
+
+def _fresh_deck(n):
+    """Nombre de jeux de chaque sabot construit."""
+    return [6] * n
+
+
+def _deal(game):
+    game.reset()
+    game.deal_initial_cards()
+
+
+def _dealer_play(args):
+    # Remet les deux cartes initiales du croupier : l'opération est rejouable
+    game, cards = args
+    game.dealer_hand.clear()
+    game.dealer_hand.add_cards(cards)
+    game.dealer_play()
+
+
+#: Benchmarks : nom -> (opération, préparation des arguments)
+BENCHMARKS = {
+    "card_value": (lambda card: card.value(), lambda n: [CARDS[i % 52] for i in range(n)]),
+    "hand_get_value": (Hand.get_value, _hands),
+    "hand_is_soft_hand": (Hand.is_soft_hand, _hands),
+    "deck_construct": (Deck, _fresh_deck),
+    "deck_shuffle": (Deck.shuffle, _repeat(Deck(6, rng=1))),
+    "deck_draw": (Deck.draw_card, _repeat(Deck(6, rng=1))),
+    "deck_reset": (Deck.reset, _repeat(Deck(6, rng=1))),
+    "game_deal_initial_cards": (_deal, _repeat(Game(num_decks=6, rng=1))),
+    "game_dealer_play": (_dealer_play, _dealt_games),
+    "game_determine_winner": (Game._determine_winner, _finished_games),
+    "player_save": (lambda args: args[0].save(args[1]), _player),
+}
+
+
+def _time(func, args):
+    """Temps d'exécution de func sur chaque argument."""
+    start = time.perf_counter()
+    for arg in args:
+        func(arg)
+    return time.perf_counter() - start
+
+
+def measure(name):
+    """Mesure le débit et les allocations d'un benchmark.
+
+    Args:
+        name (str): Nom du benchmark (clé de BENCHMARKS)
+
+    Returns:
+        dict: ops_per_sec, net_bytes_per_op et peak_bytes
+    """
+    func, setup = BENCHMARKS[name]
+
+    # Calibrage : assez d'opérations pour durer au moins MIN_TIME
+    number = 100
+    while True:
+        args = setup(number)
+        elapsed = _time(func, args)
+        if elapsed >= MIN_TIME or number >= MAX_NUMBER:
+            break
+        number = min(number * (10 if elapsed < MIN_TIME / 10 else 2), MAX_NUMBER)
+
+    best = min(_time(func, args) for _ in range(REPEAT))
+
+    # Allocations sur une série plus courte, hors mesure du temps
+    count = min(number, 10_000)
+    args = setup(count)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for arg in args:
+        func(arg)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": number / best,
+        "net_bytes_per_op": (after - before) / count,
+        "peak_bytes": peak - before,
+    }
+
+
+def compare(name, result, reference, threshold):
+    """Compare un résultat à sa référence.
+
+    Returns:
+        list: Messages de régression (vide si aucune)
+    """
+    problems = []
+    io_bound = name in IO_BENCHMARKS
+    if not io_bound and result["ops_per_sec"] < reference["ops_per_sec"] * (1 - threshold):
+        problems.append(f"{name}: débit {result['ops_per_sec']:.0f} op/s "
+                        f"(référence {reference['ops_per_sec']:.0f} op/s)")
+    allowed = reference["net_bytes_per_op"] * (1 + threshold) + MEMORY_SLACK
+    if result["net_bytes_per_op"] > allowed:
+        problems.append(f"{name}: {result['net_bytes_per_op']:.0f} octets/op "
+                        f"(référence {reference['net_bytes_per_op']:.0f})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks du package core")
+    parser.add_argument("names", nargs="*", help="benchmarks à lancer (tous par défaut)")
+    parser.add_argument("--save", action="store_true", help="enregistre les résultats comme référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="baisse de débit tolérée (0.25 = 25 %%)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="fichier de référence JSON")
+    options = parser.parse_args(argv)
+
+    names = options.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"benchmark inconnu : {', '.join(unknown)}")
+
+    baseline = {}
+    if os.path.exists(options.baseline):
+        with open(options.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get("results", {})
+
+    global _work_dir
+    results = {}
+    problems = []
+    print(f"{'benchmark':<26}{'op/s':>14}{'référence':>14}{'octets/op':>11}{'pic (o)':>10}")
+    with tempfile.TemporaryDirectory(prefix="bench-") as directory:
+        _work_dir = directory
+        try:
+            for name in names:
+                result = measure(name)
+                reference = baseline.get(name)
+                for _ in range(RETRIES if reference and not options.save else 0):
+                    if not compare(name, result, reference, options.threshold):
+                        break
+                    retry = measure(name)
+                    result["ops_per_sec"] = max(result["ops_per_sec"], retry["ops_per_sec"])
+                    result["net_bytes_per_op"] = min(result["net_bytes_per_op"], retry["net_bytes_per_op"])
+                results[name] = result
+                ref_text = f"{reference['ops_per_sec']:>14.0f}" if reference else f"{'-':>14}"
+                print(f"{name:<26}{result['ops_per_sec']:>14.0f}{ref_text}"
+                      f"{result['net_bytes_per_op']:>11.1f}{result['peak_bytes']:>10}")
+                if reference and not options.save:
+                    problems.extend(compare(name, result, reference, options.threshold))
+        finally:
+            _work_dir = None
+
+    if options.save:
+        baseline.update(results)
+        with open(options.baseline, 'w', encoding='utf-8') as f:
+            json.dump({"python": platform.python_version(), "results": baseline}, f, indent=2)
+        print(f"\nRéférence enregistrée dans {options.baseline}")
+        return 0
+
+    if problems:
+        print("\nRégressions :")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\nAucune régression")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,104 @@
 
 Ce module fournit la classe ConfigManager qui gère le chargement,
 la sauvegarde et l'accès aux paramètres de configuration du jeu.
+
+Les clés pointées sont indexées à plat au chargement : ``get`` est une
+seule recherche dans un dictionnaire, et ConfigHandle garde une valeur
+résolue (et convertie) tant que la configuration ne change pas.
+
+Les modifications sont visibles immédiatement en mémoire ; l'écriture du
+fichier est différée (anti-rebond) et faite par un thread de fond, et
+``batch`` regroupe plusieurs modifications en une seule écriture.
+
+Le fichier peut aussi être surveillé (``watch``) : un thread de fond
+compare sa date de modification et relit le fichier quand il change hors
+du jeu. Les sections modifiées sont appliquées par ``dispatch_pending``,
+depuis la boucle principale, et publiées aux abonnés (``subscribe``).
 """
 
+import copy
 import json
 import os
+import threading
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.persistence import DEFAULT_BACKUPS, WriteBehindSaver, atomic_write_json, load_json
+
+
+#: Marqueur d'absence de valeur dans l'index
+_MISSING = object()
+
+
+class ConfigHandle:
+    """Accès typé à une clé de configuration, résolu une seule fois.
+
+    La valeur est lue dans l'index et convertie au premier accès, puis
+    relue seulement quand la version de la configuration change (après
+    ``set``, ``reset_to_default``...). Une lecture coûte une comparaison
+    d'entiers.
+
+    Attributes:
+        key (str): Clé pointée (ex: 'ui.table_theme')
+        default (Any): Valeur si la clé est absente ou invalide
+        cast (Callable): Conversion appliquée à la valeur (ex: float)
+
+    Examples:
+        >>> volume = config.handle('features.music_volume', 0.5, float)
+        >>> volume.value
+        0.5
+    """
+
+    __slots__ = ("_manager", "key", "default", "cast", "_version", "_value")
+
+    def __init__(self, manager: "ConfigManager", key: str, default: Any = None,
+                 cast: Optional[Callable[[Any], Any]] = None):
+        """Initialise l'accès à une clé.
+
+        Args:
+            manager (ConfigManager): Gestionnaire de configuration
+            key (str): Clé pointée
+            default (Any, optional): Valeur par défaut
+            cast (Callable, optional): Conversion de la valeur (int, float, tuple...)
+        """
+        self._manager = manager
+        self.key = key
+        self.default = default
+        self.cast = cast
+        self._version = -1
+        self._value = default
+
+    @property
+    def value(self) -> Any:
+        """Valeur courante de la clé (convertie)."""
+        if self._version != self._manager.version:
+            self._resolve()
+        return self._value
+
+    def get(self) -> Any:
+        """Retourne la valeur courante de la clé (convertie)."""
+        return self.value
+
+    def set(self, value: Any) -> None:
+        """Définit la valeur de la clé dans la configuration.
+
+        Args:
+            value (Any): Nouvelle valeur
+        """
+        self._manager.set(self.key, value)
+
+    def _resolve(self) -> None:
+        """Relit et convertit la valeur dans l'index du gestionnaire."""
+        value = self._manager.get(self.key, self.default)
+        if self.cast is not None and value is not self.default:
+            try:
+                value = self.cast(value)
+            except (TypeError, ValueError):
+                value = self.default
+        self._value = value
+        self._version = self._manager.version
 
 
 class ConfigManager:
@@ -23,6 +115,8 @@ class ConfigManager:
         CONFIG_FILE (str): Chemin du fichier de configuration principal
         DEFAULT_CONFIG (dict): Configuration par défaut du jeu
         config (dict): Configuration actuelle chargée
+        version (int): Compteur incrémenté à chaque modification de la
+            configuration (invalide les ConfigHandle)
         
     Examples:
         >>> config = get_config_manager()
@@ -34,6 +128,10 @@ class ConfigManager:
     CONFIG_DIR = "config"
     #: Chemin du fichier de configuration principal
     CONFIG_FILE = os.path.join(CONFIG_DIR, "settings.json")
+    #: Délai sans modification avant l'écriture du fichier, en secondes
+    SAVE_DELAY = 0.5
+    #: Intervalle de vérification du fichier surveillé, en secondes
+    WATCH_INTERVAL = 1.0
     
     # configuration par defaut style vip
     DEFAULT_CONFIG = {
@@ -42,6 +140,7 @@ class ConfigManager:
             "height": 720,
             "fps": 60,
             "num_decks": 1,
+            "penetration": 0.75,
             "animation_delay": 0.5
         },
         "cards": {
@@ -62,6 +161,7 @@ class ConfigManager:
         "timing": {
             "initial_deal_duration": 1.0,
             "dealer_reveal_duration": 1.0,
+            "dealer_turn_duration": 1.0,
             "result_screen_duration": 3.0,
             "action_delay": 0.5
         },
@@ -76,7 +176,15 @@ class ConfigManager:
         "features": {
             "sound_enabled": False,
             "animations_enabled": True,
-            "show_hints": True
+            "show_hints": True,
+            "show_count": False,
+            "count_system": "Hi-Lo",
+            "watch_config": False,
+            "dirty_rendering": True
+        },
+        "storage": {
+            "backend": "json",
+            "database": "blackjack.db"
         }
     }
     
@@ -86,7 +194,260 @@ class ConfigManager:
         Charge la configuration depuis le fichier JSON ou crée
         une configuration par défaut si le fichier n'existe pas.
         """
+        self.version = 0
+        self._index: Dict[str, Any] = {}
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._saver: Optional[WriteBehindSaver] = None
+        self._subscribers: List[Tuple[Optional[str], Callable[[str, Any], None]]] = []
+        # Configurations relues par le thread de surveillance, en attente d'application
+        self._changes: deque = deque()
+        self._file_lock = threading.Lock()
+        # Protège la configuration pendant sa copie par le thread d'écriture
+        self._config_lock = threading.Lock()
+        self._written_stamp = None
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
         self.config = self._load_config()
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Reconstruit l'index des clés pointées et invalide les ConfigHandle.
+        
+        Appelé par les méthodes qui remplacent des sections entières
+        (``set`` ne met à jour que la clé modifiée) ; à appeler aussi après
+        une modification directe de ``config``.
+        """
+        self._index = dict(self._walk(self.config, ''))
+        self.version += 1
+    
+    @staticmethod
+    def _walk(section: Dict[str, Any], prefix: str) -> Iterator[Tuple[str, Any]]:
+        """Parcourt une section et retourne ses clés pointées et leurs valeurs."""
+        for name, value in section.items():
+            key = prefix + name
+            yield key, value
+            if isinstance(value, dict):
+                yield from ConfigManager._walk(value, key + '.')
+    
+    def _reindex(self, key: str, old: Any, value: Any) -> None:
+        """Met à jour l'index pour une seule clé modifiée et invalide les ConfigHandle.
+        
+        Seules les entrées de la clé et de ses sous-clés sont touchées,
+        au lieu de reconstruire tout l'index.
+        """
+        index = self._index
+        if isinstance(old, dict):
+            for name, _ in self._walk(old, key + '.'):
+                index.pop(name, None)
+        index[key] = value
+        if isinstance(value, dict):
+            index.update(self._walk(value, key + '.'))
+        self.version += 1
+    
+    def _schedule_save(self) -> None:
+        """Programme l'écriture différée de la configuration.
+        
+        Dans un bloc ``batch``, l'écriture est reportée à la fin du bloc.
+        """
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if self._saver is None:
+            self._saver = WriteBehindSaver(self._write_config, interval=self.SAVE_DELAY,
+                                           debounce=True)
+        # Pas de copie ici : une rafale de set ne coûte qu'une copie, à l'écriture
+        self._saver.schedule(self.config)
+    
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """Copie la configuration sous verrou puis l'écrit (thread d'écriture)."""
+        with self._config_lock:
+            config = copy.deepcopy(config)
+        self._save_config(config)
+    
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """Regroupe plusieurs modifications en une seule écriture.
+        
+        Les valeurs sont visibles dès le ``set`` ; le fichier est écrit
+        (en différé) une seule fois à la sortie du bloc le plus externe.
+        
+        Examples:
+            >>> with config.batch():
+            ...     config.set('game.fps', 120)
+            ...     config.set('ui.table_theme', 'blue')
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._schedule_save()
+    
+    def flush(self) -> None:
+        """Écrit immédiatement les modifications en attente."""
+        if self._saver is not None:
+            self._saver.flush()
+    
+    def close(self) -> None:
+        """Écrit les modifications en attente et arrête les threads de fond."""
+        self.stop_watching()
+        if self._saver is not None:
+            self._saver.close()
+            self._saver = None
+    
+    def subscribe(self, callback: Callable[[str, Any], None],
+                  section: Optional[str] = None) -> Callable[[str, Any], None]:
+        """Abonne une fonction aux modifications de la configuration.
+        
+        La fonction est appelée avec le nom de la section modifiée et son
+        nouveau contenu, après un ``set`` comme après un rechargement du
+        fichier (``dispatch_pending``), toujours dans le thread appelant.
+        
+        Args:
+            callback (Callable): Fonction ``callback(section, values)``
+            section (str, optional): Section suivie (ex: 'timing').
+                Par défaut, toutes les sections.
+            
+        Returns:
+            Callable: La fonction abonnée (pour ``unsubscribe``)
+            
+        Examples:
+            >>> config.subscribe(lambda section, timing: print(timing), 'timing')
+        """
+        self._subscribers.append((section, callback))
+        return callback
+    
+    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """Désabonne une fonction de toutes ses sections.
+        
+        Args:
+            callback (Callable): Fonction passée à ``subscribe``
+        """
+        self._subscribers = [(section, cb) for section, cb in self._subscribers
+                             if cb is not callback]
+    
+    def _publish(self, sections: Iterable[str]) -> None:
+        """Prévient les abonnés des sections modifiées."""
+        for name in sections:
+            values = self.config.get(name)
+            for section, callback in list(self._subscribers):
+                if section is None or section == name:
+                    try:
+                        callback(name, values)
+                    except Exception as e:
+                        print(f"erreur dans un abonné à la config {e}")
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Date de modification et taille du fichier (None s'il n'existe pas)."""
+        try:
+            stat = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def watch(self, interval: Optional[float] = None) -> None:
+        """Surveille le fichier de configuration dans un thread de fond.
+        
+        Le thread compare la date de modification du fichier à chaque
+        intervalle et relit le fichier quand il a été modifié hors du jeu
+        (les écritures du gestionnaire lui-même sont ignorées). Les
+        changements sont appliqués par ``dispatch_pending``.
+        
+        Args:
+            interval (float, optional): Secondes entre deux vérifications.
+                Par défaut WATCH_INTERVAL.
+        """
+        if self._watcher is not None:
+            return
+        self._watch_stop.clear()
+        self._watcher = threading.Thread(target=self._watch_loop,
+                                         args=(interval or self.WATCH_INTERVAL,),
+                                         name="config-watcher", daemon=True)
+        self._watcher.start()
+    
+    def stop_watching(self) -> None:
+        """Arrête la surveillance du fichier."""
+        if self._watcher is not None:
+            self._watch_stop.set()
+            self._watcher.join()
+            self._watcher = None
+    
+    def _watch_loop(self, interval: float) -> None:
+        """Boucle du thread de surveillance."""
+        seen = self._file_stamp()
+        while not self._watch_stop.wait(interval):
+            with self._file_lock:
+                stamp = self._file_stamp()
+                if stamp is None or stamp == seen:
+                    continue
+                seen = stamp
+                if stamp == self._written_stamp:
+                    continue  # écriture du gestionnaire lui-même
+            config = load_json(self.CONFIG_FILE)
+            if isinstance(config, dict):
+                self._changes.append(config)
+    
+    def dispatch_pending(self) -> List[str]:
+        """Applique les rechargements du fichier et prévient les abonnés.
+        
+        À appeler depuis la boucle principale (une fois par image) : sans
+        changement en attente, l'appel ne coûte qu'un test. Une section
+        retirée du fichier reprend sa valeur par défaut (ou disparaît si
+        elle n'en a pas) et est publiée comme les autres.
+        
+        Returns:
+            list: Sections modifiées
+        """
+        if not self._changes:
+            return []
+        changed = []
+        while self._changes:
+            config = self._changes.popleft()
+            # Sections du fichier relu et sections actuelles (retirées du fichier)
+            sections = list(self.config)
+            sections += [name for name in config if name not in self.config]
+            for section in sections:
+                if section in config:
+                    values = config[section]
+                elif section in self.DEFAULT_CONFIG:
+                    values = copy.deepcopy(self.DEFAULT_CONFIG[section])
+                else:
+                    values = _MISSING
+                if self.config.get(section, _MISSING) == values:
+                    continue
+                with self._config_lock:
+                    if values is _MISSING:
+                        del self.config[section]
+                    else:
+                        self.config[section] = values
+                if section not in changed:
+                    changed.append(section)
+        if changed:
+            self.invalidate()
+            self._publish(changed)
+        return changed
+    
+    def handle(self, key: str, default: Any = None,
+               cast: Optional[Callable[[Any], Any]] = None) -> ConfigHandle:
+        """Retourne un accès typé à une clé, pour les lectures fréquentes.
+        
+        Args:
+            key (str): Clé de configuration (ex: 'features.show_hints')
+            default (Any, optional): Valeur par défaut
+            cast (Callable, optional): Conversion de la valeur (int, float, tuple...)
+            
+        Returns:
+            ConfigHandle: Accès à la clé, lu en temps constant
+            
+        Examples:
+            >>> show_hints = config.handle('features.show_hints', True, bool)
+            >>> if show_hints.value:
+            ...     draw_strategy_hint(screen, game)
+        """
+        return ConfigHandle(self, key, default, cast)
     
     def _load_config(self) -> Dict[str, Any]:
         """Charge la configuration depuis le fichier JSON.
@@ -94,35 +455,41 @@ class ConfigManager:
         Returns:
             dict: Configuration chargée ou configuration par défaut
         """
+        # Un fichier tronqué est remplacé par sa dernière copie de secours
+        config = load_json(self.CONFIG_FILE)
+        if config is not None:
+            return config
         if os.path.exists(self.CONFIG_FILE):
-            try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"erreur lors du chargement de la config {e}")
-                return self.DEFAULT_CONFIG.copy()
+            # Fichier illisible sans copie valide : il n'est pas écrasé
+            return copy.deepcopy(self.DEFAULT_CONFIG)
         
         # Créer la config par défaut si elle n'existe pas
         self._save_config(self.DEFAULT_CONFIG)
-        return self.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Sauvegarde la configuration dans le fichier JSON.
         
+        Le fichier est remplacé atomiquement (fichier temporaire, fsync,
+        renommage) en gardant une copie de secours de la version précédente.
+        
         Args:
             config (dict): Configuration à sauvegarder
         """
         os.makedirs(self.CONFIG_DIR, exist_ok=True)
         try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            with self._file_lock:
+                atomic_write_json(self.CONFIG_FILE, config, backups=DEFAULT_BACKUPS)
+                # Empreinte de notre écriture, ignorée par la surveillance
+                self._written_stamp = self._file_stamp()
         except Exception as e:
             print(f"erreur lors de la sauvegarde de la config {e}")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Récupère une valeur de configuration.
         
-        Utilise la notation pointée pour accéder aux valeurs imbriquées.
+        Utilise la notation pointée pour accéder aux valeurs imbriquées,
+        résolue par une seule recherche dans l'index à plat.
         
         Args:
             key (str): Clé de configuration (ex: 'game.width')
@@ -137,24 +504,15 @@ class ConfigManager:
             >>> config.get('game.fps')
             60
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        
-        return value
+        value = self._index.get(key)
+        return default if value is None else value
     
     def set(self, key: str, value: Any) -> None:
         """Définit une valeur de configuration.
         
         Utilise la notation pointée pour définir des valeurs imbriquées.
-        Sauvegarde automatiquement la configuration.
+        La valeur est lue immédiatement par ``get`` ; la sauvegarde est
+        faite automatiquement en différé.
         
         Args:
             key (str): Clé de configuration (ex: 'game.fps')
@@ -166,14 +524,21 @@ class ConfigManager:
         """
         keys = key.split('.')
         config = self.config
+        created = []
         
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        
-        config[keys[-1]] = value
-        self._save_config(self.config)
+        with self._config_lock:
+            for i, k in enumerate(keys[:-1]):
+                if k not in config:
+                    config[k] = {}
+                    created.append(('.'.join(keys[:i + 1]), config[k]))
+                config = config[k]
+            
+            old = config.get(keys[-1])
+            config[keys[-1]] = value
+        self._index.update(created)
+        self._reindex(key, old, value)
+        self._schedule_save()
+        self._publish([keys[0]])
     
     def get_all(self) -> Dict[str, Any]:
         """Retourne toute la configuration.
@@ -188,8 +553,11 @@ class ConfigManager:
         
         Écrase la configuration actuelle et sauvegarde.
         """
-        self.config = self.DEFAULT_CONFIG.copy()
-        self._save_config(self.config)
+        with self._config_lock:
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self.invalidate()
+        self._schedule_save()
+        self._publish(list(self.config))
     
     def get_game_settings(self) -> Dict[str, Any]:
         """Retourne les paramètres du jeu.
@@ -245,8 +613,11 @@ class ConfigManager:
         Args:
             settings (dict): Nouveaux paramètres de jeu
         """
-        self.config["game"].update(settings)
-        self._save_config(self.config)
+        with self._config_lock:
+            self.config["game"].update(settings)
+        self.invalidate()
+        self._schedule_save()
+        self._publish(["game"])
     
     def toggle_feature(self, feature: str) -> bool:
         """Bascule l'état d'une fonctionnalité.
@@ -261,12 +632,8 @@ class ConfigManager:
             >>> config.toggle_feature('music_enabled')
             True
         """
-        features = self.config.get("features", {})
-        current_state = features.get(feature, False)
-        new_state = not current_state
-        features[feature] = new_state
-        self.config["features"] = features
-        self._save_config(self.config)
+        new_state = not self.get_features().get(feature, False)
+        self.set(f"features.{feature}", new_state)
         return new_state
     
     def print_config(self) -> None:
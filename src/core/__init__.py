@@ -6,16 +6,33 @@ Ce package contient tous les modules de base pour le fonctionnement du jeu :
 - hand : Gestion des mains de cartes
 - game : Logique du jeu et états
 - player : Gestion du joueur et statistiques
+- simulator : Simulation de parties sans interface graphique
+- montecarlo : Simulation Monte-Carlo multi-processus
+- probability : Probabilités exactes du croupier
+- expected_value : Espérance de gain de chaque action du joueur
+- basic_strategy : Tables précalculées de stratégie de base
+- vectorized : Simulation vectorisée avec NumPy (optionnelle)
+- counting : Comptage des cartes (Hi-Lo, KO, Omega II)
+- persistence : Écritures atomiques et sauvegarde différée
 """
 
-from .card import Card, RANKS, SUITS
+from .card import Card, CARDS, RANKS, SUITS
 from .deck import Deck
 from .hand import Hand
 from .game import Game, GameState, GameResult, PlayerAction
 from .player import Player
+from .simulator import Simulator, SimulationResult
+from .montecarlo import MonteCarloRunner
+from .probability import dealer_probabilities
+from .expected_value import BackgroundActionEVs, action_evs
+from .basic_strategy import BasicStrategy, get_basic_strategy
+from .vectorized import VectorizedSimulator
+from .counting import CardCounter, HI_LO, KO, OMEGA_II
+from .persistence import WriteBehindSaver, atomic_write_json
 
 __all__ = [
     "Card",
+    "CARDS",
     "RANKS",
     "SUITS",
     "Deck",
@@ -25,4 +42,19 @@ __all__ = [
     "GameResult",
     "PlayerAction",
     "Player",
+    "Simulator",
+    "SimulationResult",
+    "MonteCarloRunner",
+    "dealer_probabilities",
+    "action_evs",
+    "BackgroundActionEVs",
+    "BasicStrategy",
+    "get_basic_strategy",
+    "VectorizedSimulator",
+    "CardCounter",
+    "HI_LO",
+    "KO",
+    "OMEGA_II",
+    "WriteBehindSaver",
+    "atomic_write_json",
 ]
@@ -0,0 +1,354 @@
+"""Module des tables de stratégie de base.
+
+Ce module dérive les tables complètes de stratégie de base (mains dures,
+souples et paires) du moteur d'espérance ``core.expected_value``, pour un
+nombre de jeux donné et les règles implémentées par ``Game``.
+
+Les tables tiennent dans un tableau plat de 660 octets : une ligne de
+10 colonnes (une par carte visible du croupier) pour chaque couple
+(type de main, total). L'octet de poids faible code la meilleure action
+quand tout est permis, celui de poids fort la meilleure action entre
+tirer et rester (quand doubler ou abandonner n'est plus possible).
+Une décision se réduit ainsi à une seule lecture indexée.
+
+Générer une table prend de l'ordre d'une seconde : une boucle d'affichage
+demande la table avec ``get_basic_strategy(n, wait=False)``, qui la charge
+ou la génère dans un thread de fond au lieu de bloquer.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional, Set
+
+from .card import CARD_VALUES
+from .expected_value import action_evs
+from .game import Game, PlayerAction
+from .probability import value_index
+
+#: Actions codées dans les tables, dans l'ordre de leur code
+ACTIONS = (PlayerAction.STAND, PlayerAction.HIT, PlayerAction.DOUBLE,
+           PlayerAction.SPLIT, PlayerAction.SURRENDER)
+
+_ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+#: Codes du double et de l'abandon, comparés sans lire les membres de l'Enum
+_DOUBLE = _ACTION_CODES[PlayerAction.DOUBLE]
+_SURRENDER = _ACTION_CODES[PlayerAction.SURRENDER]
+
+#: Types de lignes : mains dures, souples et paires
+HARD, SOFT, PAIR = 0, 1, 2
+
+#: Nombre de lignes par type (totaux 0 à 21, ou index de la carte de la paire)
+ROWS = 22
+
+#: Nombre de colonnes (carte visible du croupier : As, 2 à 9, dix)
+COLUMNS = 10
+
+#: Taille de la table plate
+TABLE_SIZE = 3 * ROWS * COLUMNS
+
+#: En-tête des fichiers de tables (signature puis version du format)
+FILE_MAGIC = b"BJBS\x01"
+
+#: Colonne de la table pour chaque code de carte (carte visible du croupier)
+_CARD_COLUMNS = tuple(value_index(value) for value in CARD_VALUES)
+
+#: Répertoire par défaut des tables générées
+TABLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), "config")
+
+
+def table_index(kind: int, total: int, upcard: int) -> int:
+    """Calcule la position d'une décision dans la table plate.
+
+    Args:
+        kind (int): HARD, SOFT ou PAIR
+        total (int): Total de la main, ou index de composition de la
+            carte de la paire pour PAIR
+        upcard (int): Valeur Blackjack de la carte visible (2-11)
+
+    Returns:
+        int: Index dans la table
+    """
+    return (kind * ROWS + total) * COLUMNS + value_index(upcard)
+
+
+def _shoe(num_decks: int):
+    """Composition d'un sabot complet de num_decks jeux."""
+    return [4 * num_decks] * 9 + [16 * num_decks]
+
+
+def _encode(evs: Dict[PlayerAction, float]) -> int:
+    """Code la meilleure action et le repli tirer/rester sur un octet."""
+    best = max(evs, key=evs.get)
+    fallback = max((PlayerAction.HIT, PlayerAction.STAND),
+                   key=lambda action: evs.get(action, -2.0))
+    return _ACTION_CODES[best] | (_ACTION_CODES[fallback] << 4)
+
+
+def _hand_code(num_decks: int, first: int, second: int, upcard: int,
+               can_split: bool) -> int:
+    """Calcule le code d'une main représentative de deux cartes."""
+    counts = _shoe(num_decks)
+    for value in (first, second, upcard):
+        counts[value_index(value)] -= 1
+    evs = action_evs((first, second), upcard, tuple(counts),
+                     can_double=True, can_split=can_split, can_surrender=True)
+    return _encode(evs)
+
+
+def generate_table(num_decks: int) -> bytearray:
+    """Génère la table de stratégie de base pour un sabot de num_decks jeux.
+
+    Chaque ligne est calculée sur une main représentative de deux cartes
+    (par exemple 10-2 pour un 12 dur) avec la composition d'un sabot
+    complet privé de ces cartes et de la carte du croupier.
+
+    Args:
+        num_decks (int): Nombre de jeux dans le sabot
+
+    Returns:
+        bytearray: Table plate de TABLE_SIZE octets
+    """
+    stand = _ACTION_CODES[PlayerAction.STAND] * 0x11
+    table = bytearray([stand]) * TABLE_SIZE
+    for upcard in range(2, 12):
+        for total in range(4, 21):
+            first = max(2, total - 10)
+            table[table_index(HARD, total, upcard)] = _hand_code(
+                num_decks, first, total - first, upcard, can_split=False)
+        for total in range(12, 21):
+            table[table_index(SOFT, total, upcard)] = _hand_code(
+                num_decks, 11, total - 11 if total > 12 else 11, upcard, can_split=False)
+        for value in range(2, 12):
+            table[table_index(PAIR, value_index(value), upcard)] = _hand_code(
+                num_decks, value, value, upcard, can_split=True)
+    return table
+
+
+class BasicStrategy:
+    """Table de stratégie de base chargée en mémoire.
+
+    Attributes:
+        num_decks (int): Nombre de jeux pour lequel la table a été générée
+        table (bytes): Table plate de TABLE_SIZE octets
+
+    Examples:
+        >>> strategy = get_basic_strategy(6)
+        >>> strategy.lookup(16, False, None, 10)
+        <PlayerAction.SURRENDER: 'surrender'>
+    """
+
+    def __init__(self, num_decks: int, table: bytes):
+        """Initialise la stratégie à partir d'une table déjà calculée.
+
+        Args:
+            num_decks (int): Nombre de jeux du sabot
+            table (bytes): Table plate de TABLE_SIZE octets
+
+        Raises:
+            ValueError: Si la table n'a pas la bonne taille
+        """
+        if len(table) != TABLE_SIZE:
+            raise ValueError(f"table de stratégie invalide ({len(table)} octets)")
+        self.num_decks = num_decks
+        self.table = bytes(table)
+
+    @classmethod
+    def generate(cls, num_decks: int) -> "BasicStrategy":
+        """Génère la stratégie pour un nombre de jeux donné.
+
+        Args:
+            num_decks (int): Nombre de jeux du sabot
+
+        Returns:
+            BasicStrategy: La stratégie calculée
+        """
+        return cls(num_decks, generate_table(num_decks))
+
+    def save(self, filepath: str) -> None:
+        """Sauvegarde la table dans un fichier binaire.
+
+        Args:
+            filepath (str): Chemin du fichier
+        """
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, 'wb') as f:
+            f.write(FILE_MAGIC + bytes([self.num_decks]) + self.table)
+
+    @classmethod
+    def load(cls, filepath: str) -> "BasicStrategy":
+        """Charge une table depuis un fichier binaire.
+
+        Args:
+            filepath (str): Chemin du fichier
+
+        Returns:
+            BasicStrategy: La stratégie chargée
+
+        Raises:
+            ValueError: Si le fichier n'est pas une table valide
+        """
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        header = len(FILE_MAGIC)
+        if data[:header] != FILE_MAGIC:
+            raise ValueError(f"fichier de stratégie invalide : {filepath}")
+        return cls(data[header], data[header + 1:])
+
+    def lookup(self, total: int, soft: bool, pair: Optional[int], upcard: int,
+               can_double: bool = True, can_surrender: bool = True) -> PlayerAction:
+        """Retourne l'action recommandée pour une main.
+
+        Args:
+            total (int): Total de la main du joueur
+            soft (bool): True si la main est souple
+            pair (int, optional): Valeur Blackjack de la carte de la paire
+                si la main peut être splittée, None sinon
+            upcard (int): Valeur Blackjack de la carte visible (2-11)
+            can_double (bool, optional): Le double est possible. Par défaut True.
+            can_surrender (bool, optional): L'abandon est possible. Par défaut True.
+
+        Returns:
+            PlayerAction: L'action recommandée
+        """
+        if total > 21:
+            return PlayerAction.STAND
+        if pair is not None:
+            code = self.table[(PAIR * ROWS + value_index(pair)) * COLUMNS + value_index(upcard)]
+        else:
+            code = self.table[((SOFT if soft else HARD) * ROWS + total) * COLUMNS
+                              + value_index(upcard)]
+        action = ACTIONS[code & 0x0F]
+        if ((action is PlayerAction.DOUBLE and not can_double)
+                or (action is PlayerAction.SURRENDER and not can_surrender)):
+            action = ACTIONS[code >> 4]
+        return action
+
+    def decide(self, game: Game) -> PlayerAction:
+        """Retourne l'action recommandée pour la main en cours d'une partie.
+
+        Args:
+            game (Game): La partie, dans l'état PLAYER_TURN
+
+        Returns:
+            PlayerAction: L'action recommandée, toujours jouable
+        """
+        if game.active_seats:
+            hand = game.seat_hands[game.active_seats[game.current_seat_playing]]
+            pair = hand.cards[0].value() if game.can_split() else None
+            return self.lookup(hand.get_value(), hand.is_soft_hand(), pair,
+                               game.dealer_hand.cards[0].value(),
+                               game.can_double(), game.can_surrender())
+        # Une seule place : même lecture que lookup, avec les conditions de
+        # Game.can_split, can_double et can_surrender, sans appel de méthode
+        hands = game.hands
+        hand = hands[game.current_hand_index]
+        total = hand.get_value()
+        if total > 21:
+            return ACTIONS[0]
+        cards = hand.cards
+        two_cards = len(cards) == 2
+        single = len(hands) == 1
+        column = _CARD_COLUMNS[game.dealer_hand.cards[0].code]
+        row = (SOFT if hand.is_soft_hand() else HARD) * ROWS + total
+        if two_cards and single:
+            first = _CARD_COLUMNS[cards[0].code]
+            if first == _CARD_COLUMNS[cards[1].code]:
+                row = PAIR * ROWS + first
+        code = self.table[row * COLUMNS + column]
+        best = code & 0x0F
+        if ((best == _DOUBLE and not two_cards)
+                or (best == _SURRENDER and not (two_cards and single))):
+            return ACTIONS[code >> 4]
+        return ACTIONS[best]
+
+
+#: Stratégies déjà chargées, par nombre de jeux
+_strategies: Dict[int, BasicStrategy] = {}
+
+#: Chargements en cours dans un thread de fond, par nombre de jeux
+_loading: Dict[int, threading.Thread] = {}
+_loading_lock = threading.Lock()
+
+#: Nombres de jeux dont le chargement en fond a échoué (pas de nouvel essai)
+_failed: Set[int] = set()
+
+
+def get_basic_strategy(num_decks: int, directory: Optional[str] = None,
+                       wait: bool = True) -> Optional[BasicStrategy]:
+    """Retourne la stratégie de base d'un sabot, chargée une seule fois.
+
+    La table est lue depuis ``basic_strategy_<n>d.bin`` si le fichier
+    existe, sinon elle est générée puis sauvegardée pour les lancements
+    suivants.
+
+    Args:
+        num_decks (int): Nombre de jeux du sabot (``game.num_decks``)
+        directory (str, optional): Répertoire des tables. Par défaut,
+            le répertoire ``config`` du projet.
+        wait (bool, optional): Si False, une table pas encore chargée est
+            chargée (ou générée) dans un thread de fond et None est
+            retourné en attendant. Si ce chargement échoue, il n'est pas
+            relancé et None est retourné ensuite. Par défaut True.
+
+    Returns:
+        BasicStrategy: La stratégie correspondante, ou None si ``wait``
+        est False et qu'elle n'est pas encore prête
+    """
+    strategy = _strategies.get(num_decks)
+    if strategy is not None:
+        return strategy
+    if not wait:
+        with _loading_lock:
+            if num_decks not in _loading and num_decks not in _failed:
+                thread = threading.Thread(target=_load_in_background, args=(num_decks, directory),
+                                          name="basic-strategy", daemon=True)
+                _loading[num_decks] = thread
+                thread.start()
+        return None
+
+    filepath = os.path.join(directory or TABLES_DIR, f"basic_strategy_{num_decks}d.bin")
+    strategy = None
+    if os.path.exists(filepath):
+        try:
+            strategy = BasicStrategy.load(filepath)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors du chargement de la stratégie: {e}")
+    if strategy is None or strategy.num_decks != num_decks:
+        strategy = BasicStrategy.generate(num_decks)
+        try:
+            strategy.save(filepath)
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde de la stratégie: {e}")
+    _strategies[num_decks] = strategy
+    return strategy
+
+
+def _load_in_background(num_decks: int, directory: Optional[str]) -> None:
+    """Charge une stratégie depuis le thread de fond de get_basic_strategy."""
+    try:
+        get_basic_strategy(num_decks, directory)
+    except Exception as e:
+        print(f"Erreur lors de la génération de la stratégie: {e}")
+        _failed.add(num_decks)
+    finally:
+        with _loading_lock:
+            _loading.pop(num_decks, None)
+
+
+def basic_strategy(game: Game) -> PlayerAction:
+    """Stratégie de simulation qui suit la table de stratégie de base.
+
+    Args:
+        game (Game): La partie, dans l'état PLAYER_TURN
+
+    Returns:
+        PlayerAction: L'action recommandée
+    """
+    strategy = _strategies.get(game.deck.num_decks)
+    if strategy is None:
+        strategy = get_basic_strategy(game.deck.num_decks)
+    return strategy.decide(game)
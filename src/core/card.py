@@ -2,6 +2,12 @@
 
 Ce module définit la classe Card et les constantes associées pour représenter
 les cartes à jouer dans un jeu de Blackjack.
+
+Chaque carte est identifiée par un petit entier (code 0..51,
+``code = index_famille * 13 + index_valeur``). Des tables précalculées
+donnent la valeur Blackjack, le rang et la famille de chaque code, et les
+52 objets Card sont créés une seule fois puis partagés : un sabot de
+plusieurs jeux ne contient que des références vers ces instances.
 """
 
 from __future__ import annotations
@@ -12,13 +18,65 @@ RANKS = ["A","2","3","4","5","6","7","8","9","10","J","Q","K"]
 #: Liste des quatre familles de cartes (Pique, Cœur, Carreau, Trèfle)
 SUITS = ["♠", "♥", "♦", "♣"]
 
+#: Nombre de cartes distinctes dans un jeu
+NUM_CARDS = len(RANKS) * len(SUITS)
+
+#: Valeur Blackjack de chaque rang, dans l'ordre de RANKS (As = 11)
+RANK_VALUES = (11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+_RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+#: Valeur Blackjack de chaque carte, indexée par son code
+CARD_VALUES = tuple(RANK_VALUES[code % len(RANKS)] for code in range(NUM_CARDS))
+
+#: Rang de chaque carte, indexé par son code
+CARD_RANKS = tuple(RANKS[code % len(RANKS)] for code in range(NUM_CARDS))
+
+#: Famille de chaque carte, indexée par son code
+CARD_SUITS = tuple(SUITS[code // len(RANKS)] for code in range(NUM_CARDS))
+
+
+def card_code(rank: str, suit: str) -> int:
+    """Calcule le code entier d'une carte.
+
+    Args:
+        rank (str): La valeur de la carte, doit être dans RANKS
+        suit (str): La famille de la carte, doit être dans SUITS
+
+    Returns:
+        int: Le code de la carte (0..51)
+
+    Examples:
+        >>> card_code("A", "♠")
+        0
+        >>> card_code("K", "♣")
+        51
+    """
+    return _SUIT_INDEX[suit] * len(RANKS) + _RANK_INDEX[rank]
+
+
+def card_from_code(code: int) -> "Card":
+    """Retourne l'instance partagée de la carte correspondant à un code.
+
+    Args:
+        code (int): Le code de la carte (0..51)
+
+    Returns:
+        Card: La carte correspondante
+    """
+    return CARDS[code]
+
 
 class Card:
     """Représente une carte à jouer.
     
-    Une carte est définie par sa valeur (rank) et sa famille (suit).
+    Une carte est définie par sa valeur (rank) et sa famille (suit),
+    stockées sous la forme d'un code entier unique. ``Card(rank, suit)``
+    retourne toujours la même instance pour une carte donnée.
     
     Attributes:
+        code (int): Le code de la carte (0..51)
         rank (str): La valeur de la carte (A, 2-10, J, Q, K)
         suit (str): La famille de la carte (♠, ♥, ♦, ♣)
     
@@ -28,10 +86,14 @@ class Card:
         A♠
         >>> card.value()
         11
+        >>> card is Card("A", "♠")
+        True
     """
+
+    __slots__ = ("code",)
     
-    def __init__(self, rank: str, suit: str):
-        """Initialise une carte avec sa valeur et sa famille.
+    def __new__(cls, rank: str, suit: str) -> "Card":
+        """Retourne l'instance partagée de la carte demandée.
         
         Args:
             rank (str): La valeur de la carte, doit être dans RANKS
@@ -40,9 +102,18 @@ class Card:
         Raises:
             AssertionError: Si la valeur ou la famille n'est pas valide
         """
-        assert rank in RANKS and suit in SUITS, "carte invalide"
-        self.rank = rank
-        self.suit = suit
+        assert rank in _RANK_INDEX and suit in _SUIT_INDEX, "carte invalide"
+        return CARDS[card_code(rank, suit)]
+
+    @property
+    def rank(self) -> str:
+        """La valeur de la carte (A, 2-10, J, Q, K)."""
+        return CARD_RANKS[self.code]
+
+    @property
+    def suit(self) -> str:
+        """La famille de la carte (♠, ♥, ♦, ♣)."""
+        return CARD_SUITS[self.code]
 
     def value(self) -> int:
         """Calcule la valeur numérique de la carte pour le Blackjack.
@@ -50,6 +121,7 @@ class Card:
         L'As vaut 11 (ajustement à 1 géré par la classe Hand),
         les figures (J, Q, K) valent 10,
         les autres cartes valent leur valeur nominale.
+        La valeur est lue dans la table CARD_VALUES.
         
         Returns:
             int: La valeur numérique de la carte (1-11)
@@ -62,11 +134,15 @@ class Card:
             >>> Card("5", "♦").value()
             5
         """
-        if self.rank == "A":
-            return 11
-        if self.rank in ("J", "Q", "K"):
-            return 10
-        return int(self.rank)
+        return CARD_VALUES[self.code]
+
+    def __reduce__(self):
+        """Sérialise la carte par son code pour conserver le partage des instances.
+
+        Returns:
+            tuple: Fonction de reconstruction et ses arguments
+        """
+        return card_from_code, (self.code,)
 
     def __repr__(self) -> str:
         """Retourne une représentation textuelle de la carte.
@@ -74,4 +150,15 @@ class Card:
         Returns:
             str: La carte au format "RangFamille" (ex: "A♠")
         """
-        return f"{self.rank}{self.suit}"
\ No newline at end of file
+        return f"{self.rank}{self.suit}"
+
+
+def _make_card(code: int) -> Card:
+    """Crée l'instance unique d'une carte sans passer par Card.__new__."""
+    card = object.__new__(Card)
+    card.code = code
+    return card
+
+
+#: Les 52 instances partagées, indexées par code
+CARDS = tuple(_make_card(code) for code in range(NUM_CARDS))
@@ -0,0 +1,246 @@
+"""Module de comptage des cartes.
+
+Ce module définit les systèmes de comptage (Hi-Lo, KO, Omega II) sous
+forme de tables de poids indexées par code de carte, et la classe
+CardCounter qui s'abonne aux tirages d'un Deck pour tenir le compte courant
+(running count) et le compte vrai (true count) en temps constant par carte,
+sans jamais parcourir ``Deck.cards``. Le compte repart du compte de départ
+du système à chaque remélange du sabot.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence
+
+from .card import CARD_RANKS, NUM_CARDS
+from .game import Game
+from .simulator import Betting
+
+
+class CountingSystem:
+    """Système de comptage défini par le poids de chaque rang.
+
+    Attributes:
+        name (str): Nom du système
+        weights (tuple): Poids de chaque carte, indexé par son code
+        balanced (bool): True si la somme des poids d'un jeu est nulle
+        initial_count (int): Compte de départ par jeu du sabot au-delà du
+            premier (systèmes non équilibrés comme KO, voir starting_count)
+
+    Examples:
+        >>> HI_LO.weights[Card("5", "♠").code]
+        1
+    """
+
+    __slots__ = ("name", "weights", "balanced", "initial_count", "_table", "_offset")
+
+    def __init__(self, name: str, rank_weights: Dict[str, int], initial_count: int = 0):
+        """Initialise un système de comptage.
+
+        Args:
+            name (str): Nom du système
+            rank_weights (dict): Poids de chaque rang ("2" à "A")
+            initial_count (int, optional): Compte de départ par jeu au-delà
+                du premier. Par défaut 0.
+        """
+        self.name = name
+        self.weights = tuple(rank_weights[CARD_RANKS[code]] for code in range(NUM_CARDS))
+        self.balanced = sum(self.weights) == 0
+        self.initial_count = initial_count
+        # Poids décalés en octets positifs pour sommer une tranche en C
+        self._offset = -min(self.weights)
+        self._table = bytes(w + self._offset for w in self.weights) + bytes(256 - NUM_CARDS)
+
+    def starting_count(self, num_decks: int) -> int:
+        """Retourne le compte de départ d'un sabot (IRC pour KO).
+
+        Pour KO, le compte de départ vaut 4 - 4 × jeux : 0 pour un jeu,
+        -20 pour six jeux ; un passage complet du sabot finit à +4.
+
+        Args:
+            num_decks (int): Nombre de jeux du sabot
+
+        Returns:
+            int: Compte courant au remélange
+
+        Examples:
+            >>> KO.starting_count(6)
+            -20
+        """
+        return self.initial_count * (num_decks - 1)
+
+    def count(self, codes: bytes) -> int:
+        """Somme les poids d'une suite de codes de cartes.
+
+        Args:
+            codes (bytes): Codes des cartes
+
+        Returns:
+            int: Somme des poids
+        """
+        return sum(codes.translate(self._table)) - self._offset * len(codes)
+
+    def __repr__(self) -> str:
+        """Retourne le nom du système."""
+        return f"CountingSystem({self.name!r})"
+
+
+#: Hi-Lo : 2-6 = +1, 7-9 = 0, 10-A = -1
+HI_LO = CountingSystem("Hi-Lo", {
+    "2": 1, "3": 1, "4": 1, "5": 1, "6": 1, "7": 0, "8": 0, "9": 0,
+    "10": -1, "J": -1, "Q": -1, "K": -1, "A": -1,
+})
+
+#: KO (Knock-Out) : comme Hi-Lo avec le 7 à +1, non équilibré
+KO = CountingSystem("KO", {
+    "2": 1, "3": 1, "4": 1, "5": 1, "6": 1, "7": 1, "8": 0, "9": 0,
+    "10": -1, "J": -1, "Q": -1, "K": -1, "A": -1,
+}, initial_count=-4)
+
+#: Omega II : système à deux niveaux
+OMEGA_II = CountingSystem("Omega II", {
+    "2": 1, "3": 1, "4": 2, "5": 2, "6": 2, "7": 1, "8": 0, "9": -1,
+    "10": -2, "J": -2, "Q": -2, "K": -2, "A": 0,
+})
+
+#: Systèmes disponibles, par nom
+SYSTEMS = {system.name: system for system in (HI_LO, KO, OMEGA_II)}
+
+
+class CardCounter:
+    """Tient le compte des cartes tirées d'un sabot.
+
+    Le compteur s'abonne aux tirages et aux remélanges du Deck : chaque
+    carte tirée ou brûlée met à jour le compte en temps constant.
+    Les cartes sont comptées au tirage, carte cachée du croupier comprise ;
+    un affichage doit donc retirer son poids tant qu'elle n'est pas révélée.
+
+    Attributes:
+        system (CountingSystem): Système de comptage utilisé
+        deck (Deck): Sabot observé (None si détaché)
+        running_count (int): Compte courant
+        cards_seen (int): Nombre de cartes comptées depuis le remélange
+
+    Examples:
+        >>> deck = Deck(num_decks=6)
+        >>> counter = CardCounter(HI_LO, deck)
+        >>> _ = deck.draw(20)
+        >>> counter.cards_seen
+        20
+    """
+
+    def __init__(self, system: CountingSystem = HI_LO, deck=None):
+        """Initialise le compteur et l'abonne éventuellement à un sabot.
+
+        Args:
+            system (CountingSystem, optional): Système de comptage. Par défaut HI_LO.
+            deck (Deck, optional): Sabot à observer.
+        """
+        self.system = system
+        self.deck = None
+        self.running_count = 0
+        self.cards_seen = 0
+        if deck is not None:
+            self.attach(deck)
+
+    def attach(self, deck) -> None:
+        """Abonne le compteur aux tirages et remélanges d'un sabot.
+
+        Le compte repart de zéro (du compte initial pour KO) et les cartes
+        déjà tirées du sabot sont prises en compte.
+
+        Args:
+            deck (Deck): Sabot à observer
+        """
+        self.detach()
+        self.deck = deck
+        deck.add_draw_observer(self.observe)
+        deck.add_reshuffle_listener(self.on_reshuffle)
+        self.on_reshuffle(deck)
+        self.observe(deck.shoe, 0, deck.position)
+
+    def detach(self) -> None:
+        """Désabonne le compteur de son sabot."""
+        if self.deck is not None:
+            self.deck.remove_draw_observer(self.observe)
+            self.deck.remove_reshuffle_listener(self.on_reshuffle)
+            self.deck = None
+
+    def observe(self, shoe, start: int, end: int) -> None:
+        """Compte les cartes ``shoe[start:end]`` qui viennent d'être tirées.
+
+        Args:
+            shoe (array): Codes des cartes du sabot
+            start (int): Index de la première carte tirée
+            end (int): Index suivant la dernière carte tirée
+        """
+        if end - start == 1:
+            self.running_count += self.system.weights[shoe[start]]
+        elif end > start:
+            self.running_count += self.system.count(shoe[start:end].tobytes())
+        self.cards_seen += end - start
+
+    def on_reshuffle(self, deck) -> None:
+        """Remet le compte au compte de départ du système après un remélange.
+
+        Args:
+            deck (Deck): Le sabot remélangé
+        """
+        self.running_count = self.system.starting_count(deck.num_decks)
+        self.cards_seen = 0
+
+    @property
+    def decks_remaining(self) -> float:
+        """Nombre de jeux restant à distribuer (au moins un demi-jeu)."""
+        if self.deck is None:
+            return 1.0
+        return max(len(self.deck) / NUM_CARDS, 0.5)
+
+    @property
+    def true_count(self) -> float:
+        """Compte vrai : compte courant par jeu restant.
+
+        Pour un système non équilibré (KO), le compte courant est utilisé
+        directement, comme le prévoit le système.
+        """
+        if not self.system.balanced:
+            return float(self.running_count)
+        return self.running_count / self.decks_remaining
+
+    def weight(self, card) -> int:
+        """Retourne le poids d'une carte dans le système du compteur.
+
+        Args:
+            card (Card): La carte
+
+        Returns:
+            int: Poids de la carte
+        """
+        return self.system.weights[card.code]
+
+
+def bet_ramp(counter: CardCounter, ramp: Sequence[int], base_bet: int = 1) -> Betting:
+    """Construit une stratégie de mise indexée sur le compte vrai.
+
+    Args:
+        counter (CardCounter): Compteur attaché au sabot de la partie
+        ramp (Sequence[int]): Multiplicateur de mise pour un compte vrai
+            de 0, 1, 2, ... (le dernier vaut pour les comptes supérieurs,
+            le premier pour les comptes négatifs)
+        base_bet (int, optional): Mise unitaire. Par défaut 1.
+
+    Returns:
+        Betting: Fonction de mise utilisable par Simulator
+
+    Examples:
+        >>> sim = Simulator(basic_strategy, num_decks=6)
+        >>> counter = CardCounter(HI_LO, sim.game.deck)
+        >>> sim.betting = bet_ramp(counter, [1, 1, 2, 4, 8])
+    """
+    last = len(ramp) - 1
+
+    def betting(game: Optional[Game] = None) -> int:
+        index = int(counter.true_count)
+        return base_bet * ramp[0 if index < 0 else min(index, last)]
+
+    return betting
@@ -2,107 +2,406 @@
 
 Ce module définit la classe Deck qui représente un sabot de cartes
 pouvant contenir un ou plusieurs jeux de 52 cartes.
+
+Le sabot est stocké sous forme d'un tableau d'octets (``array('B')``) de
+codes de cartes parcouru par un curseur : tirer une carte avance le curseur,
+et le remélange se fait sur place sans nouvelle allocation.
+
+Comme au casino, une carte de coupe est placée à une pénétration donnée :
+quand elle est atteinte, le sabot n'est pas remélangé en pleine manche mais
+entre deux manches (``shuffle_if_needed``). Le sabot suivant est préparé à
+l'avance dans un second tableau, éventuellement dans un thread de fond,
+et le remélange se réduit à un échange de tableaux.
 """
 
 import random
-from .card import Card, RANKS, SUITS
+import threading
+from array import array
+from typing import Callable, List, Optional, Tuple, Union
+
+from .card import Card, CARDS, NUM_CARDS
+
+#: Source aléatoire acceptée par Deck : graine (int ou str) ou générateur
+RandomSource = Union[int, str, random.Random, None]
+
+#: Instantané d'un sabot : (état du générateur, codes des cartes, position,
+#: codes du sabot suivant)
+DeckState = Tuple[tuple, bytes, int, bytes]
+
+#: Fonction appelée après chaque remélange, avec le sabot en argument
+ReshuffleListener = Callable[["Deck"], None]
+
+#: Fonction appelée après chaque tirage avec (shoe, début, fin) : les cartes
+#: tirées sont ``shoe[début:fin]``
+DrawObserver = Callable[[array, int, int], None]
+
+#: Pénétration par défaut : proportion du sabot distribuée avant la carte de coupe
+DEFAULT_PENETRATION = 0.75
+
+
+def make_rng(source: RandomSource = None) -> random.Random:
+    """Construit le générateur dédié d'un sabot.
+
+    Args:
+        source (int | str | random.Random, optional): Graine ou générateur
+            déjà construit (utilisé tel quel). Par défaut, un générateur
+            indépendant initialisé par le système.
+
+    Returns:
+        random.Random: Le générateur à utiliser
+
+    Examples:
+        >>> make_rng(42).random() == make_rng(42).random()
+        True
+    """
+    if isinstance(source, random.Random):
+        return source
+    return random.Random(source)
 
 
 class Deck:
     """Représente un sabot de cartes pour le Blackjack.
-    
+
     Le sabot peut contenir un ou plusieurs jeux de 52 cartes standard.
     Les cartes sont automatiquement mélangées à la création.
-    
+
     Attributes:
         num_decks (int): Le nombre de jeux de 52 cartes dans le sabot
-        cards (List[Card]): Liste des cartes restantes dans le sabot
-        
+        shoe (array): Codes de toutes les cartes du sabot, dans l'ordre de tirage
+        position (int): Index de la prochaine carte à tirer dans ``shoe``
+        rng (random.Random): Générateur aléatoire propre au sabot
+        penetration (float): Proportion du sabot distribuée avant la carte de coupe
+        cut_position (int): Index de la carte de coupe dans ``shoe``
+        background (bool): True si le sabot suivant est préparé dans un thread
+
     Examples:
         >>> deck = Deck(num_decks=1)
-        >>> len(deck.cards)
+        >>> len(deck)
         52
         >>> cards = deck.draw(2)
         >>> len(cards)
         2
+        >>> Deck(rng=7).draw(5) == Deck(rng=7).draw(5)
+        True
     """
-    
-    def __init__(self, num_decks: int = 1):
+
+    def __init__(self, num_decks: int = 1, rng: RandomSource = None,
+                 penetration: float = DEFAULT_PENETRATION, background: bool = False):
         """Initialise un sabot avec le nombre spécifié de jeux.
-        
+
         Les cartes sont automatiquement mélangées après création.
-        
+
         Args:
             num_decks (int, optional): Nombre de jeux de 52 cartes. Par défaut 1.
-            
+            rng (int | str | random.Random, optional): Graine ou générateur
+                dédié au sabot. Par défaut, un générateur indépendant (le
+                générateur global du module random n'est jamais utilisé).
+            penetration (float, optional): Proportion du sabot distribuée
+                avant la carte de coupe (0 = remélange à chaque manche).
+                Par défaut DEFAULT_PENETRATION.
+            background (bool, optional): Prépare le sabot suivant dans un
+                thread de fond plutôt qu'au moment du remélange. Par défaut False.
+
         Examples:
             >>> deck = Deck(num_decks=6)  # Sabot de 6 jeux (casino)
-            >>> len(deck.cards)
+            >>> len(deck)
             312
         """
         self.num_decks = num_decks
-        # Création des cartes en combinant chaque valeur et chaque famille
-        self.cards = [Card(r, s) for _ in range(num_decks) for s in SUITS for r in RANKS]
+        self.rng = make_rng(rng)
+        # Un octet par carte : les codes 0..51 répétés pour chaque jeu
+        self.shoe = array('B', range(NUM_CARDS)) * num_decks
+        self.position = 0
+        self.penetration = penetration
+        self.cut_position = int(len(self.shoe) * penetration)
+        self.background = background
+        self._listeners: List[ReshuffleListener] = []
+        self._observers: List[DrawObserver] = []
+        self._rng_lock = threading.Lock()
+        self._next_shoe = array('B', self.shoe)
+        self._preparing: Optional[threading.Thread] = None
         self.shuffle()
+        self._prepare_next_shoe()
+
+    def __len__(self) -> int:
+        """Retourne le nombre de cartes restantes dans le sabot."""
+        return len(self.shoe) - self.position
+
+    @property
+    def cards(self) -> List[Card]:
+        """Liste des cartes restantes, dans l'ordre de tirage.
+
+        La liste est construite à chaque accès : utiliser ``len(deck)``
+        pour connaître simplement le nombre de cartes restantes.
+        """
+        return [CARDS[code] for code in self.shoe[self.position:]]
 
     def shuffle(self) -> None:
-        """Mélange aléatoirement toutes les cartes du sabot.
-        
-        Utilise l'algorithme de Fisher-Yates via random.shuffle().
+        """Mélange aléatoirement les cartes restantes du sabot.
+
+        Utilise l'algorithme de Fisher-Yates via le shuffle() du générateur,
+        directement sur le tableau (sans copie).
+        """
+        with self._rng_lock:
+            self.rng.shuffle(memoryview(self.shoe)[self.position:])
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """True si la carte de coupe a été atteinte."""
+        return self.position >= self.cut_position
+
+    def add_reshuffle_listener(self, listener: ReshuffleListener) -> None:
+        """Abonne une fonction aux remélanges du sabot.
+
+        Args:
+            listener (ReshuffleListener): Fonction appelée avec le sabot
+                après chaque remélange complet
         """
-        random.shuffle(self.cards)
+        self._listeners.append(listener)
+
+    def remove_reshuffle_listener(self, listener: ReshuffleListener) -> None:
+        """Désabonne une fonction des remélanges du sabot.
+
+        Args:
+            listener (ReshuffleListener): Fonction précédemment abonnée
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def add_draw_observer(self, observer: DrawObserver) -> None:
+        """Abonne une fonction aux tirages du sabot (cartes tirées ou brûlées).
+
+        L'observateur reçoit le tableau des codes et les bornes des cartes
+        tirées, sans création d'objet Card ni copie.
+
+        Args:
+            observer (DrawObserver): Fonction appelée après chaque tirage
+        """
+        self._observers.append(observer)
+
+    def remove_draw_observer(self, observer: DrawObserver) -> None:
+        """Désabonne une fonction des tirages du sabot.
+
+        Args:
+            observer (DrawObserver): Fonction précédemment abonnée
+        """
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def _notify_draw(self, start: int, end: int) -> None:
+        """Prévient les observateurs du tirage de ``shoe[start:end]``."""
+        for observer in self._observers:
+            observer(self.shoe, start, end)
+
+    def _fill_next_shoe(self) -> None:
+        """Mélange le tableau de réserve, qui devient le sabot suivant.
+
+        Le sabot entier est trié selon des clés aléatoires : le tri et le
+        tirage des clés se font en C, deux fois plus vite qu'un
+        ``shuffle()`` dont chaque échange passe par l'interprète.
+        """
+        with self._rng_lock:
+            random = self.rng.random
+            shoe = self._next_shoe
+            shoe[:] = array('B', sorted(shoe, key=lambda _: random()))
+
+    def _prepare_next_shoe(self) -> None:
+        """Lance la préparation du sabot suivant (en fond si demandé)."""
+        if self.background:
+            self._preparing = threading.Thread(target=self._fill_next_shoe, daemon=True)
+            self._preparing.start()
+        else:
+            self._fill_next_shoe()
+
+    def _wait_next_shoe(self) -> None:
+        """Attend la fin de la préparation du sabot suivant."""
+        if self._preparing is not None:
+            self._preparing.join()
+            self._preparing = None
+
+    def _notify_reshuffle(self) -> None:
+        """Prévient les abonnés d'un remélange."""
+        for listener in self._listeners:
+            listener(self)
+
+    def reshuffle(self) -> None:
+        """Remplace le sabot par le sabot suivant, déjà mélangé.
+
+        Le remélange se réduit à un échange de tableaux ; l'ancien sabot
+        devient la réserve et est remélangé pour le coup suivant.
+        """
+        self._wait_next_shoe()
+        self.shoe, self._next_shoe = self._next_shoe, self.shoe
+        self.position = 0
+        self._prepare_next_shoe()
+        self._notify_reshuffle()
+
+    def shuffle_if_needed(self) -> bool:
+        """Remélange le sabot si la carte de coupe a été atteinte.
+
+        À appeler entre deux manches (voir ``Game.reset``).
+
+        Returns:
+            bool: True si le sabot a été remélangé
+
+        Examples:
+            >>> deck = Deck(num_decks=1, penetration=0.5)
+            >>> _ = deck.draw(30)
+            >>> deck.shuffle_if_needed()
+            True
+            >>> len(deck)
+            52
+        """
+        if self.position < self.cut_position:
+            return False
+        self.reshuffle()
+        return True
 
     def draw(self, n: int = 1) -> list[Card]:
         """Tire n cartes du dessus du sabot.
-        
-        Le sabot est automatiquement réinitialisé et mélangé quand il est vide,
-        créant ainsi un paquet infini.
-        
+
+        Si le sabot s'épuise en pleine manche (carte de coupe ignorée),
+        le tirage continue sur le sabot suivant, déjà mélangé.
+
         Args:
             n (int, optional): Nombre de cartes à tirer. Par défaut 1.
-            
+
         Returns:
             List[Card]: Liste des cartes tirées
-            
+
         Examples:
             >>> deck = Deck()
             >>> cards = deck.draw(5)
             >>> len(cards)
             5
-            >>> len(deck.cards)
+            >>> len(deck)
             47
         """
-        drawn = []
-        for _ in range(n):
-            # Si le paquet est vide, on le réinitialise automatiquement
-            if not self.cards:
-                print("🔄 Le paquet est vide, réinitialisation automatique...")
-                self.reset()
-            drawn.append(self.cards.pop())
-        return drawn
+        start = self.position
+        end = start + n
+        if end <= len(self.shoe):
+            self.position = end
+            if self._observers:
+                self._notify_draw(start, end)
+            return [CARDS[code] for code in self.shoe[start:end]]
+        return [self.draw_card() for _ in range(n)]
+
+    def draw_card(self) -> Card:
+        """Tire une seule carte du dessus du sabot.
+
+        Returns:
+            Card: La carte tirée
+        """
+        if self.position >= len(self.shoe):
+            # Sabot épuisé avant la carte de coupe : on passe au sabot suivant
+            self.reshuffle()
+        position = self.position
+        code = self.shoe[position]
+        self.position = position + 1
+        if self._observers:
+            self._notify_draw(position, position + 1)
+        return CARDS[code]
+
+    def draw_many(self, n: int) -> memoryview:
+        """Tire n codes de cartes d'un coup, pour les simulations.
+
+        Le sabot suivant est utilisé s'il reste moins de n cartes.
+        La vue retournée pointe directement dans le sabot : elle n'est
+        valable que jusqu'au prochain mélange.
+
+        Args:
+            n (int): Nombre de cartes à tirer (au plus la taille du sabot)
+
+        Returns:
+            memoryview: Vue sur les codes des cartes tirées (voir CARDS)
+
+        Examples:
+            >>> deck = Deck()
+            >>> codes = deck.draw_many(4)
+            >>> [CARDS[code] for code in codes]  # doctest: +SKIP
+            [7♠, K♥, 2♦, A♣]
+        """
+        if self.position + n > len(self.shoe):
+            self.reshuffle()
+        start = self.position
+        self.position = start + n
+        if self._observers:
+            self._notify_draw(start, start + n)
+        return memoryview(self.shoe)[start:start + n]
 
     def burn(self, n: int = 1) -> None:
         """Brûle (défausse) n cartes du dessus sans les utiliser.
-        
+
         Cette pratique est courante dans les casinos pour éviter la triche.
-        
+
         Args:
             n (int, optional): Nombre de cartes à brûler. Par défaut 1.
-            
+
         Examples:
             >>> deck = Deck()
             >>> deck.burn(3)  # Brûle 3 cartes
-            >>> len(deck.cards)
+            >>> len(deck)
             49
         """
-        for _ in range(n):
-            if self.cards:
-                self.cards.pop()
+        start = self.position
+        self.position = min(start + n, len(self.shoe))
+        if self._observers:
+            self._notify_draw(start, self.position)
+
+    def snapshot(self) -> DeckState:
+        """Capture l'état complet du sabot pour le rejouer plus tard.
+
+        L'instantané contient l'état du générateur, l'ordre des cartes,
+        la position du curseur et le sabot suivant : restaurer l'instantané
+        rejoue exactement les mêmes tirages et les mêmes mélanges.
+
+        Returns:
+            DeckState: Instantané à passer à restore()
+
+        Examples:
+            >>> deck = Deck(rng=1)
+            >>> state = deck.snapshot()
+            >>> first = deck.draw(10)
+            >>> deck.restore(state)
+            >>> deck.draw(10) == first
+            True
+        """
+        self._wait_next_shoe()
+        return self.rng.getstate(), self.shoe.tobytes(), self.position, self._next_shoe.tobytes()
+
+    def restore(self, state: DeckState) -> None:
+        """Restaure un état capturé par snapshot().
+
+        Les abonnés sont prévenus comme après un remélange, puis les cartes
+        déjà tirées de l'instantané sont signalées aux observateurs des
+        tirages : un compteur attaché repart du compte de l'instantané.
+
+        Args:
+            state (DeckState): Instantané d'un sabot du même nombre de jeux
+
+        Raises:
+            ValueError: Si l'instantané ne correspond pas à la taille du sabot
+        """
+        rng_state, codes, position, next_codes = state
+        if len(codes) != len(self.shoe):
+            raise ValueError("instantané incompatible avec ce sabot")
+        self._wait_next_shoe()
+        self.rng.setstate(rng_state)
+        self.shoe = array('B', codes)
+        self._next_shoe = array('B', next_codes)
+        self.position = position
+        self._notify_reshuffle()
+        if self._observers and position:
+            self._notify_draw(0, position)
 
     def reset(self) -> None:
         """Réinitialise le sabot avec un nouveau jeu complet mélangé.
-        
-        Recrée toutes les cartes et les mélange.
-        """
-        self.__init__(self.num_decks)
 
+        Remet toutes les cartes dans le sabot et les mélange sur place,
+        avec le même générateur et sans nouvelle allocation, puis prévient
+        les abonnés comme pour un remélange à la carte de coupe.
+        """
+        self._wait_next_shoe()
+        self.position = 0
+        self.shuffle()
+        self._notify_reshuffle()
@@ -0,0 +1,432 @@
+"""Module de calcul de l'espérance de gain de chaque action du joueur.
+
+Ce module calcule, pour une main du joueur, la carte visible du croupier
+et la composition des cartes non vues, l'espérance (EV, en unités de mise
+initiale) de chaque action : HIT, STAND, DOUBLE, SPLIT et SURRENDER.
+
+Les règles suivent celles de ``Game`` et du règlement de ``main.py`` :
+le croupier reste sur 17 souple et son Blackjack est vérifié avant le tour
+du joueur, le double est permis sur toute main de 2 cartes (y compris après
+un split), un seul split est autorisé, un 21 en 2 cartes après split gagne
+3:2, et l'abandon rend la moitié de la mise.
+
+Les tirages du joueur sont exacts (chaque carte tirée est retirée de la
+composition) et mémorisés dans une table de transposition indexée par
+(total dur, As présent, composition). La composition est un tableau
+modifié sur place pendant la descente, dont les octets servent de clé :
+aucune composition n'est recopiée par tirage. La distribution finale du
+croupier est calculée une fois par décision, sur la composition au moment
+de la décision : c'est ce qui permet de répondre en quelques millisecondes,
+split compris (ses dix sous-arbres partagent la même table). Pour une
+boucle d'affichage, BackgroundActionEVs calcule les décisions encore
+inconnues dans un thread de fond, sans jamais bloquer une image.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from .game import Game, GameState, PlayerAction
+from .probability import (CARD_COMPOSITION_INDEX, FULL_DECK_COMPOSITION,
+                          dealer_distribution, shoe_composition, value_index)
+
+#: Gain d'un 21 en deux cartes après split (payé comme un Blackjack)
+SPLIT_21_PAYOUT = 1.5
+
+
+def _draw_pool(counts: Tuple[int, ...]) -> Tuple[Tuple[int, ...], int]:
+    """Retourne la composition à tirer et son effectif.
+
+    Un sabot vide est remplacé par un jeu complet, comme le fait Deck.
+
+    Args:
+        counts (tuple): Composition des cartes non vues
+
+    Returns:
+        tuple: (composition, nombre de cartes)
+    """
+    remaining = sum(counts)
+    if remaining == 0:
+        return FULL_DECK_COMPOSITION, 52
+    return counts, remaining
+
+
+def _stand_table(distribution: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Calcule l'EV de rester pour chaque total du joueur de 0 à 21.
+
+    Args:
+        distribution (tuple): Distribution du croupier (voir DEALER_OUTCOMES)
+
+    Returns:
+        tuple: EV de rester, indexée par le total du joueur
+    """
+    table = []
+    for total in range(22):
+        win = distribution[5]
+        lose = distribution[6]
+        for k in range(5):
+            dealer_total = 17 + k
+            if total > dealer_total:
+                win += distribution[k]
+            elif total < dealer_total:
+                lose += distribution[k]
+        table.append(win - lose)
+    return tuple(table)
+
+
+class _Solver:
+    """Résout l'arbre des tirages du joueur pour une décision donnée.
+
+    Attributes:
+        stand (tuple): EV de rester par total, pour la distribution du croupier
+        win_probability (tuple): Probabilité de gagner en restant, par total
+        max_ev (float): EV maximale d'une main, toutes suites confondues
+        memo (dict): Table de transposition (total dur, As, composition) -> EV
+    """
+
+    def __init__(self, distribution: Tuple[float, ...]):
+        """Initialise le solveur avec la distribution du croupier.
+
+        Args:
+            distribution (tuple): Distribution du croupier (voir DEALER_OUTCOMES)
+        """
+        self.stand = _stand_table(distribution)
+        self.win_probability = tuple(
+            distribution[5] + sum(distribution[k] for k in range(5) if total > 17 + k)
+            for total in range(22)
+        )
+        self.memo: Dict[Tuple, float] = {}
+        # Aucune suite de tirages ne rapporte plus que le meilleur « rester »
+        self.max_ev = max(self.stand)
+
+    def best(self, hard: int, has_ace: bool, counts: Tuple[int, ...]) -> float:
+        """EV de la meilleure suite entre rester et tirer.
+
+        Args:
+            hard (int): Total dur du joueur (As comptés 1)
+            has_ace (bool): True si la main contient un As
+            counts (tuple): Composition des cartes non vues
+
+        Returns:
+            float: EV optimale depuis cet état
+        """
+        return self._best(hard, has_ace, array('H', counts), sum(counts))
+
+    def hit(self, hard: int, has_ace: bool, counts: Tuple[int, ...]) -> float:
+        """EV de tirer une carte puis de jouer au mieux.
+
+        Args:
+            hard (int): Total dur du joueur (As comptés 1)
+            has_ace (bool): True si la main contient un As
+            counts (tuple): Composition des cartes non vues
+
+        Returns:
+            float: EV de l'action HIT
+        """
+        return self._hit(hard, has_ace, array('H', counts), sum(counts))
+
+    def _best(self, hard: int, has_ace: bool, counts: array, remaining: int) -> float:
+        """Comme best(), sur une composition modifiée sur place.
+
+        Tirer ne rapporte au plus que ``max_ev`` quand la carte ne fait
+        pas dépasser 21, et -1 sinon : si rester fait au moins aussi bien
+        que cette borne, le sous-arbre n'est pas exploré (résultat exact).
+        """
+        total = hard + 10 if has_ace and hard <= 11 else hard
+        stand = self.stand[total]
+        if total == 21:
+            return stand
+        if hard > 11 and remaining:
+            bust = sum(counts[21 - hard:])
+            if stand * remaining >= (remaining - bust) * self.max_ev - bust:
+                return stand
+        hit = self._hit(hard, has_ace, counts, remaining)
+        return hit if hit > stand else stand
+
+    def _hit(self, hard: int, has_ace: bool, counts: array, remaining: int) -> float:
+        """Comme hit(), sur une composition modifiée sur place.
+
+        Chaque carte est retirée de ``counts`` le temps d'explorer son
+        sous-arbre puis remise : le tableau est identique au retour.
+        """
+        key = (hard, has_ace, counts.tobytes())
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+
+        if remaining == 0:
+            # Sabot vide : remplacé par un jeu complet, comme le fait Deck
+            counts, remaining = array('H', FULL_DECK_COMPOSITION), 52
+        # Les valeurs d'index >= limit font dépasser 21
+        limit = 21 - hard if hard > 11 else 10
+        ev = -sum(counts[limit:]) / remaining
+        best = self._best
+        for i in range(limit):
+            count = counts[i]
+            if not count:
+                continue
+            counts[i] = count - 1
+            ev += count / remaining * best(hard + i + 1, has_ace or i == 0, counts, remaining - 1)
+            counts[i] = count
+        self.memo[key] = ev
+        return ev
+
+    def double(self, hard: int, has_ace: bool, counts: Tuple[int, ...]) -> float:
+        """EV de doubler : une seule carte puis rester, mise doublée.
+
+        Args:
+            hard (int): Total dur du joueur (As comptés 1)
+            has_ace (bool): True si la main contient un As
+            counts (tuple): Composition des cartes non vues
+
+        Returns:
+            float: EV de l'action DOUBLE (en unités de mise initiale)
+        """
+        counts, remaining = _draw_pool(counts)
+        ev = 0.0
+        for i, count in enumerate(counts):
+            if not count:
+                continue
+            p = count / remaining
+            new_hard = hard + i + 1
+            if new_hard > 21:
+                ev -= p
+            else:
+                ace = has_ace or i == 0
+                total = new_hard + 10 if ace and new_hard <= 11 else new_hard
+                ev += p * self.stand[total]
+        return 2 * ev
+
+    def split(self, pair_index: int, counts: Tuple[int, ...]) -> float:
+        """EV de splitter une paire (les deux mains sont supposées symétriques).
+
+        Chaque main reçoit une carte puis peut rester, tirer ou doubler ;
+        un 21 en deux cartes gagne SPLIT_21_PAYOUT. Pas de second split.
+
+        Args:
+            pair_index (int): Index de composition de la carte de la paire
+            counts (tuple): Composition des cartes non vues
+
+        Returns:
+            float: EV de l'action SPLIT (deux mises, en unités de mise initiale)
+        """
+        counts, remaining = _draw_pool(counts)
+        hand_ev = 0.0
+        for i, count in enumerate(counts):
+            if not count:
+                continue
+            p = count / remaining
+            hard = pair_index + 1 + i + 1
+            ace = pair_index == 0 or i == 0
+            total = hard + 10 if ace and hard <= 11 else hard
+            sub = counts[:i] + (count - 1,) + counts[i + 1:]
+            if total == 21:
+                # 21 en deux cartes : payé 3:2 s'il gagne, égalité sinon
+                ev = SPLIT_21_PAYOUT * self.win_probability[21]
+            else:
+                ev = max(self.stand[total], self.hit(hard, ace, sub),
+                         self.double(hard, ace, sub))
+            hand_ev += p * ev
+        return 2 * hand_ev
+
+
+@lru_cache(maxsize=4096)
+def _solve(player_values: Tuple[int, ...], upcard: int, composition: Tuple[int, ...],
+           can_double: bool, can_split: bool, can_surrender: bool,
+           peeked: bool) -> Tuple[Tuple[PlayerAction, float], ...]:
+    """Calcule les EV de toutes les actions autorisées (mémorisé).
+
+    Returns:
+        tuple: Couples (action, EV)
+    """
+    solver = _Solver(dealer_distribution(upcard, composition, peeked))
+    hard = sum(1 if v == 11 else v for v in player_values)
+    has_ace = 11 in player_values
+    total = hard + 10 if has_ace and hard <= 11 else hard
+
+    evs = [(PlayerAction.STAND, solver.stand[total] if total <= 21 else -1.0)]
+    if total < 21:
+        evs.append((PlayerAction.HIT, solver.hit(hard, has_ace, composition)))
+    if can_double:
+        evs.append((PlayerAction.DOUBLE, solver.double(hard, has_ace, composition)))
+    if can_split and len(player_values) == 2 and player_values[0] == player_values[1]:
+        evs.append((PlayerAction.SPLIT, solver.split(value_index(player_values[0]), composition)))
+    if can_surrender:
+        evs.append((PlayerAction.SURRENDER, -0.5))
+    return tuple(evs)
+
+
+def action_evs(player_values: Sequence[int], upcard: int, composition: Sequence[int],
+               can_double: bool = True, can_split: bool = True,
+               can_surrender: bool = True, peeked: bool = True) -> Dict[PlayerAction, float]:
+    """Calcule l'espérance de gain de chaque action autorisée.
+
+    Args:
+        player_values (Sequence[int]): Valeurs Blackjack des cartes du joueur
+            (2-10, 11 pour l'As)
+        upcard (int): Valeur Blackjack de la carte visible du croupier
+        composition (Sequence[int]): Composition des cartes non vues
+            (voir ``core.probability``), carte cachée du croupier comprise
+        can_double (bool, optional): Le double est autorisé. Par défaut True.
+        can_split (bool, optional): Le split est autorisé. Par défaut True.
+        can_surrender (bool, optional): L'abandon est autorisé. Par défaut True.
+        peeked (bool, optional): Le Blackjack du croupier a déjà été
+            vérifié. Par défaut True (comme dans Game).
+
+    Returns:
+        dict: EV de chaque action, en unités de mise initiale
+
+    Examples:
+        >>> evs = action_evs([10, 6], 10, (24, 24, 24, 24, 24, 23, 24, 24, 24, 94))
+        >>> max(evs, key=evs.get)
+        <PlayerAction.SURRENDER: 'surrender'>
+    """
+    return dict(_solve(tuple(player_values), upcard, tuple(composition),
+                       can_double, can_split, can_surrender, peeked))
+
+
+def best_action(evs: Dict[PlayerAction, float]) -> PlayerAction:
+    """Retourne l'action de plus grande espérance.
+
+    Args:
+        evs (dict): EV de chaque action (voir action_evs)
+
+    Returns:
+        PlayerAction: L'action optimale
+    """
+    return max(evs, key=evs.get)
+
+
+def game_action_evs(game: Game) -> Dict[PlayerAction, float]:
+    """Calcule l'EV de chaque action pour la main en cours d'une partie.
+
+    Les cartes non vues sont celles du sabot plus la carte cachée du
+    croupier ; les actions autorisées sont celles de ``Game.can_*``.
+
+    Args:
+        game (Game): La partie, dans l'état PLAYER_TURN
+
+    Returns:
+        dict: EV de chaque action autorisée, en unités de mise initiale
+    """
+    return dict(_solve(*_game_query(game)))
+
+
+def _game_query(game: Game) -> Tuple:
+    """Retourne les arguments de _solve pour la main en cours d'une partie."""
+    counts = list(shoe_composition(game.deck))
+    for card in game.dealer_hand.cards[1:]:
+        counts[CARD_COMPOSITION_INDEX[card.code]] += 1
+    if game.active_seats:
+        hand = game.seat_hands[game.active_seats[game.current_seat_playing]]
+    else:
+        hand = game.get_current_hand()
+    return (tuple(card.value() for card in hand.cards),
+            game.dealer_hand.cards[0].value(),
+            tuple(counts),
+            game.can_double(),
+            game.can_split(),
+            game.can_surrender(),
+            game.state == GameState.PLAYER_TURN)
+
+
+class BackgroundActionEVs:
+    """Calcule les EV des décisions dans un thread de fond.
+
+    ``get`` ne calcule jamais dans le thread appelant : il retourne les EV
+    déjà connues de la décision, ou None en demandant leur calcul au
+    thread. Seule la dernière décision demandée est calculée ; les
+    suivantes remplacent une demande qui n'a pas encore commencé.
+
+    Attributes:
+        max_results (int): Nombre de décisions gardées en mémoire
+
+    Examples:
+        >>> evs = BackgroundActionEVs()
+        >>> evs.get(game) is None  # calcul lancé en fond
+        True
+        >>> evs.join()
+        >>> best_action(evs.get(game))
+        <PlayerAction.STAND: 'stand'>
+    """
+
+    def __init__(self, max_results: int = 64):
+        """Initialise le calculateur et démarre son thread.
+
+        Args:
+            max_results (int, optional): Nombre de décisions gardées. Par défaut 64.
+        """
+        self.max_results = max_results
+        self._results: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        self._pending: Optional[Tuple] = None
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="action-evs", daemon=True)
+        self._thread.start()
+
+    def get(self, game: Game) -> Optional[Dict[PlayerAction, float]]:
+        """Retourne les EV de la main en cours si elles sont déjà calculées.
+
+        Args:
+            game (Game): La partie, dans l'état PLAYER_TURN
+
+        Returns:
+            dict: EV de chaque action autorisée, ou None si le calcul est
+            en cours (il est alors lancé en fond)
+        """
+        query = _game_query(game)
+        with self._condition:
+            evs = self._results.get(query)
+            if evs is not None:
+                self._results.move_to_end(query)
+                return dict(evs)
+            self._pending = query
+            self._condition.notify()
+        return None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Attend la fin des calculs demandés.
+
+        Args:
+            timeout (float, optional): Attente maximale en secondes
+
+        Returns:
+            bool: True si plus aucun calcul n'est en attente
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def _run(self) -> None:
+        """Boucle du thread : calcule la dernière décision demandée."""
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                query, self._pending = self._pending, None
+                self._busy = True
+            evs = _solve(*query)
+            with self._condition:
+                self._results[query] = evs
+                while len(self._results) > self.max_results:
+                    self._results.popitem(last=False)
+                self._busy = False
+                self._condition.notify_all()
+
+
+def optimal_strategy(game: Game) -> PlayerAction:
+    """Stratégie de simulation qui joue l'action de plus grande EV.
+
+    Utilisable directement comme stratégie d'un Simulator ou d'un
+    MonteCarloRunner.
+
+    Args:
+        game (Game): La partie, dans l'état PLAYER_TURN
+
+    Returns:
+        PlayerAction: L'action optimale pour la main en cours
+    """
+    return best_action(game_action_evs(game))
@@ -5,7 +5,7 @@ les états du jeu, les actions possibles et la gestion des parties.
 """
 
 from enum import Enum
-from .deck import Deck
+from .deck import DEFAULT_PENETRATION, Deck, RandomSource
 from .hand import Hand
 
 
@@ -61,11 +61,24 @@ class PlayerAction(Enum):
         STAND (str): S'arrêter et garder sa main actuelle
         DOUBLE (str): Doubler la mise et tirer exactement 1 carte
         SPLIT (str): Diviser une paire en deux mains séparées
+        SURRENDER (str): Abandonner la main et récupérer 50% de la mise
     """
     HIT = "hit"
     STAND = "stand"
     DOUBLE = "double"
     SPLIT = "split"
+    SURRENDER = "surrender"
+
+
+# Membres lus à chaque manche par les méthodes du tour de jeu. En CPython
+# 3.11, lire un membre par sa classe Enum (GameState.PLAYER_TURN) passe par
+# un descripteur, une dizaine de fois plus lent qu'un nom de module.
+_PLAYER_TURN = GameState.PLAYER_TURN
+_DEALER_REVEAL = GameState.DEALER_REVEAL
+_RESULT_SCREEN = GameState.RESULT_SCREEN
+_PLAYER_WIN = GameResult.PLAYER_WIN
+_DEALER_WIN = GameResult.DEALER_WIN
+_PUSH = GameResult.PUSH
 
 
 class Game:
@@ -106,14 +119,22 @@ class Game:
         <GameState.PLAYER_TURN: 'player_turn'>
     """
     
-    def __init__(self, num_decks: int = 1):
+    def __init__(self, num_decks: int = 1, rng: RandomSource = None,
+                 penetration: float = DEFAULT_PENETRATION, background_shuffle: bool = False):
         """Initialise une nouvelle partie de Blackjack.
         
         Args:
             num_decks (int, optional): Nombre de jeux de 52 cartes dans le sabot.
                 Par défaut 1. Les casinos utilisent généralement 6 à 8 jeux.
+            rng (int | str | random.Random, optional): Graine ou générateur
+                transmis au sabot, pour rejouer une partie à l'identique.
+                Par défaut, un générateur indépendant.
+            penetration (float, optional): Position de la carte de coupe,
+                en proportion du sabot. Par défaut DEFAULT_PENETRATION.
+            background_shuffle (bool, optional): Prépare le sabot suivant
+                dans un thread de fond. Par défaut False.
         """
-        self.deck = Deck(num_decks)
+        self.deck = Deck(num_decks, rng, penetration, background_shuffle)
         
         # Système de mains multiples pour le split
         self.hands = [Hand()]
@@ -151,20 +172,30 @@ class Game:
         """Réinitialise l'état du jeu pour une nouvelle partie.
         
         Vide toutes les mains, réinitialise les mises et les résultats,
-        mais conserve le sabot et la configuration.
+        mais conserve le sabot et la configuration. Si la carte de coupe
+        a été atteinte pendant la manche précédente, le sabot est remélangé
+        ici, entre deux manches. Sans split, la main du joueur est vidée et
+        réutilisée plutôt que recréée.
         """
-        self.hands = [Hand()]
-        self.hand_bets = [0]
-        self.hand_results = [None]
+        self.deck.shuffle_if_needed()
+        if len(self.hands) == 1:
+            self.hands[0].clear()
+            self.hand_bets[0] = 0
+            self.hand_results[0] = None
+        else:
+            self.hands = [Hand()]
+            self.hand_bets = [0]
+            self.hand_results = [None]
         self.current_hand_index = 0
         self.dealer_hand.clear()
         self.result = None
         self.frame_counter = 0
         self.player_action = None
         self.last_action_time = 0
-        self.seat_hands = {}
-        self.seat_results = {}
-        self.active_seats = []
+        if self.active_seats or self.seat_hands:
+            self.seat_hands = {}
+            self.seat_results = {}
+            self.active_seats = []
         self.current_seat_playing = 0
         self.insurance_bet = 0
         self.has_insurance = False
@@ -181,14 +212,14 @@ class Game:
     
     def can_double(self) -> bool:
         """Retourne True si le joueur peut doubler (seulement avec 2 cartes initiales)."""
-        if self.state != GameState.PLAYER_TURN:
+        if self.state is not _PLAYER_TURN:
             return False
         current_hand = self.hands[self.current_hand_index]
         return len(current_hand.cards) == 2
     
     def can_split(self) -> bool:
         """Retourne True si le joueur peut splitter (2 cartes de même valeur, pas encore de split)."""
-        if self.state != GameState.PLAYER_TURN:
+        if self.state is not _PLAYER_TURN:
             return False
         # On ne peut splitter que s'il n'y a qu'une seule main (pas de split déjà effectué)
         if len(self.hands) > 1:
@@ -250,7 +281,7 @@ class Game:
     
     def can_surrender(self) -> bool:
         """Retourne True si le joueur peut abandonner (seulement au début du tour)."""
-        if self.state != GameState.PLAYER_TURN:
+        if self.state is not _PLAYER_TURN:
             return False
         # On peut abandonner seulement avec 2 cartes et pas de split
         current_hand = self.hands[self.current_hand_index]
@@ -279,14 +310,14 @@ class Game:
     
     def player_hit(self) -> None:
         """Le joueur tire une carte."""
-        if not self.can_hit():
+        if self.state is not _PLAYER_TURN:
             return
         
         # Multi-seat: utiliser la place active actuelle
         if self.active_seats:
             seat_idx = self.active_seats[self.current_seat_playing]
             current_hand = self.seat_hands[seat_idx]
-            current_hand.add_cards(self.deck.draw(1))
+            current_hand.add_card(self.deck.draw_card())
             self.last_action_time = self.frame_counter
             
             # Vérifier si la main a bust
@@ -297,21 +328,21 @@ class Game:
         else:
             # Fallback pour le mode single-seat
             current_hand = self.hands[self.current_hand_index]
-            current_hand.add_cards(self.deck.draw(1))
+            current_hand.add_card(self.deck.draw_card())
             self.last_action_time = self.frame_counter
             
             # Vérifier si la main a bust
             if current_hand.is_bust():
-                self.hand_results[self.current_hand_index] = GameResult.DEALER_WIN
+                self.hand_results[self.current_hand_index] = _DEALER_WIN
                 # Passer à la main suivante ou terminer
                 if not self.switch_to_next_hand():
                     # Toutes les mains ont été jouées
-                    self.state = GameState.DEALER_REVEAL
+                    self.state = _DEALER_REVEAL
 
     
     def player_stand(self) -> None:
         """Le joueur s'arrête et passe à la main suivante ou au croupier."""
-        if not self.can_stand():
+        if self.state is not _PLAYER_TURN:
             return
         
         # Multi-seat: passer à la place suivante
@@ -322,7 +353,7 @@ class Game:
             # Passer à la main suivante ou au croupier
             if not self.switch_to_next_hand():
                 # Toutes les mains ont été jouées, le croupier joue
-                self.state = GameState.DEALER_REVEAL
+                self.state = _DEALER_REVEAL
         
         self.last_action_time = self.frame_counter
     
@@ -335,15 +366,15 @@ class Game:
         self.hand_bets[self.current_hand_index] *= 2
         
         current_hand = self.hands[self.current_hand_index]
-        current_hand.add_cards(self.deck.draw(1))
+        current_hand.add_card(self.deck.draw_card())
         self.last_action_time = self.frame_counter
         
         if current_hand.is_bust():
-            self.hand_results[self.current_hand_index] = GameResult.DEALER_WIN
+            self.hand_results[self.current_hand_index] = _DEALER_WIN
         
         # Après un double, on passe automatiquement à la main suivante ou au croupier
         if not self.switch_to_next_hand():
-            self.state = GameState.DEALER_REVEAL
+            self.state = _DEALER_REVEAL
     
     def player_split(self) -> None:
         """Le joueur divise sa main (si possible)."""
@@ -352,11 +383,11 @@ class Game:
         
         # Créer une deuxième main avec la deuxième carte
         original_hand = self.hands[0]
-        second_card = original_hand.cards.pop()
+        second_card = original_hand.pop_card()
         
         # Créer la nouvelle main
         new_hand = Hand()
-        new_hand.add_cards([second_card])
+        new_hand.add_card(second_card)
         self.hands.append(new_hand)
         
         # Dupliquer la mise pour la nouvelle main
@@ -364,8 +395,8 @@ class Game:
         self.hand_results.append(None)
         
         # Donner une nouvelle carte à chaque main
-        self.hands[0].add_cards(self.deck.draw(1))
-        self.hands[1].add_cards(self.deck.draw(1))
+        self.hands[0].add_card(self.deck.draw_card())
+        self.hands[1].add_card(self.deck.draw_card())
         
         # Jouer la première main
         self.current_hand_index = 0
@@ -400,8 +431,10 @@ class Game:
     
     def dealer_play(self) -> None:
         """Le croupier joue selon la règle fixe : tire si < 17, s'arrête sinon."""
-        while self.dealer_hand.get_value() < 17:
-            self.dealer_hand.add_cards(self.deck.draw(1))
+        dealer_hand = self.dealer_hand
+        draw_card = self.deck.draw_card
+        while dealer_hand.get_value() < 17:
+            dealer_hand.add_card(draw_card())
         
         # Comparer et déterminer le gagnant
         self._determine_winner()
@@ -464,16 +497,17 @@ class Game:
         else:
             # Une seule main (fallback)
             player_value = self.hands[0].get_value()
-            if dealer_bust:
-                self.result = GameResult.PLAYER_WIN
-            elif player_value > 21:
-                self.result = GameResult.DEALER_WIN
+            if player_value > 21:
+                # Le joueur a bust : perdu même si le croupier bust aussi
+                self.result = _DEALER_WIN
+            elif dealer_bust:
+                self.result = _PLAYER_WIN
             elif player_value > dealer_value:
-                self.result = GameResult.PLAYER_WIN
+                self.result = _PLAYER_WIN
             elif dealer_value > player_value:
-                self.result = GameResult.DEALER_WIN
+                self.result = _DEALER_WIN
             else:
-                self.result = GameResult.PUSH
+                self.result = _PUSH
             self.hand_results[0] = self.result
         
         # Gérer l'assurance
@@ -481,7 +515,7 @@ class Game:
             # Le joueur gagne l'assurance (paiement 2:1)
             pass  # Sera géré dans le calcul des gains
         
-        self.state = GameState.RESULT_SCREEN
+        self.state = _RESULT_SCREEN
     
     def deal_initial_cards(self) -> None:
         """Distribue les 2 cartes initiales au joueur et au croupier."""
@@ -489,33 +523,33 @@ class Game:
         self.hand_bets[0] = self.player_bet
         
         # Donner 1 carte au joueur, 1 au croupier, puis 1 au joueur, 1 au croupier
-        self.hands[0].add_cards(self.deck.draw(1))
-        self.dealer_hand.add_cards(self.deck.draw(1))
-        self.hands[0].add_cards(self.deck.draw(1))
-        self.dealer_hand.add_cards(self.deck.draw(1))
+        # (les quatre cartes sont tirées d'un coup, dans l'ordre de distribution)
+        first, second, third, fourth = self.deck.draw(4)
+        self.hands[0].add_cards((first, third))
+        self.dealer_hand.add_cards((second, fourth))
         
-        # Vérifier les blackjacks initiaux
-        player_bj = self.hands[0].is_blackjack()
-        dealer_bj = self.dealer_hand.is_blackjack()
+        # Vérifier les blackjacks initiaux (deux cartes : 21 est un Blackjack)
+        player_bj = self.hands[0].get_value() == 21
+        dealer_bj = self.dealer_hand.get_value() == 21
         
         if player_bj and dealer_bj:
             # Les deux ont un blackjack = égalité
-            self.result = GameResult.PUSH
-            self.hand_results[0] = GameResult.PUSH
-            self.state = GameState.RESULT_SCREEN
+            self.result = _PUSH
+            self.hand_results[0] = _PUSH
+            self.state = _RESULT_SCREEN
         elif player_bj:
             # Joueur a un blackjack, gagne
-            self.result = GameResult.PLAYER_WIN
-            self.hand_results[0] = GameResult.PLAYER_WIN
-            self.state = GameState.RESULT_SCREEN
+            self.result = _PLAYER_WIN
+            self.hand_results[0] = _PLAYER_WIN
+            self.state = _RESULT_SCREEN
         elif dealer_bj:
             # Croupier a un blackjack, gagne
-            self.result = GameResult.DEALER_WIN
-            self.hand_results[0] = GameResult.DEALER_WIN
-            self.state = GameState.RESULT_SCREEN
+            self.result = _DEALER_WIN
+            self.hand_results[0] = _DEALER_WIN
+            self.state = _RESULT_SCREEN
         else:
             # Pas de blackjack, le joueur commence
-            self.state = GameState.PLAYER_TURN
+            self.state = _PLAYER_TURN
 
     def deal_initial_cards_multiseat(self) -> None:
         """Distribue les 2 cartes initiales à toutes les places actives et au croupier."""
@@ -532,14 +566,14 @@ class Game:
         
         # Distribution alternée: 1 carte à chaque place, puis 1 au croupier, puis 2ème carte à chaque place, puis 2ème au croupier
         for seat_idx in self.active_seats:
-            self.seat_hands[seat_idx].add_cards(self.deck.draw(1))
+            self.seat_hands[seat_idx].add_card(self.deck.draw_card())
         
-        self.dealer_hand.add_cards(self.deck.draw(1))
+        self.dealer_hand.add_card(self.deck.draw_card())
         
         for seat_idx in self.active_seats:
-            self.seat_hands[seat_idx].add_cards(self.deck.draw(1))
+            self.seat_hands[seat_idx].add_card(self.deck.draw_card())
         
-        self.dealer_hand.add_cards(self.deck.draw(1))
+        self.dealer_hand.add_card(self.deck.draw_card())
         
         # Vérifier les blackjacks
         dealer_bj = self.dealer_hand.is_blackjack()
@@ -5,14 +5,18 @@ pour le joueur ou le croupier dans un jeu de Blackjack.
 """
 
 from typing import List
-from .card import Card
+from .card import Card, CARD_VALUES
 
 
 class Hand:
     """Représente une main de cartes au Blackjack.
     
     Une main contient une liste de cartes et gère automatiquement
-    le calcul de la valeur totale en tenant compte des As.
+    le calcul de la valeur totale en tenant compte des As. Le total
+    « dur » (As comptés 1) et le nombre d'As sont tenus à jour à chaque
+    ajout ou retrait de carte, si bien que toutes les requêtes sont en O(1).
+    La liste ``cards`` ne doit donc être modifiée qu'à travers les méthodes
+    de la main.
     
     Attributes:
         cards (List[Card]): Liste des cartes dans la main
@@ -34,6 +38,9 @@ class Hand:
         """
         self.cards: List[Card] = []
         self.seat_index = seat_index
+        # Total avec tous les As comptés 1, et nombre d'As
+        self._hard_total = 0
+        self._aces = 0
     
     def add_card(self, card: Card) -> None:
         """Ajoute une carte à la main.
@@ -42,6 +49,12 @@ class Hand:
             card (Card): La carte à ajouter
         """
         self.cards.append(card)
+        value = CARD_VALUES[card.code]
+        if value == 11:
+            self._aces += 1
+            self._hard_total += 1
+        else:
+            self._hard_total += value
     
     def add_cards(self, cards: List[Card]) -> None:
         """Ajoute plusieurs cartes à la main.
@@ -49,7 +62,31 @@ class Hand:
         Args:
             cards (List[Card]): Liste des cartes à ajouter
         """
-        self.cards.extend(cards)
+        # Même mise à jour que add_card, sans un appel de méthode par carte
+        append = self.cards.append
+        for card in cards:
+            append(card)
+            value = CARD_VALUES[card.code]
+            if value == 11:
+                self._aces += 1
+                self._hard_total += 1
+            else:
+                self._hard_total += value
+    
+    def pop_card(self) -> Card:
+        """Retire et retourne la dernière carte de la main (utilisé pour le split).
+        
+        Returns:
+            Card: La carte retirée
+        """
+        card = self.cards.pop()
+        value = CARD_VALUES[card.code]
+        if value == 11:
+            self._aces -= 1
+            self._hard_total -= 1
+        else:
+            self._hard_total -= value
+        return card
     
     def get_value(self) -> int:
         """Calcule la valeur totale de la main au Blackjack.
@@ -69,23 +106,10 @@ class Hand:
             >>> hand.get_value()  # L'As vaut maintenant 1
             15
         """
-        total = 0
-        num_aces = 0
-        
-        # Compte la valeur basique et les As
-        for card in self.cards:
-            if card.rank == "A":
-                num_aces += 1
-                total += 11  # On suppose d'abord que l'As vaut 11
-            else:
-                total += card.value()
-        
-        # Ajuste les As si nécessaire
-        while total > 21 and num_aces > 0:
-            total -= 10  # Redéfinir un As de 11 à 1
-            num_aces -= 1
-        
-        return total
+        # Un seul As peut valoir 11 sans dépasser 21
+        if self._aces and self._hard_total <= 11:
+            return self._hard_total + 10
+        return self._hard_total
     
     def is_blackjack(self) -> bool:
         """Vérifie si la main est un Blackjack naturel.
@@ -103,7 +127,7 @@ class Hand:
         Returns:
             bool: True si la valeur dépasse 21, False sinon
         """
-        return self.get_value() > 21
+        return self._hard_total > 21
     
     def is_soft_hand(self) -> bool:
         """Vérifie si la main est une main souple.
@@ -119,25 +143,13 @@ class Hand:
             >>> hand.is_soft_hand()  # As vaut 11, total = 17
             True
         """
-        total = 0
-        has_ace_as_11 = False
-        
-        for card in self.cards:
-            if card.rank == "A":
-                total += 11
-                has_ace_as_11 = True
-            else:
-                total += card.value()
-        
-        while total > 21 and has_ace_as_11:
-            total -= 10
-            has_ace_as_11 = False
-        
-        return has_ace_as_11
+        return self._aces > 0 and self._hard_total <= 11
     
     def clear(self) -> None:
         """Vide la main de toutes ses cartes."""
         self.cards.clear()
+        self._hard_total = 0
+        self._aces = 0
     
     def __repr__(self) -> str:
         """Retourne une représentation textuelle de la main.
@@ -0,0 +1,153 @@
+"""Module de simulation Monte-Carlo multi-processus.
+
+Ce module répartit une série de manches sur plusieurs processus. Chaque
+tranche de manches est jouée par un Simulator doté de son propre générateur
+``random.Random``, dérivé de la graine principale : les tirages sont
+indépendants d'un processus à l'autre et la série complète est
+reproductible à graine égale. Les résultats partiels sont ensuite fusionnés.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .deck import DEFAULT_PENETRATION
+from .simulator import SimulationResult, Simulator, Strategy
+
+
+def derive_seed(seed: int, index: int) -> str:
+    """Dérive la graine du flux aléatoire d'une tranche.
+
+    Une graine de type ``str`` est hachée (SHA-512) par ``random.Random``,
+    ce qui donne des flux décorrélés et identiques d'un processus à l'autre.
+
+    Args:
+        seed (int): Graine principale de la simulation
+        index (int): Index de la tranche
+
+    Returns:
+        str: Graine propre à la tranche
+    """
+    return f"{seed}:{index}"
+
+
+def split_rounds(num_rounds: int, chunks: int) -> List[int]:
+    """Répartit un nombre de manches en tranches de tailles équilibrées.
+
+    Args:
+        num_rounds (int): Nombre total de manches
+        chunks (int): Nombre de tranches
+
+    Returns:
+        List[int]: Taille de chaque tranche (la somme vaut num_rounds)
+
+    Examples:
+        >>> split_rounds(10, 3)
+        [4, 3, 3]
+    """
+    base, extra = divmod(num_rounds, chunks)
+    return [base + (1 if i < extra else 0) for i in range(chunks)]
+
+
+def _run_chunk(task: Tuple) -> SimulationResult:
+    """Joue une tranche de manches dans un processus de travail.
+
+    Args:
+        task (tuple): (manches, graine, stratégie, jeux, mise, gain Blackjack,
+            pénétration)
+
+    Returns:
+        SimulationResult: Résultat partiel de la tranche
+    """
+    num_rounds, seed, strategy, num_decks, bet, blackjack_payout, penetration = task
+    simulator = Simulator(strategy, num_decks, bet, blackjack_payout, penetration, rng=seed)
+    return simulator.run(num_rounds)
+
+
+class MonteCarloRunner:
+    """Répartit une simulation de Blackjack sur plusieurs processus.
+
+    La stratégie doit être une fonction définie au niveau d'un module
+    (sérialisable par pickle) pour être transmise aux processus.
+
+    Attributes:
+        strategy (Strategy): Stratégie du joueur (None = imite le croupier)
+        num_decks (int): Nombre de jeux dans le sabot
+        bet (int): Mise de chaque manche
+        blackjack_payout (float): Multiplicateur de gain d'un Blackjack
+        penetration (float): Position de la carte de coupe dans le sabot
+        workers (int): Nombre de processus de travail
+        seed (int): Graine principale (tirée au hasard si non fournie)
+
+    Examples:
+        >>> runner = MonteCarloRunner(num_decks=6, workers=4, seed=42)
+        >>> result = runner.run(1000000)
+        >>> result.rounds
+        1000000
+    """
+
+    def __init__(self, strategy: Optional[Strategy] = None, num_decks: int = 1,
+                 bet: int = 1, blackjack_payout: float = 1.5,
+                 penetration: float = DEFAULT_PENETRATION,
+                 workers: Optional[int] = None, seed: Optional[int] = None):
+        """Initialise le répartiteur.
+
+        Args:
+            strategy (Strategy, optional): Stratégie du joueur.
+            num_decks (int, optional): Nombre de jeux dans le sabot. Par défaut 1.
+            bet (int, optional): Mise de chaque manche. Par défaut 1.
+            blackjack_payout (float, optional): Gain d'un Blackjack. Par défaut 1.5.
+            penetration (float, optional): Position de la carte de coupe.
+                Par défaut DEFAULT_PENETRATION.
+            workers (int, optional): Nombre de processus. Par défaut, le
+                nombre de cœurs disponibles.
+            seed (int, optional): Graine principale. Par défaut, tirée au
+                hasard puis conservée dans ``seed`` pour rejouer la série.
+        """
+        self.strategy = strategy
+        self.num_decks = num_decks
+        self.bet = bet
+        self.blackjack_payout = blackjack_payout
+        self.penetration = penetration
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+
+    def run(self, num_rounds: int, chunks: Optional[int] = None) -> SimulationResult:
+        """Joue num_rounds manches réparties sur les processus.
+
+        Le résultat ne dépend que de la graine, du nombre de manches et du
+        nombre de tranches, pas de l'ordre d'exécution des processus.
+
+        Args:
+            num_rounds (int): Nombre total de manches
+            chunks (int, optional): Nombre de tranches (une graine par
+                tranche). Par défaut, une tranche par processus.
+
+        Returns:
+            SimulationResult: Résultats fusionnés ; ``elapsed`` est le temps
+                réel écoulé, pas la somme des temps des processus
+        """
+        chunks = chunks or self.workers
+        tasks = [
+            (size, derive_seed(self.seed, i), self.strategy,
+             self.num_decks, self.bet, self.blackjack_payout, self.penetration)
+            for i, size in enumerate(split_rounds(num_rounds, chunks))
+            if size > 0
+        ]
+
+        start = time.perf_counter()
+        if self.workers == 1 or len(tasks) == 1:
+            partials = [_run_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                partials = list(pool.map(_run_chunk, tasks))
+
+        result = SimulationResult()
+        for partial in partials:
+            result.merge(partial)
+        result.elapsed = time.perf_counter() - start
+        return result
@@ -0,0 +1,278 @@
+"""Module de persistance des données du jeu.
+
+Ce module fournit l'écriture durable des fichiers (fichier temporaire dans
+le même répertoire, fsync, puis renommage : un fichier n'est jamais lu à
+moitié écrit, même après un arrêt brutal), avec des copies de secours
+tournantes et un chargement qui se replie sur la dernière copie lisible,
+ainsi que WriteBehindSaver, qui sort les sauvegardes de la boucle
+d'affichage : les demandes successives sont fusionnées (seul le dernier état
+est écrit) et écrites par un thread de fond au plus une fois par intervalle,
+ou une fois le calme revenu (anti-rebond), avec une dernière écriture
+garantie à la fermeture.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import IO, Any, Callable, Optional
+
+#: Intervalle minimal par défaut entre deux écritures, en secondes
+DEFAULT_INTERVAL = 0.5
+
+#: Nombre de copies de secours gardées pour les sauvegardes du jeu
+DEFAULT_BACKUPS = 1
+
+_PENDING_NONE = object()
+
+
+def backup_path(filepath: str, number: int) -> str:
+    """Retourne le chemin de la n-ième copie de secours d'un fichier (1 = la plus récente)."""
+    return f"{filepath}.bak{number}"
+
+
+def _fsync_directory(directory: str) -> None:
+    """Rend durable un renommage dans un répertoire (sans effet hors POSIX)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _rotate_backups(filepath: str, backups: int) -> None:
+    """Décale les copies de secours et copie le fichier actuel en première position."""
+    if not os.path.exists(filepath):
+        return
+    for number in range(backups - 1, 0, -1):
+        if os.path.exists(backup_path(filepath, number)):
+            os.replace(backup_path(filepath, number), backup_path(filepath, number + 1))
+    first = backup_path(filepath, 1)
+    if os.path.exists(first):
+        os.remove(first)
+    # Un lien dur évite de recopier le fichier ; le fichier cible reste en place
+    try:
+        os.link(filepath, first)
+    except OSError:
+        shutil.copy2(filepath, first)
+
+
+def atomic_write(filepath: str, write: Callable[[IO[str]], None], backups: int = 0,
+                 durable: bool = True) -> None:
+    """Remplace un fichier texte atomiquement et durablement.
+
+    Le contenu est écrit par ``write`` dans un fichier temporaire du même
+    répertoire, synchronisé sur le disque (fsync), puis renommé sur le
+    fichier cible : en cas d'interruption, l'ancien fichier reste intact.
+
+    Args:
+        filepath (str): Chemin du fichier
+        write (Callable): Fonction qui écrit le contenu dans le fichier ouvert
+        backups (int, optional): Nombre de copies de secours tournantes
+            (``<fichier>.bak1`` la plus récente). Par défaut 0.
+        durable (bool, optional): Synchronise le fichier et le répertoire
+            sur le disque. Par défaut True.
+
+    Raises:
+        OSError: Si l'écriture ou le renommage échoue
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-",
+                                     suffix=os.path.basename(filepath))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            write(f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        if backups > 0:
+            _rotate_backups(filepath, backups)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_directory(directory)
+
+
+def atomic_write_json(filepath: str, data: Any, indent: Optional[int] = 2,
+                      backups: int = 0, durable: bool = True) -> None:
+    """Écrit des données JSON en remplaçant le fichier atomiquement.
+
+    Args:
+        filepath (str): Chemin du fichier
+        data: Données sérialisables en JSON
+        indent (int, optional): Indentation du JSON. Par défaut 2.
+        backups (int, optional): Nombre de copies de secours tournantes. Par défaut 0.
+        durable (bool, optional): Synchronise sur le disque (fsync). Par défaut True.
+
+    Raises:
+        OSError: Si l'écriture ou le renommage échoue
+    """
+    atomic_write(filepath, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False),
+                 backups=backups, durable=durable)
+
+
+def load_json(filepath: str) -> Optional[Any]:
+    """Charge un fichier JSON en se repliant sur ses copies de secours.
+
+    Si le fichier est absent ou illisible (par exemple tronqué par un
+    arrêt brutal), les copies ``<fichier>.bak1``, ``.bak2``, ... sont
+    essayées dans l'ordre, de la plus récente à la plus ancienne.
+
+    Args:
+        filepath (str): Chemin du fichier
+
+    Returns:
+        Les données de la première copie lisible, ou None si aucune ne l'est
+
+    Examples:
+        >>> atomic_write_json("player_stats.json", {"balance": 1000}, backups=1)
+        >>> load_json("player_stats.json")
+        {'balance': 1000}
+    """
+    candidates = [filepath]
+    number = 1
+    while os.path.exists(backup_path(filepath, number)):
+        candidates.append(backup_path(filepath, number))
+        number += 1
+    for path in candidates:
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors du chargement de {path}: {e}")
+            continue
+        if path != filepath:
+            print(f"Copie de secours utilisée: {path}")
+        return data
+    return None
+
+
+class WriteBehindSaver:
+    """Sauvegarde différée et fusionnée, écrite par un thread de fond.
+
+    ``schedule`` ne fait que retenir le dernier état à écrire et réveiller
+    le thread : l'appelant (la boucle d'affichage) ne touche jamais au
+    disque. Le thread écrit l'état en attente puis attend au moins
+    ``interval`` secondes avant l'écriture suivante ; les états programmés
+    entre-temps sont fusionnés en une seule écriture. En mode anti-rebond
+    (``debounce``), l'écriture attend au contraire ``interval`` secondes
+    sans nouvelle demande : une rafale de demandes donne une seule écriture.
+
+    Attributes:
+        write (Callable): Fonction d'écriture, appelée avec l'état à sauvegarder
+        interval (float): Intervalle minimal entre deux écritures, en secondes
+        debounce (bool): Écrit seulement après ``interval`` secondes de calme
+        writes (int): Nombre d'écritures effectuées
+
+    Examples:
+        >>> saver = WriteBehindSaver(Player.save_data, interval=0.5)
+        >>> saver.schedule(player.to_dict())
+        >>> saver.close()  # dernière écriture, aussi faite à la sortie
+    """
+
+    def __init__(self, write: Callable[[Any], None], interval: float = DEFAULT_INTERVAL,
+                 flush_at_exit: bool = True, debounce: bool = False):
+        """Initialise le saver et démarre son thread d'écriture.
+
+        Args:
+            write (Callable): Fonction d'écriture de l'état
+            interval (float, optional): Secondes minimales entre deux écritures.
+                Par défaut DEFAULT_INTERVAL.
+            flush_at_exit (bool, optional): Enregistre ``close`` avec atexit
+                pour écrire l'état en attente à la sortie. Par défaut True.
+            debounce (bool, optional): Attend ``interval`` secondes sans
+                nouvelle demande avant d'écrire. Par défaut False.
+        """
+        self.write = write
+        self.interval = interval
+        self.debounce = debounce
+        self.writes = 0
+        self._pending = _PENDING_NONE
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        if flush_at_exit:
+            atexit.register(self.close)
+
+    @property
+    def dirty(self) -> bool:
+        """True si un état attend d'être écrit."""
+        return self._pending is not _PENDING_NONE
+
+    def schedule(self, state: Any) -> None:
+        """Programme l'écriture d'un état, en remplaçant l'état en attente.
+
+        Args:
+            state: État à sauvegarder (une copie, par exemple ``to_dict()``)
+        """
+        with self._condition:
+            self._pending = state
+            self._generation += 1
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """Écrit immédiatement l'état en attente, dans le thread appelant."""
+        with self._write_lock:
+            with self._condition:
+                state, self._pending = self._pending, _PENDING_NONE
+            if state is not _PENDING_NONE:
+                self._write(state)
+
+    def close(self) -> None:
+        """Arrête le thread d'écriture et écrit l'état en attente."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _write(self, state: Any) -> None:
+        """Appelle la fonction d'écriture en signalant les erreurs."""
+        try:
+            self.write(state)
+            self.writes += 1
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde différée: {e}")
+
+    def _run(self) -> None:
+        """Boucle du thread : attend un état, l'écrit, puis respecte l'intervalle."""
+        while True:
+            with self._condition:
+                while self._pending is _PENDING_NONE and not self._closed:
+                    self._condition.wait()
+                # Anti-rebond : attend une période complète sans nouvelle demande
+                while self.debounce and not self._closed:
+                    generation = self._generation
+                    self._condition.wait(self.interval)
+                    if self._generation == generation:
+                        break
+                if self._closed:
+                    return
+            self.flush()
+            if self.debounce:
+                continue
+            # Limite le débit : les états programmés pendant l'attente sont fusionnés
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed, timeout=self.interval)
@@ -4,10 +4,11 @@ Ce module définit la classe Player qui gère le profil du joueur,
 son solde, ses statistiques de jeu et la persistance des données.
 """
 
-import json
 import os
 from typing import Optional
 
+from .persistence import DEFAULT_BACKUPS, atomic_write_json, load_json
+
 
 class Player:
     """Représente un joueur de Blackjack avec ses statistiques et son solde.
@@ -39,6 +40,11 @@ class Player:
     #: Nom du fichier de sauvegarde des statistiques
     SAVE_FILE = "player_stats.json"
     
+    #: Stockage optionnel remplaçant le fichier JSON (par exemple un
+    #: ``stats_store.SQLiteStore``) : tout objet fournissant
+    #: ``save_player(dict)`` et ``load_player() -> dict | None``
+    store = None
+    
     def __init__(self, balance: int = 1000):
         """Initialise un nouveau joueur.
         
@@ -172,20 +178,44 @@ class Player:
         
         Args:
             filepath (str, optional): Chemin du fichier de sauvegarde.
-                Si None, utilise le chemin par défaut.
+                Si None, utilise Player.store s'il est défini, sinon le
+                chemin par défaut.
                 
         Examples:
             >>> player = Player()
             >>> player.save()  # Sauvegarde dans player_stats.json
         """
+        self.save_data(self.to_dict(), filepath)
+    
+    @classmethod
+    def save_data(cls, data: dict, filepath: Optional[str] = None) -> None:
+        """Sauvegarde un état du joueur déjà converti par to_dict.
+        
+        Le fichier JSON est remplacé atomiquement et durablement, en
+        gardant une copie de secours de la version précédente. Utilisable depuis un
+        thread de fond (par exemple par un WriteBehindSaver), puisque
+        l'état est une copie.
+        
+        Args:
+            data (dict): Données du joueur (``to_dict()``)
+            filepath (str, optional): Chemin du fichier de sauvegarde.
+                Si None, utilise Player.store s'il est défini, sinon le
+                chemin par défaut.
+        """
+        if filepath is None and cls.store is not None:
+            try:
+                cls.store.save_player(data)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde: {e}")
+            return
+        
         if filepath is None:
             # Sauvegarder dans le répertoire parent de src
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            filepath = os.path.join(base_dir, "..", self.SAVE_FILE)
+            filepath = os.path.join(base_dir, "..", cls.SAVE_FILE)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            atomic_write_json(filepath, data, backups=DEFAULT_BACKUPS)
         except Exception as e:
             print(f"Erreur lors de la sauvegarde: {e}")
     
@@ -195,7 +225,10 @@ class Player:
         
         Args:
             filepath (str, optional): Chemin du fichier de sauvegarde.
-                Si None, utilise le chemin par défaut.
+                Si None, utilise Player.store s'il est défini, sinon le
+                chemin par défaut. Un joueur absent du stockage est repris
+                du fichier JSON (migration au premier lancement). Un fichier
+                illisible est remplacé par sa dernière copie de secours.
             
         Returns:
             Player: Instance de Player chargée ou nouvelle instance 
@@ -206,18 +239,25 @@ class Player:
             >>> print(player.balance)
             1000
         """
+        if filepath is None and cls.store is not None:
+            try:
+                data = cls.store.load_player()
+                if data is not None:
+                    return cls.from_dict(data)
+            except Exception as e:
+                print(f"Erreur lors du chargement: {e}")
+        
         if filepath is None:
             # Chercher dans le répertoire parent de src
             base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             filepath = os.path.join(base_dir, "..", cls.SAVE_FILE)
         
-        if not os.path.exists(filepath):
+        data = load_json(filepath)
+        if data is None:
             print(f"Fichier de sauvegarde non trouvé, création d'un nouveau joueur")
             return cls()
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
             return cls.from_dict(data)
         except Exception as e:
             print(f"Erreur lors du chargement: {e}, création d'un nouveau joueur")
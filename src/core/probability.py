@@ -0,0 +1,208 @@
+"""Module de calcul exact des probabilités du croupier.
+
+Ce module calcule la distribution exacte du total final du croupier
+(17 à 21, bust ou Blackjack) à partir de sa carte visible et de la
+composition des cartes non vues. Le calcul énumère récursivement tous les
+tirages possibles selon la règle de ``Game.dealer_play`` (tire tant que le
+total est inférieur à 17, reste sur 17 souple) ; chaque état intermédiaire
+est mémorisé sur la clé (total dur, As présent, composition).
+
+Une composition est un tuple de 10 compteurs indexé par valeur de carte :
+l'index 0 compte les As, l'index i les cartes de valeur i + 1 (2 à 9),
+et l'index 9 toutes les cartes valant 10.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple, Union
+
+from .card import Card, CARD_VALUES, NUM_CARDS
+from .game import GameState
+
+#: Issues possibles pour le croupier, dans l'ordre des distributions
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, "bust", "blackjack")
+
+#: Composition d'un jeu complet de 52 cartes
+FULL_DECK_COMPOSITION = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+#: Index de composition de chaque carte, indexé par son code
+CARD_COMPOSITION_INDEX = bytes(
+    0 if CARD_VALUES[code] == 11 else CARD_VALUES[code] - 1
+    for code in range(NUM_CARDS)
+)
+
+# Table de traduction de 256 octets pour bytes.translate
+_TRANSLATE_TABLE = CARD_COMPOSITION_INDEX + bytes(256 - NUM_CARDS)
+
+_ZERO = (0.0,) * 6
+
+
+def value_index(value: int) -> int:
+    """Retourne l'index de composition d'une valeur de carte Blackjack.
+
+    Args:
+        value (int): Valeur de la carte (2-10, ou 11 pour l'As)
+
+    Returns:
+        int: Index dans la composition (0 pour l'As, value - 1 sinon)
+    """
+    return 0 if value == 11 else value - 1
+
+
+def composition_of(cards: Iterable[Card]) -> Tuple[int, ...]:
+    """Calcule la composition d'un ensemble de cartes.
+
+    Args:
+        cards (Iterable[Card]): Les cartes à compter
+
+    Returns:
+        tuple: Composition à 10 compteurs
+    """
+    counts = [0] * 10
+    for card in cards:
+        counts[CARD_COMPOSITION_INDEX[card.code]] += 1
+    return tuple(counts)
+
+
+def shoe_composition(deck) -> Tuple[int, ...]:
+    """Calcule la composition des cartes restantes d'un sabot.
+
+    Le comptage est fait en C (``bytes.translate`` puis ``bytes.count``),
+    sans créer d'objet Card.
+
+    Args:
+        deck (Deck): Le sabot
+
+    Returns:
+        tuple: Composition à 10 compteurs des cartes restantes
+    """
+    data = deck.shoe[deck.position:].tobytes().translate(_TRANSLATE_TABLE)
+    return tuple(data.count(i) for i in range(10))
+
+
+@lru_cache(maxsize=1 << 18)
+def _dealer_from(hard: int, has_ace: bool, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    """Distribution finale du croupier depuis un état donné (mémorisée).
+
+    Args:
+        hard (int): Total du croupier avec les As comptés 1
+        has_ace (bool): True si la main contient au moins un As
+        counts (tuple): Composition des cartes restantes
+
+    Returns:
+        tuple: Probabilités de 17, 18, 19, 20, 21 et bust
+    """
+    if hard > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    total = hard + 10 if has_ace and hard <= 11 else hard
+    if total >= 17:
+        result = [0.0] * 6
+        result[total - 17] = 1.0
+        return tuple(result)
+
+    remaining = sum(counts)
+    if remaining == 0:
+        # Sabot vide : le jeu remélange un jeu complet
+        counts = FULL_DECK_COMPOSITION
+        remaining = 52
+
+    acc = list(_ZERO)
+    for i, count in enumerate(counts):
+        if not count:
+            continue
+        p = count / remaining
+        sub = counts[:i] + (count - 1,) + counts[i + 1:]
+        branch = _dealer_from(hard + i + 1, has_ace or i == 0, sub)
+        for k in range(6):
+            acc[k] += p * branch[k]
+    return tuple(acc)
+
+
+def dealer_distribution(upcard: int, composition: Tuple[int, ...],
+                        peeked: bool = False) -> Tuple[float, ...]:
+    """Calcule la distribution finale du croupier sous forme de tuple.
+
+    Args:
+        upcard (int): Valeur Blackjack de la carte visible (2-11)
+        composition (tuple): Composition des cartes non vues (carte
+            cachée comprise, carte visible exclue)
+        peeked (bool, optional): True si l'on sait déjà que le croupier
+            n'a pas de Blackjack (la distribution est alors conditionnée).
+
+    Returns:
+        tuple: Probabilités dans l'ordre de DEALER_OUTCOMES
+    """
+    up = value_index(upcard)
+    composition = tuple(composition)
+    remaining = sum(composition)
+    if remaining == 0:
+        composition = FULL_DECK_COMPOSITION
+        remaining = 52
+
+    acc = [0.0] * 7
+    excluded = 0.0
+    for i, count in enumerate(composition):
+        if not count:
+            continue
+        p = count / remaining
+        if (up == 0 and i == 9) or (up == 9 and i == 0):
+            # As + dix en deux cartes : Blackjack naturel
+            if peeked:
+                excluded += p
+            else:
+                acc[6] += p
+            continue
+        sub = composition[:i] + (count - 1,) + composition[i + 1:]
+        branch = _dealer_from(up + 1 + i + 1, up == 0 or i == 0, sub)
+        for k in range(6):
+            acc[k] += p * branch[k]
+
+    if peeked and excluded < 1.0:
+        scale = 1.0 / (1.0 - excluded)
+        acc = [p * scale for p in acc]
+    return tuple(acc)
+
+
+def dealer_probabilities(upcard: int, composition: Tuple[int, ...],
+                         peeked: bool = False) -> Dict[Union[int, str], float]:
+    """Calcule la probabilité de chaque total final du croupier.
+
+    Args:
+        upcard (int): Valeur Blackjack de la carte visible (2-11)
+        composition (tuple): Composition des cartes non vues (carte
+            cachée comprise, carte visible exclue)
+        peeked (bool, optional): True si l'absence de Blackjack du
+            croupier est déjà connue. Par défaut False.
+
+    Returns:
+        dict: Probabilité de chaque issue de DEALER_OUTCOMES
+
+    Examples:
+        >>> probs = dealer_probabilities(6, (24, 24, 24, 24, 24, 23, 24, 24, 24, 96))
+        >>> round(probs["bust"], 3)
+        0.423
+    """
+    return dict(zip(DEALER_OUTCOMES, dealer_distribution(upcard, composition, peeked)))
+
+
+def game_dealer_probabilities(game) -> Dict[Union[int, str], float]:
+    """Calcule les probabilités du croupier pour une partie en cours.
+
+    Les cartes non vues sont celles du sabot plus la carte cachée du
+    croupier. Pendant le tour du joueur, le Blackjack du croupier a déjà
+    été vérifié par ``Game.deal_initial_cards`` : la distribution est
+    conditionnée à son absence.
+
+    Args:
+        game (Game): La partie (le croupier doit avoir au moins une carte)
+
+    Returns:
+        dict: Probabilité de chaque issue de DEALER_OUTCOMES
+    """
+    counts = list(shoe_composition(game.deck))
+    for card in game.dealer_hand.cards[1:]:
+        counts[CARD_COMPOSITION_INDEX[card.code]] += 1
+    upcard = game.dealer_hand.cards[0].value()
+    peeked = game.state == GameState.PLAYER_TURN
+    return dealer_probabilities(upcard, tuple(counts), peeked)
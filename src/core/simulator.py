@@ -0,0 +1,378 @@
+"""Module de simulation de parties de Blackjack sans interface graphique.
+
+Ce module définit la classe Simulator qui enchaîne des manches complètes
+sur un objet Game (distribution, actions du joueur, jeu du croupier)
+sans dépendre de pygame, ainsi que la classe SimulationResult qui agrège
+les résultats : avantage de la maison, variance et débit en manches/seconde.
+
+Chaque manche passe par les méthodes de Game (objets Card et Hand, états
+de la partie), qui valident les règles du jeu réel. Le chemin d'une
+manche est allégé pour tenir plus de 100 000 manches par seconde et par
+cœur en CPython : mains réutilisées d'une manche à l'autre, sabot
+mélangé par un tri en C, membres d'Enum lus en noms de module, actions
+HIT et STAND jouées sans table de dispatch, compteurs tenus dans des
+variables locales par ``run``. MonteCarloRunner répartit en plus les
+manches sur plusieurs processus, et VectorizedSimulator (NumPy) joue la
+stratégie de base par lots.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Optional, Tuple
+
+from .deck import DEFAULT_PENETRATION, RandomSource
+from .game import Game, GameResult, GameState, PlayerAction
+
+# Membres d'Enum lus à chaque manche, en noms de module (voir core.game)
+_PLAYER_TURN = GameState.PLAYER_TURN
+_DEALER_REVEAL = GameState.DEALER_REVEAL
+_DEALER_TURN = GameState.DEALER_TURN
+_PLAYER_WIN = GameResult.PLAYER_WIN
+_DEALER_WIN = GameResult.DEALER_WIN
+_HIT = PlayerAction.HIT
+_STAND = PlayerAction.STAND
+
+#: Signature d'une stratégie : reçoit la partie en cours, retourne une action
+Strategy = Callable[[Game], PlayerAction]
+
+#: Signature d'une stratégie de mise : reçoit la partie avant la distribution,
+#: retourne la mise de la manche
+Betting = Callable[[Game], int]
+
+
+def dealer_mimic_strategy(game: Game) -> PlayerAction:
+    """Stratégie qui imite le croupier : tire sous 17, s'arrête sinon.
+
+    Args:
+        game (Game): La partie en cours (état PLAYER_TURN)
+
+    Returns:
+        PlayerAction: HIT si la main courante vaut moins de 17, STAND sinon
+    """
+    if game.get_current_hand().get_value() < 17:
+        return _HIT
+    return _STAND
+
+
+class SimulationResult:
+    """Agrège les résultats d'une série de manches simulées.
+
+    Les gains sont exprimés en jetons, comme la mise : avec la mise par
+    défaut de 1, un gain de 1 vaut une mise initiale. L'avantage de la
+    maison est rapporté au total des mises initiales, quelle que soit la
+    mise. Les compteurs victoires/défaites/égalités portent sur le gain
+    net de chaque manche (une manche splittée compte une seule fois).
+
+    Attributes:
+        rounds (int): Nombre de manches jouées
+        wins (int): Manches terminées avec un gain net positif
+        losses (int): Manches terminées avec un gain net négatif
+        pushes (int): Manches terminées à gain nul
+        blackjacks (int): Nombre de Blackjacks naturels du joueur
+        surrenders (int): Nombre d'abandons
+        wagered (float): Somme des mises initiales, en jetons
+        net_units (float): Somme des gains nets, en jetons
+        sum_squares (float): Somme des carrés des gains nets (pour la variance)
+        elapsed (float): Temps de calcul cumulé en secondes
+
+    Examples:
+        >>> result = Simulator().run(10000)
+        >>> result.wins + result.losses + result.pushes
+        10000
+    """
+
+    def __init__(self):
+        """Initialise un résultat vide."""
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.blackjacks = 0
+        self.surrenders = 0
+        self.wagered = 0.0
+        self.net_units = 0.0
+        self.sum_squares = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Gain moyen par manche, en jetons."""
+        if self.rounds == 0:
+            return 0.0
+        return self.net_units / self.rounds
+
+    @property
+    def house_edge(self) -> float:
+        """Avantage de la maison : perte nette par jeton de mise initiale."""
+        if self.wagered <= 0:
+            return -self.mean
+        return -self.net_units / self.wagered
+
+    @property
+    def variance(self) -> float:
+        """Variance du gain net par manche."""
+        if self.rounds == 0:
+            return 0.0
+        return self.sum_squares / self.rounds - self.mean ** 2
+
+    @property
+    def std_error(self) -> float:
+        """Erreur type de l'estimation du gain moyen."""
+        if self.rounds == 0:
+            return 0.0
+        return math.sqrt(self.variance / self.rounds)
+
+    @property
+    def rounds_per_sec(self) -> float:
+        """Débit de la simulation en manches par seconde."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rounds / self.elapsed
+
+    def merge(self, other: "SimulationResult") -> "SimulationResult":
+        """Ajoute les compteurs d'un autre résultat à celui-ci.
+
+        Args:
+            other (SimulationResult): Résultat partiel à fusionner
+
+        Returns:
+            SimulationResult: Ce résultat (pour chaîner les appels)
+        """
+        self.rounds += other.rounds
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        self.blackjacks += other.blackjacks
+        self.surrenders += other.surrenders
+        self.wagered += other.wagered
+        self.net_units += other.net_units
+        self.sum_squares += other.sum_squares
+        self.elapsed += other.elapsed
+        return self
+
+    def to_dict(self) -> dict:
+        """Convertit le résultat en dictionnaire (compteurs et indicateurs).
+
+        Returns:
+            dict: Compteurs bruts et indicateurs dérivés
+        """
+        return {
+            "rounds": self.rounds,
+            "wins": self.wins,
+            "losses": self.losses,
+            "pushes": self.pushes,
+            "blackjacks": self.blackjacks,
+            "surrenders": self.surrenders,
+            "wagered": self.wagered,
+            "net_units": self.net_units,
+            "sum_squares": self.sum_squares,
+            "elapsed": self.elapsed,
+            "house_edge": self.house_edge,
+            "variance": self.variance,
+            "rounds_per_sec": self.rounds_per_sec,
+        }
+
+    def __repr__(self) -> str:
+        """Retourne une représentation textuelle du résultat.
+
+        Returns:
+            str: Résumé avec nombre de manches, avantage maison et débit
+        """
+        return (f"SimulationResult(rounds={self.rounds}, "
+                f"house_edge={self.house_edge:.4%}, "
+                f"rounds_per_sec={self.rounds_per_sec:.0f})")
+
+
+class Simulator:
+    """Joue des manches de Blackjack en boucle sans interface graphique.
+
+    Le simulateur pilote directement un objet Game : distribution initiale,
+    actions choisies par une stratégie, puis jeu du croupier. Les gains
+    reproduisent le règlement effectué par ``main.py`` (1:1, Blackjack
+    payé selon ``blackjack_payout``, abandon à 50%).
+
+    Attributes:
+        game (Game): La partie réutilisée d'une manche à l'autre
+        strategy (Strategy): Fonction choisissant l'action du joueur
+        bet (int): Mise initiale de chaque manche
+        betting (Betting): Stratégie de mise variable (None = mise fixe ``bet``)
+        blackjack_payout (float): Multiplicateur de gain d'un Blackjack
+
+    Examples:
+        >>> sim = Simulator(num_decks=6)
+        >>> result = sim.run(100000)
+        >>> result.rounds
+        100000
+    """
+
+    def __init__(self, strategy: Optional[Strategy] = None, num_decks: int = 1,
+                 bet: int = 1, blackjack_payout: float = 1.5,
+                 penetration: float = DEFAULT_PENETRATION,
+                 rng: RandomSource = None, betting: Optional[Betting] = None):
+        """Initialise le simulateur.
+
+        Args:
+            strategy (Strategy, optional): Stratégie du joueur.
+                Par défaut, imite le croupier (tire sous 17).
+            num_decks (int, optional): Nombre de jeux dans le sabot. Par défaut 1.
+            bet (int, optional): Mise de chaque manche. Par défaut 1.
+            blackjack_payout (float, optional): Gain d'un Blackjack. Par défaut 1.5.
+            penetration (float, optional): Position de la carte de coupe ;
+                le sabot est remélangé entre deux manches une fois celle-ci
+                atteinte (0 = à chaque manche). Par défaut DEFAULT_PENETRATION.
+            rng (int | str | random.Random, optional): Graine ou générateur
+                dédié au sabot, pour des séries reproductibles et indépendantes.
+            betting (Betting, optional): Stratégie de mise appelée avant
+                chaque manche, par exemple selon le compte des cartes
+                (voir ``core.counting.bet_ramp``). Par défaut, mise fixe.
+        """
+        self.game = Game(num_decks, rng, penetration)
+        self.strategy = strategy or dealer_mimic_strategy
+        self.bet = bet
+        self.betting = betting
+        self.blackjack_payout = blackjack_payout
+        # HIT et STAND, toujours possibles pendant le tour du joueur, sont
+        # joués directement par play_round
+        self._actions = {
+            PlayerAction.DOUBLE: (Game.can_double, Game.player_double),
+            PlayerAction.SPLIT: (Game.can_split, Game.player_split),
+            PlayerAction.SURRENDER: (Game.can_surrender, Game.player_surrender),
+        }
+
+    def play_round(self, result: Optional[SimulationResult] = None) -> float:
+        """Joue une manche complète et retourne le gain net.
+
+        Args:
+            result (SimulationResult, optional): Résultat à mettre à jour
+                avec les compteurs de la manche
+
+        Returns:
+            float: Gain net de la manche, en jetons
+
+        Raises:
+            ValueError: Si la stratégie retourne une action impossible
+        """
+        net, bet, blackjack = self._play()
+        if result is not None:
+            result.rounds += 1
+            result.wagered += bet
+            result.net_units += net
+            result.sum_squares += net * net
+            if net > 0:
+                result.wins += 1
+            elif net < 0:
+                result.losses += 1
+            else:
+                result.pushes += 1
+            if self.game.has_surrendered:
+                result.surrenders += 1
+            elif blackjack:
+                result.blackjacks += 1
+        return net
+
+    def _play(self) -> Tuple[float, int, bool]:
+        """Joue une manche complète.
+
+        Returns:
+            tuple: Gain net, mise initiale, et True si le joueur a eu un Blackjack
+        """
+        game = self.game
+        game.reset()
+        bet = self.betting(game) if self.betting is not None else self.bet
+        game.player_bet = bet
+        game.deal_initial_cards()
+
+        strategy = self.strategy
+        while game.state is _PLAYER_TURN:
+            action = strategy(game)
+            # Comparaisons d'identité : pas de hachage d'Enum (écrit en Python)
+            if action is _HIT:
+                game.player_hit()
+            elif action is _STAND:
+                game.player_stand()
+            else:
+                can_play, play = self._actions[action]
+                if not can_play(game):
+                    raise ValueError(f"action impossible : {action.value}")
+                play(game)
+
+        blackjack = False
+        if game.has_surrendered:
+            net = -bet / 2
+        else:
+            if game.state is _DEALER_REVEAL:
+                game.state = _DEALER_TURN
+                game.dealer_play()
+            hands = game.hands
+            if len(hands) == 1:
+                # Main unique : règlement direct, sans la boucle de _settle
+                res = game.hand_results[0]
+                stake = game.hand_bets[0]
+                if res is _PLAYER_WIN:
+                    blackjack = hands[0].is_blackjack()
+                    net = stake * self.blackjack_payout if blackjack else stake
+                elif res is _DEALER_WIN:
+                    net = -stake
+                else:
+                    blackjack = hands[0].is_blackjack()
+                    net = 0.0
+            else:
+                net = self._settle()
+        return net, bet, blackjack
+
+    def _settle(self) -> float:
+        """Calcule le gain net de la manche terminée.
+
+        Returns:
+            float: Somme des gains et pertes de chaque main du joueur
+        """
+        game = self.game
+        net = 0.0
+        for hand, bet, res in zip(game.hands, game.hand_bets, game.hand_results):
+            if res == GameResult.PLAYER_WIN:
+                net += bet * self.blackjack_payout if hand.is_blackjack() else bet
+            elif res == GameResult.DEALER_WIN:
+                net -= bet
+        return net
+
+    def run(self, num_rounds: int) -> SimulationResult:
+        """Joue un nombre donné de manches et agrège les résultats.
+
+        Args:
+            num_rounds (int): Nombre de manches à jouer
+
+        Returns:
+            SimulationResult: Résultats agrégés de la série
+        """
+        # Mêmes compteurs que play_round, tenus dans des variables locales
+        play = self._play
+        game = self.game
+        wins = losses = pushes = blackjacks = surrenders = 0
+        wagered = net_units = sum_squares = 0.0
+        start = time.perf_counter()
+        for _ in range(num_rounds):
+            net, bet, blackjack = play()
+            wagered += bet
+            net_units += net
+            sum_squares += net * net
+            if net > 0:
+                wins += 1
+            elif net < 0:
+                losses += 1
+            else:
+                pushes += 1
+            if game.has_surrendered:
+                surrenders += 1
+            elif blackjack:
+                blackjacks += 1
+        elapsed = time.perf_counter() - start
+
+        result = SimulationResult()
+        result.rounds = num_rounds
+        result.wins, result.losses, result.pushes = wins, losses, pushes
+        result.blackjacks, result.surrenders = blackjacks, surrenders
+        result.wagered, result.net_units, result.sum_squares = wagered, net_units, sum_squares
+        result.elapsed = elapsed
+        return result
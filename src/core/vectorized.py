@@ -0,0 +1,288 @@
+"""Module de simulation vectorisée avec NumPy (optionnel).
+
+Ce module joue des milliers de manches indépendantes à la fois : chaque
+manche reçoit son propre sabot mélangé (une ligne d'un tableau d'entiers),
+les cartes sont distribuées par indexation avancée avec un curseur par
+manche, et le jeu du joueur (stratégie de base de ``core.basic_strategy``),
+celui du croupier et le règlement sont résolus par masques booléens selon
+les règles de ``Game`` (``deal_initial_cards``, ``dealer_play`` et
+``_determine_winner``).
+
+NumPy n'est pas une dépendance du jeu : le module s'importe sans elle,
+mais VectorizedSimulator lève ImportError à la création si elle manque.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+from .basic_strategy import (ACTIONS, COLUMNS, HARD, PAIR, ROWS, SOFT,
+                             basic_strategy, get_basic_strategy)
+from .card import CARD_VALUES
+from .game import PlayerAction
+from .simulator import SimulationResult, Simulator
+
+#: True si NumPy est disponible
+HAS_NUMPY = np is not None
+
+_STAND, _HIT, _DOUBLE, _SPLIT, _SURRENDER = (
+    ACTIONS.index(action) for action in (PlayerAction.STAND, PlayerAction.HIT,
+                                         PlayerAction.DOUBLE, PlayerAction.SPLIT,
+                                         PlayerAction.SURRENDER)
+)
+
+
+class VectorizedSimulator:
+    """Simule des manches indépendantes par lots avec NumPy.
+
+    Le joueur suit la stratégie de base à mise fixe. Chaque manche est
+    jouée sur un sabot complet fraîchement mélangé, ce qui équivaut au
+    Simulator scalaire remélangé avant chaque manche.
+
+    Attributes:
+        num_decks (int): Nombre de jeux dans le sabot
+        bet (int): Mise de chaque manche
+        blackjack_payout (float): Multiplicateur de gain d'un Blackjack
+        batch_size (int): Nombre de manches jouées par lot
+        rng (numpy.random.Generator): Générateur des mélanges
+
+    Examples:
+        >>> sim = VectorizedSimulator(num_decks=6, seed=42)
+        >>> result = sim.run(1000000)
+        >>> result.rounds
+        1000000
+    """
+
+    def __init__(self, num_decks: int = 1, bet: int = 1, blackjack_payout: float = 1.5,
+                 batch_size: int = 20000, seed: Optional[int] = None):
+        """Initialise le simulateur vectorisé.
+
+        Args:
+            num_decks (int, optional): Nombre de jeux dans le sabot. Par défaut 1.
+            bet (int, optional): Mise de chaque manche. Par défaut 1.
+            blackjack_payout (float, optional): Gain d'un Blackjack. Par défaut 1.5.
+            batch_size (int, optional): Manches par lot. Par défaut 20000.
+            seed (int, optional): Graine du générateur, pour des séries reproductibles.
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy est requis pour la simulation vectorisée")
+        self.num_decks = num_decks
+        self.bet = bet
+        self.blackjack_payout = blackjack_payout
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+        # Valeur Blackjack de chaque carte du sabot non mélangé
+        values = np.array(CARD_VALUES, dtype=np.int8)
+        self._shoe = np.tile(values, num_decks)
+        self._table = np.frombuffer(get_basic_strategy(num_decks).table, dtype=np.uint8)
+
+    def _codes(self, kind, total, upcard):
+        """Lit les codes de la table de stratégie pour chaque manche."""
+        up = np.where(upcard == 11, 0, upcard - 1)
+        return self._table[(kind * ROWS + total) * COLUMNS + up]
+
+    def _hand_codes(self, hard, aces, upcard):
+        """Codes de stratégie d'une main dure ou souple."""
+        soft = (aces > 0) & (hard <= 11)
+        total = np.minimum(hard + 10 * soft, 21)
+        return self._codes(np.where(soft, SOFT, HARD), total, upcard)
+
+    @staticmethod
+    def _draw(cards, cursor, hard, aces, mask):
+        """Tire une carte pour chaque manche du masque (sur place)."""
+        rows = np.nonzero(mask)[0]
+        drawn = cards[rows, cursor[rows]]
+        cursor[rows] += 1
+        hard[rows] += np.where(drawn == 11, 1, drawn)
+        aces[rows] += drawn == 11
+
+    def _play_hand(self, cards, cursor, hard, aces, bets, upcard, codes, live, can_surrender):
+        """Joue une main pour chaque manche du masque live.
+
+        Args:
+            codes: Codes de la première décision (table de stratégie)
+            can_surrender: Masque des manches où l'abandon est permis
+
+        Returns:
+            Masque des manches qui ont abandonné
+        """
+        action = codes & 0x0F
+        refused = (action == _SURRENDER) & ~can_surrender
+        action = np.where(refused, codes >> 4, action)
+
+        surrendered = live & (action == _SURRENDER)
+        doubled = live & (action == _DOUBLE)
+        bets[doubled] *= 2
+        self._draw(cards, cursor, hard, aces, doubled)
+
+        hitting = live & (action == _HIT)
+        while hitting.any():
+            self._draw(cards, cursor, hard, aces, hitting)
+            hitting &= (hard <= 21) & ((self._hand_codes(hard, aces, upcard) >> 4) == _HIT)
+        return surrendered
+
+    @staticmethod
+    def _outcome(hard, aces, dealer_total, dealer_bust):
+        """Résultat d'une main face au croupier : 1, 0 ou -1 (_determine_winner)."""
+        bust = hard > 21
+        total = np.where((aces > 0) & (hard <= 11), hard + 10, hard)
+        win = ~bust & (dealer_bust | (total > dealer_total))
+        lose = bust | (~dealer_bust & (total < dealer_total))
+        return win.astype(np.int8) - lose.astype(np.int8)
+
+    def play_batch(self, n: int, result: Optional[SimulationResult] = None):
+        """Joue n manches indépendantes et retourne leurs gains nets.
+
+        Args:
+            n (int): Nombre de manches du lot
+            result (SimulationResult, optional): Résultat à mettre à jour
+
+        Returns:
+            numpy.ndarray: Gain net de chaque manche, en jetons (mise ``bet``)
+        """
+        cards = self.rng.permuted(np.broadcast_to(self._shoe, (n, self._shoe.size)), axis=1)
+        # Ordre de distribution de Game : joueur, croupier, joueur, croupier
+        first, upcard, second, hole = (cards[:, i].astype(np.int16) for i in range(4))
+        cursor = np.full(n, 4, dtype=np.intp)
+
+        hard = np.where(first == 11, 1, first) + np.where(second == 11, 1, second)
+        aces = (first == 11).astype(np.int16) + (second == 11)
+        dealer_hard = np.where(upcard == 11, 1, upcard) + np.where(hole == 11, 1, hole)
+        dealer_aces = (upcard == 11).astype(np.int16) + (hole == 11)
+
+        player_bj = (aces > 0) & (hard == 11)
+        dealer_bj = (dealer_aces > 0) & (dealer_hard == 11)
+        live = ~(player_bj | dealer_bj)
+
+        # Première décision : ligne des paires si le split est possible
+        pair = first == second
+        codes = np.where(pair,
+                         self._codes(PAIR, np.where(first == 11, 0, first - 1), upcard),
+                         self._hand_codes(hard, aces, upcard))
+        split = live & ((codes & 0x0F) == _SPLIT)
+
+        # Split : chaque main garde une carte de la paire et en reçoit une nouvelle
+        split_value = np.where(first == 11, 1, first)
+        split_ace = (first == 11).astype(np.int16)
+        hard = np.where(split, split_value, hard)
+        aces = np.where(split, split_ace, aces)
+        other_hard = split_value.copy()
+        other_aces = split_ace.copy()
+        self._draw(cards, cursor, hard, aces, split)
+        self._draw(cards, cursor, other_hard, other_aces, split)
+        codes = np.where(split, self._hand_codes(hard, aces, upcard), codes)
+        # Un 21 en deux cartes après split reste à 21 et sera payé comme un Blackjack
+        split_21 = split & (hard == 11) & (aces > 0)
+        other_split_21 = split & (other_hard == 11) & (other_aces > 0)
+
+        bets = np.ones(n, dtype=np.int8)
+        other_bets = np.ones(n, dtype=np.int8)
+        surrendered = self._play_hand(cards, cursor, hard, aces, bets, upcard,
+                                      codes, live, ~split)
+        self._play_hand(cards, cursor, other_hard, other_aces, other_bets, upcard,
+                        self._hand_codes(other_hard, other_aces, upcard), split,
+                        np.zeros(n, dtype=bool))
+
+        # Le croupier tire tant que son total est inférieur à 17 (reste sur 17 souple)
+        playing = live & ~surrendered
+        while True:
+            dealer_total = np.where((dealer_aces > 0) & (dealer_hard <= 11),
+                                    dealer_hard + 10, dealer_hard)
+            drawing = playing & (dealer_total < 17)
+            if not drawing.any():
+                break
+            self._draw(cards, cursor, dealer_hard, dealer_aces, drawing)
+        dealer_bust = dealer_total > 21
+
+        payout = self.blackjack_payout
+        outcome = self._outcome(hard, aces, dealer_total, dealer_bust)
+        net = bets * np.where(split_21 & (outcome > 0), payout, outcome)
+        other = self._outcome(other_hard, other_aces, dealer_total, dealer_bust)
+        other = other_bets * np.where(other_split_21 & (other > 0), payout, other)
+        net = np.where(split, net + other, net)
+        net = np.where(surrendered, -0.5, net)
+        # Blackjacks naturels, résolus dès la distribution
+        net = np.where(player_bj, np.where(dealer_bj, 0.0, payout), net)
+        net = np.where(dealer_bj & ~player_bj, -1.0, net)
+        net *= self.bet
+
+        if result is not None:
+            result.rounds += n
+            result.wagered += n * self.bet
+            result.wins += int(np.count_nonzero(net > 0))
+            result.losses += int(np.count_nonzero(net < 0))
+            result.pushes += int(np.count_nonzero(net == 0))
+            result.blackjacks += int(np.count_nonzero(player_bj))
+            result.surrenders += int(np.count_nonzero(surrendered))
+            result.net_units += float(net.sum())
+            result.sum_squares += float(np.dot(net, net))
+        return net
+
+    def run(self, num_rounds: int) -> SimulationResult:
+        """Joue un nombre donné de manches par lots et agrège les résultats.
+
+        Args:
+            num_rounds (int): Nombre de manches à jouer
+
+        Returns:
+            SimulationResult: Résultats agrégés de la série
+        """
+        result = SimulationResult()
+        start = time.perf_counter()
+        remaining = num_rounds
+        while remaining > 0:
+            n = min(self.batch_size, remaining)
+            self.play_batch(n, result)
+            remaining -= n
+        result.elapsed = time.perf_counter() - start
+        return result
+
+
+def cross_check(num_rounds: int, num_decks: int = 1, seed: int = 0,
+                tolerance: float = 4.0) -> dict:
+    """Compare le simulateur vectorisé au Simulator scalaire.
+
+    Les deux moteurs jouent la stratégie de base ; le Simulator scalaire
+    remélange le sabot avant chaque manche pour jouer exactement le même
+    jeu. Les gains moyens doivent concorder à ``tolerance`` erreurs types
+    près (erreur type de la différence des deux moyennes).
+
+    Args:
+        num_rounds (int): Nombre de manches jouées par chaque moteur
+        num_decks (int, optional): Nombre de jeux dans le sabot. Par défaut 1.
+        seed (int, optional): Graine des deux générateurs. Par défaut 0.
+        tolerance (float, optional): Écart maximal en erreurs types. Par défaut 4.
+
+    Returns:
+        dict: Résultats des deux moteurs, écart en erreurs types (``z``)
+            et verdict (``agrees``)
+
+    Examples:
+        >>> report = cross_check(200000, num_decks=6)
+        >>> report["agrees"]
+        True
+    """
+    vectorized = VectorizedSimulator(num_decks, seed=seed).run(num_rounds)
+    scalar = Simulator(basic_strategy, num_decks,
+                       penetration=0.0,
+                       rng=seed).run(num_rounds)
+    std_error = math.sqrt(vectorized.std_error ** 2 + scalar.std_error ** 2)
+    z = (vectorized.mean - scalar.mean) / std_error if std_error > 0 else 0.0
+    return {
+        "vectorized": vectorized,
+        "scalar": scalar,
+        "difference": vectorized.mean - scalar.mean,
+        "std_error": std_error,
+        "z": z,
+        "agrees": abs(z) <= tolerance,
+    }
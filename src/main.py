@@ -3,12 +3,21 @@ import os
 import pygame
 import json
 import math
+import atexit
+import functools
+from collections import OrderedDict
 
 from core.deck import Deck
 from core.card import Card
 from core.game import Game, GameState, GameResult
 from core.player import Player
+from core.probability import game_dealer_probabilities
+from core.basic_strategy import get_basic_strategy
+from core.counting import CardCounter, SYSTEMS
+from core.persistence import WriteBehindSaver
 from config_manager import get_config_manager
+from stats_manager import StatsManager
+from stats_store import SQLiteStore, DATA_DIR, DB_FILE
 
 #  config graphique 
 WIDTH, HEIGHT = 1600, 900
@@ -28,37 +37,84 @@ COLOR_WIN = (50, 205, 50)
 COLOR_LOSE = (220, 60, 60)
 COLOR_PUSH = (255, 165, 0)
 
+# Couleurs modifiables par la section "palette" de la configuration (absente par
+# défaut : l'ancienne section "colors" du fichier ne correspond pas à ce thème)
+PALETTE_COLORS = {
+    'room_bg': 'COLOR_ROOM_BG',
+    'wood_rail': 'COLOR_WOOD_RAIL',
+    'gold': 'COLOR_GOLD',
+    'gold_light': 'COLOR_GOLD_LIGHT',
+    'text': 'COLOR_TEXT_WHITE',
+    'text_grey': 'COLOR_TEXT_GREY',
+    'win': 'COLOR_WIN',
+    'lose': 'COLOR_LOSE',
+    'push': 'COLOR_PUSH',
+}
+
+# Couleurs d'origine, rétablies quand une clé disparaît de la palette
+PALETTE_DEFAULTS = {key: globals()[name] for key, name in PALETTE_COLORS.items()}
+
+# Durées des phases de jeu (section "timing"), en secondes
+TIMING = {
+    'initial_deal_duration': 1.0,
+    'dealer_reveal_duration': 1.0,
+    'dealer_turn_duration': 1.0,
+}
+
+def apply_palette(section, palette):
+    """Applique la section palette de la configuration (abonné de ConfigManager)."""
+    for key, name in PALETTE_COLORS.items():
+        value = (palette or {}).get(key)
+        if isinstance(value, (list, tuple)) and len(value) == 3:
+            globals()[name] = tuple(value)
+        else:
+            globals()[name] = PALETTE_DEFAULTS[key]
+
+def apply_timing(section, timing):
+    """Applique la section timing de la configuration (abonné de ConfigManager)."""
+    for key in TIMING:
+        value = (timing or {}).get(key)
+        if isinstance(value, (int, float)):
+            TIMING[key] = float(value)
+
+
+# Clés de configuration lues à chaque image, résolues une seule fois
+TABLE_THEME = get_config_manager().handle('ui.table_theme', 'green', str)
+MUSIC_ENABLED = get_config_manager().handle('features.music_enabled', True, bool)
+MUSIC_VOLUME = get_config_manager().handle('features.music_volume', 0.5, float)
+SHOW_PROBABILITIES = get_config_manager().handle('features.show_probabilities', False, bool)
+SHOW_COUNT = get_config_manager().handle('features.show_count', False, bool)
+SHOW_HINTS = get_config_manager().handle('features.show_hints', True, bool)
+DIRTY_RENDERING = get_config_manager().handle('features.dirty_rendering', True, bool)
+
+# Couleurs de la table de chaque thème
+TABLE_THEMES = {
+    'green': {
+        'felt': (0, 100, 110),
+        'felt_dark': (0, 70, 80),
+        'felt_arc': (0, 120, 130)
+    },
+    'blue': {
+        'felt': (30, 60, 140),
+        'felt_dark': (20, 40, 100),
+        'felt_arc': (50, 80, 160)
+    },
+    'red': {
+        'felt': (120, 20, 20),
+        'felt_dark': (80, 10, 10),
+        'felt_arc': (140, 40, 40)
+    },
+    'black': {
+        'felt': (40, 40, 40),
+        'felt_dark': (20, 20, 20),
+        'felt_arc': (60, 60, 60)
+    }
+}
 
 # Fonction pour obtenir les couleurs selon le thème
 def get_table_colors():
     """Retourne les couleurs de la table selon le thème sélectionné"""
-    config = get_config_manager()
-    theme = config.get('ui.table_theme', 'green')
-    
-    themes = {
-        'green': {
-            'felt': (0, 100, 110),
-            'felt_dark': (0, 70, 80),
-            'felt_arc': (0, 120, 130)
-        },
-        'blue': {
-            'felt': (30, 60, 140),
-            'felt_dark': (20, 40, 100),
-            'felt_arc': (50, 80, 160)
-        },
-        'red': {
-            'felt': (120, 20, 20),
-            'felt_dark': (80, 10, 10),
-            'felt_arc': (140, 40, 40)
-        },
-        'black': {
-            'felt': (40, 40, 40),
-            'felt_dark': (20, 20, 20),
-            'felt_arc': (60, 60, 60)
-        }
-    }
-    
-    return themes.get(theme, themes['green'])
+    return TABLE_THEMES.get(TABLE_THEME.value, TABLE_THEMES['green'])
 
 # assets 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "cards")
@@ -78,6 +134,16 @@ _image_cache: dict[str, pygame.Surface] = {}
 dealer_image_surface = None
 dealer_happy_surface = None
 dealer_sad_surface = None
+
+# Compteur de cartes du sabot (créé dans main)
+card_counter = None
+
+# Sauvegarde différée du joueur (créée dans main)
+player_saver = None
+
+#: Intervalle minimal entre deux écritures de la sauvegarde, en secondes
+SAVE_INTERVAL = 0.5
+
 # Musique
 MUSIC_FILE = os.path.join(os.path.dirname(__file__), "..", "Indochine - Jai demandé à la lune (Clip officiel).mp3")
 music_enabled = True
@@ -106,6 +172,7 @@ for angle in angles:
 def init_pygame():
     pygame.init()
     pygame.mixer.init()
+    init_fonts()
     pygame.display.set_caption("Blackjack VIP Lounge")
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock = pygame.time.Clock()
@@ -145,25 +212,81 @@ def init_pygame():
     
     return screen, clock
 
+#: Police système de chaque style de texte
+FONT_NAMES = {"serif": "georgia", "sans": "verdana", "title": "impact"}
+#: Police des styles inconnus, et de repli
+FALLBACK_FONT = "arial"
+#: Nombre de polices (style, taille, gras) gardées en cache
+FONT_CACHE_SIZE = 64
+
+# Fichiers de police résolus : (style, gras) -> (chemin, gras simulé)
+_font_faces = {}
+
+def resolve_font(name, bold):
+    """Cherche le fichier d'une police système (recherche coûteuse, faite une fois par style)."""
+    for font_name in (FONT_NAMES.get(name, FALLBACK_FONT), FALLBACK_FONT):
+        path = pygame.font.match_font(font_name, bold=bold)
+        if path:
+            # Sans fichier gras dédié, le gras est simulé, comme le fait SysFont
+            return path, bold and path == pygame.font.match_font(font_name)
+    return None, bold  # police par défaut de pygame
+
+def init_fonts():
+    """Résout au démarrage les fichiers de police de tous les styles."""
+    for name in FONT_NAMES:
+        for bold in (False, True):
+            _font_faces[(name, bold)] = resolve_font(name, bold)
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
 def get_font(name="sans", size=20, bold=False):
-    font_name = "arial"
-    if name == "serif": font_name = "georgia"
-    elif name == "sans": font_name = "verdana"
-    elif name == "title": font_name = "impact"
-    try: return pygame.font.SysFont(font_name, size, bold=bold)
-    except: return pygame.font.SysFont("arial", size, bold=bold)
+    face = _font_faces.get((name, bold))
+    if face is None:
+        face = _font_faces[(name, bold)] = resolve_font(name, bold)
+    path, synthetic_bold = face
+    try: font = pygame.font.Font(path, size)
+    except Exception: font = pygame.font.Font(None, size)
+    if synthetic_bold: font.set_bold(True)
+    return font
+
+#: Nombre de textes rendus gardés en cache
+TEXT_CACHE_SIZE = 256
+
+# Textes rendus : (texte, police, couleur, ombre) -> (surface, largeur, hauteur)
+_text_cache = OrderedDict()
+
+def render_text(text, font, color, shadow=2):
+    """Retourne le texte rendu avec son ombre portée, composés sur une seule surface.
+    
+    La surface est gardée en cache (LRU) : un texte déjà affiché ne coûte qu'un blit.
+    Retourne (surface, largeur, hauteur) ; largeur et hauteur sont celles du texte seul.
+    """
+    color = tuple(color)
+    key = (text, font, color, shadow)
+    entry = _text_cache.get(key)
+    if entry is not None:
+        _text_cache.move_to_end(key)
+        return entry
+    surf = font.render(text, True, color)
+    width, height = surf.get_size()
+    if shadow:
+        composite = pygame.Surface((width + shadow, height + shadow), pygame.SRCALPHA)
+        composite.blit(font.render(text, True, (0, 0, 0)), (shadow, shadow))
+        composite.blit(surf, (0, 0))
+        surf = composite
+    entry = _text_cache[key] = (surf, width, height)
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return entry
 
 def draw_shadow_text(screen, text, font, color, x, y, center=False, topleft=False):
-    shadow = font.render(text, True, (0, 0, 0))
-    surf = font.render(text, True, color)
+    surf, width, height = render_text(text, font, color)
     pos_x, pos_y = x, y
     if center:
-        pos_x = x - surf.get_width() // 2
-        pos_y = y - surf.get_height() // 2
+        pos_x = x - width // 2
+        pos_y = y - height // 2
     elif topleft:
         pass
         
-    screen.blit(shadow, (pos_x + 2, pos_y + 2))
     screen.blit(surf, (pos_x, pos_y))
     return surf.get_rect(topleft=(pos_x, pos_y))
 
@@ -180,6 +303,7 @@ def draw_vip_button(screen, rect, text, is_hover=False, is_active=True):
     
     font = get_font("sans", 22, bold=True)
     draw_shadow_text(screen, text, font, text_color, rect.centerx, rect.centery, center=True)
+    return rect.union(shadow_rect)
 
 
 
@@ -298,12 +422,26 @@ def load_chip_image(filename: str) -> pygame.Surface:
     _image_cache[key] = img
     return img
 
+#: Décalage de l'ombre portée des cartes, en pixels
+CARD_SHADOW_OFFSET = 4
+
+# Cartes avec leur ombre portée déjà composée, par nom de fichier
+_card_sprite_cache: dict[str, pygame.Surface] = {}
+
+def load_card_sprite(filename: str) -> pygame.Surface:
+    """Retourne l'image d'une carte avec son ombre portée, composée une seule fois."""
+    sprite = _card_sprite_cache.get(filename)
+    if sprite is None:
+        img = load_card_image(filename)
+        sprite = pygame.Surface((CARD_W + CARD_SHADOW_OFFSET, CARD_H + CARD_SHADOW_OFFSET), pygame.SRCALPHA)
+        shadow_rect = pygame.Rect(CARD_SHADOW_OFFSET, CARD_SHADOW_OFFSET, CARD_W, CARD_H)
+        pygame.draw.rect(sprite, (0, 0, 0, 80), shadow_rect, border_radius=5)
+        sprite.blit(img, (0, 0))
+        _card_sprite_cache[filename] = sprite
+    return sprite
+
 def draw_card(screen: pygame.Surface, card: Card, x: int, y: int):
-    img = load_card_image(card_filename(card))
-    shadow = pygame.Surface((CARD_W, CARD_H), pygame.SRCALPHA)
-    pygame.draw.rect(shadow, (0, 0, 0, 80), shadow.get_rect(), border_radius=5)
-    screen.blit(shadow, (x + 4, y + 4))
-    screen.blit(img, (x, y))
+    screen.blit(load_card_sprite(card_filename(card)), (x, y))
 
 def draw_back(screen: pygame.Surface, x: int, y: int):
     for name in ["back-side.png", "back.png", "BACK.png"]:
@@ -314,20 +452,52 @@ def draw_back(screen: pygame.Surface, x: int, y: int):
 
 # rendu decor
 
-def render_table_bg(screen: pygame.Surface):
-    screen.fill(COLOR_ROOM_BG)
+# Couches pré-rendues de la table (fond complet, avant de la table), pour le thème courant
+_table_layers = None
+
+def invalidate_table_layers(section=None, values=None):
+    """Oublie les couches de la table (abonné aux sections ui et palette de la configuration)."""
+    global _table_layers
+    _table_layers = None
+
+def build_table_layers(size):
+    """Dessine une fois le fond de la table et l'avant de la table (rebord et feutre)."""
+    width, height = size
     colors = get_table_colors()
     # table ellipse large et aplatie
-    table_rect = pygame.Rect(-200, HEIGHT // 2 - 120, WIDTH + 400, HEIGHT + 200)
-    pygame.draw.ellipse(screen, COLOR_WOOD_RAIL, table_rect)
+    table_rect = pygame.Rect(-200, height // 2 - 120, width + 400, height + 200)
     felt_rect = table_rect.inflate(-60, -60)
-    pygame.draw.ellipse(screen, colors['felt'], felt_rect)
-    pygame.draw.arc(screen, colors['felt_arc'], felt_rect.inflate(-100, -100), 0, 3.14, 2)
     
+    background = pygame.Surface(size).convert()
+    background.fill(COLOR_ROOM_BG)
+    pygame.draw.ellipse(background, COLOR_WOOD_RAIL, table_rect)
+    pygame.draw.ellipse(background, colors['felt'], felt_rect)
+    pygame.draw.arc(background, colors['felt_arc'], felt_rect.inflate(-100, -100), 0, 3.14, 2)
     font_logo = get_font("serif", 40, bold=True)
-    logo_rect = draw_shadow_text(screen, "PRIVÉ LOUNGE", font_logo, (0, 90, 100), WIDTH//2, HEIGHT//2 - 40, center=True)
+    logo_rect = draw_shadow_text(background, "PRIVÉ LOUNGE", font_logo, (0, 90, 100), width//2, height//2 - 40, center=True)
     font_sub = get_font("sans", 16, bold=True)
-    draw_shadow_text(screen, "BLACKJACK PAYS 3 TO 2", font_sub, (0, 140, 150), WIDTH//2, logo_rect.bottom + 5, center=True)
+    draw_shadow_text(background, "BLACKJACK PAYS 3 TO 2", font_sub, (0, 140, 150), width//2, logo_rect.bottom + 5, center=True)
+    
+    # Avant de la table, redessiné par-dessus le croupier pour l'effet de profondeur
+    front = pygame.Surface((width, height - table_rect.top), pygame.SRCALPHA)
+    offset = (0, -table_rect.top)
+    pygame.draw.ellipse(front, COLOR_WOOD_RAIL, table_rect.move(offset))
+    pygame.draw.ellipse(front, colors['felt'], felt_rect.move(offset))
+    return background, front, table_rect.top
+
+def get_table_layers(screen: pygame.Surface):
+    """Retourne les couches de la table, construites au premier appel pour le thème et la taille d'écran."""
+    global _table_layers
+    if _table_layers is None or _table_layers[0].get_size() != screen.get_size():
+        _table_layers = build_table_layers(screen.get_size())
+    return _table_layers
+
+def render_table_bg(screen: pygame.Surface):
+    screen.blit(get_table_layers(screen)[0], (0, 0))
+
+def draw_table_front(screen: pygame.Surface):
+    _, front, top = get_table_layers(screen)
+    screen.blit(front, (0, top))
 
 #  ecrans
 
@@ -338,10 +508,8 @@ def draw_main_menu(screen: pygame.Surface, player: Player, play_rect, settings_r
     screen.blit(glow, (0,0))
 
     font_title = get_font("serif", 110, bold=True)
-    title = font_title.render("BLACKJACK", True, COLOR_GOLD)
-    shad = font_title.render("BLACKJACK", True, (0,0,0))
-    screen.blit(shad, (WIDTH//2 - shad.get_width()//2 + 6, 96))
-    screen.blit(title, (WIDTH//2 - title.get_width()//2, 90))
+    title, title_w, _ = render_text("BLACKJACK", font_title, COLOR_GOLD, shadow=6)
+    screen.blit(title, (WIDTH//2 - title_w//2, 90))
 
     if player.total_hands > 0:
         bar_rect = pygame.Rect(WIDTH//2 - 300, 250, 600, 40)
@@ -353,14 +521,18 @@ def draw_main_menu(screen: pygame.Surface, player: Player, play_rect, settings_r
         draw_shadow_text(screen, info, get_font("sans", 18), COLOR_TEXT_GREY, WIDTH//2, 270, center=True)
 
     mouse_pos = pygame.mouse.get_pos()
-    draw_vip_button(screen, play_rect, "JOUER", play_rect.collidepoint(mouse_pos))
-    draw_vip_button(screen, settings_rect, "PARAMÈTRES", settings_rect.collidepoint(mouse_pos))
-    draw_vip_button(screen, stats_rect, "STATISTIQUES", stats_rect.collidepoint(mouse_pos))
-    draw_vip_button(screen, clicker_rect, "CLICKER", clicker_rect.collidepoint(mouse_pos))
+    return [
+        draw_vip_button(screen, play_rect, "JOUER", play_rect.collidepoint(mouse_pos)),
+        draw_vip_button(screen, settings_rect, "PARAMÈTRES", settings_rect.collidepoint(mouse_pos)),
+        draw_vip_button(screen, stats_rect, "STATISTIQUES", stats_rect.collidepoint(mouse_pos)),
+        draw_vip_button(screen, clicker_rect, "CLICKER", clicker_rect.collidepoint(mouse_pos)),
+    ]
 
 
 def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_revealed: bool, chips, seats):
     render_table_bg(screen)
+    # Zones modifiables sans changer d'état : mains du joueur, boutons, panneaux
+    dirty = []
     
     #  Croupier
     DEALER_Y = 60
@@ -433,11 +605,7 @@ def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_
         screen.blit(dealer_img_to_show, (dealer_img_x, dealer_img_y))
         
         # Redessiner l'arc de cercle marron par-dessus pour l'effet de profondeur
-        colors = get_table_colors()
-        table_rect = pygame.Rect(-200, HEIGHT // 2 - 120, WIDTH + 400, HEIGHT + 200)
-        pygame.draw.ellipse(screen, COLOR_WOOD_RAIL, table_rect)
-        felt_rect = table_rect.inflate(-60, -60)
-        pygame.draw.ellipse(screen, colors['felt'], felt_rect)
+        draw_table_front(screen)
 
     # Mode multi-places
     if game.active_seats:
@@ -483,10 +651,12 @@ def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_
             lbl_y = base_hand_y + CARD_H + 15
             bg_lbl = pygame.Rect(hand_x, lbl_y, 100, 28)
             pygame.draw.rect(screen, (0,0,0,180), bg_lbl, border_radius=10)
-            draw_shadow_text(screen, res_txt, get_font("sans", 16, True), color_res, bg_lbl.centerx, bg_lbl.centery, center=True)
+            res_rect = draw_shadow_text(screen, res_txt, get_font("sans", 16, True), color_res, bg_lbl.centerx, bg_lbl.centery, center=True)
             
             bet = game.seat_bets[seat_idx]
-            draw_shadow_text(screen, f"${bet}", get_font("sans", 14), COLOR_GOLD, bg_lbl.centerx, bg_lbl.bottom + 10, center=True)
+            bet_rect = draw_shadow_text(screen, f"${bet}", get_font("sans", 14), COLOR_GOLD, bg_lbl.centerx, bg_lbl.bottom + 10, center=True)
+            hand_rect = pygame.Rect(hand_x - 10, base_hand_y - 10, total_cards_width + 20, CARD_H + 20)
+            dirty.append(hand_rect.unionall([bg_lbl, res_rect, bet_rect]))
     
     # Mode single-seat (fallback)
     else:
@@ -533,18 +703,21 @@ def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_
             lbl_y = base_hand_y + CARD_H + 15
             bg_lbl = pygame.Rect(hand_x, lbl_y, 100, 28)
             pygame.draw.rect(screen, (0,0,0,180), bg_lbl, border_radius=10)
-            draw_shadow_text(screen, res_txt, get_font("sans", 16, True), color_res, bg_lbl.centerx, bg_lbl.centery, center=True)
+            res_rect = draw_shadow_text(screen, res_txt, get_font("sans", 16, True), color_res, bg_lbl.centerx, bg_lbl.centery, center=True)
             
             bet = game.hand_bets[i]
-            draw_shadow_text(screen, f"${bet}", get_font("sans", 14), COLOR_GOLD, bg_lbl.centerx, bg_lbl.bottom + 10, center=True)
+            bet_rect = draw_shadow_text(screen, f"${bet}", get_font("sans", 14), COLOR_GOLD, bg_lbl.centerx, bg_lbl.bottom + 10, center=True)
+            hand_rect = pygame.Rect(hand_x - 10, base_hand_y - 10, len(hand.cards) * card_spacing + CARD_W + 20, CARD_H + 20)
+            dirty.append(hand_rect.unionall([bg_lbl, res_rect, bet_rect]))
 
 
     #  Message Central
     if game.state == GameState.RESULT_SCREEN:
         msg = game.get_status_message()
         font_big = get_font("serif", 48, bold=True)
-        s = font_big.render(msg, True, COLOR_GOLD)
-        r = s.get_rect(center=(WIDTH//2, HEIGHT//2))
+        s, msg_w, msg_h = render_text(msg, font_big, COLOR_GOLD, shadow=0)
+        r = pygame.Rect(0, 0, msg_w, msg_h)
+        r.center = (WIDTH//2, HEIGHT//2)
         bg = r.inflate(40, 20)
         pygame.draw.rect(screen, (0,0,0, 220), bg, border_radius=20)
         pygame.draw.rect(screen, COLOR_GOLD, bg, 2, border_radius=20)
@@ -554,7 +727,7 @@ def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_
         mouse_pos = pygame.mouse.get_pos()
         replay_button = pygame.Rect(WIDTH//2 - 150, r.bottom + 40, 300, 60)
         is_hover = replay_button.collidepoint(mouse_pos)
-        draw_vip_button(screen, replay_button, "NOUVELLE PARTIE", is_hover, is_active=True)
+        dirty.append(draw_vip_button(screen, replay_button, "NOUVELLE PARTIE", is_hover, is_active=True))
         game.replay_button = replay_button
 
     # Barre d'actions avec boutons cliquables
@@ -586,15 +759,72 @@ def draw_game_screen(screen: pygame.Surface, game: Game, player: Player, dealer_
             button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
             is_hover = button_rect.collidepoint(mouse_pos)
             
-            draw_vip_button(screen, button_rect, label, is_hover, is_active=True)
+            dirty.append(draw_vip_button(screen, button_rect, label, is_hover, is_active=True))
             game.action_buttons.append((button_rect, action))
 
+    # Probabilités du croupier (calcul exact sur les cartes non vues)
+    if game.state == GameState.PLAYER_TURN and SHOW_PROBABILITIES.value:
+        dirty.append(draw_dealer_probabilities(screen, game))
+
+    # Compte des cartes, tenu au fil des tirages par le compteur du sabot
+    if card_counter is not None and SHOW_COUNT.value:
+        dirty.append(draw_card_count(screen, game, dealer_revealed))
+
+    # Conseil de stratégie de base (lecture directe dans la table)
+    if game.state == GameState.PLAYER_TURN and SHOW_HINTS.value:
+        dirty.append(draw_strategy_hint(screen, game))
+
     #  Solde 
     panel = pygame.Rect(20, HEIGHT - 50, 200, 40)
     pygame.draw.rect(screen, (20, 25, 30), panel, border_radius=10)
     pygame.draw.rect(screen, COLOR_WOOD_RAIL, panel, 2, border_radius=10)
     draw_shadow_text(screen, f"SOLDE: ${player.balance}", get_font("sans", 18, True), COLOR_GOLD, panel.centerx, panel.centery, center=True)
+    dirty.append(panel)
+    return dirty
+
+
+
+def draw_dealer_probabilities(screen: pygame.Surface, game: Game):
+    """Affiche la distribution du total final du croupier"""
+    probs = game_dealer_probabilities(game)
+    panel = pygame.Rect(WIDTH - 260, 20, 240, 110)
+    pygame.draw.rect(screen, (20, 25, 30), panel, border_radius=10)
+    pygame.draw.rect(screen, COLOR_WOOD_RAIL, panel, 2, border_radius=10)
+    draw_shadow_text(screen, "CROUPIER", get_font("sans", 14, True), COLOR_GOLD, panel.centerx, panel.y + 18, center=True)
+    draw_shadow_text(screen, f"BUST {probs['bust']:.0%}", get_font("sans", 20, True), COLOR_WIN, panel.centerx, panel.y + 48, center=True)
+    totals = "  ".join(f"{t}:{probs[t]:.0%}" for t in (17, 18, 19, 20, 21))
+    draw_shadow_text(screen, totals, get_font("sans", 13), COLOR_TEXT_WHITE, panel.centerx, panel.y + 82, center=True)
+    return panel
+
 
+#: Libellés des conseils, par action recommandée
+HINT_LABELS = {"hit": "TIRER", "stand": "RESTER", "double": "DOUBLER", "split": "SPLIT", "surrender": "ABANDON"}
+
+
+def draw_strategy_hint(screen: pygame.Surface, game: Game):
+    """Affiche l'action conseillée par la stratégie de base"""
+    # Table pas encore prête (générée en fond au premier lancement)
+    strategy = get_basic_strategy(game.deck.num_decks, wait=False)
+    label = HINT_LABELS[strategy.decide(game).value] if strategy is not None else "..."
+    panel = pygame.Rect(WIDTH - 260, 140, 240, 50)
+    pygame.draw.rect(screen, (20, 25, 30), panel, border_radius=10)
+    pygame.draw.rect(screen, COLOR_WOOD_RAIL, panel, 2, border_radius=10)
+    draw_shadow_text(screen, f"CONSEIL : {label}", get_font("sans", 18, True), COLOR_GOLD, panel.centerx, panel.centery, center=True)
+    return panel
+
+
+def draw_card_count(screen: pygame.Surface, game: Game, dealer_revealed: bool):
+    """Affiche le compte courant et le compte vrai du sabot"""
+    running = card_counter.running_count
+    # La carte cachée du croupier est comptée au tirage : on la retire tant qu'elle est cachée
+    if not dealer_revealed and len(game.dealer_hand.cards) > 1 and game.state in [GameState.INITIAL_DEAL, GameState.PLAYER_TURN]:
+        running -= card_counter.weight(game.dealer_hand.cards[1])
+    true_count = running / card_counter.decks_remaining if card_counter.system.balanced else running
+    panel = pygame.Rect(WIDTH - 260, 200, 240, 50)
+    pygame.draw.rect(screen, (20, 25, 30), panel, border_radius=10)
+    pygame.draw.rect(screen, COLOR_WOOD_RAIL, panel, 2, border_radius=10)
+    draw_shadow_text(screen, f"{card_counter.system.name}  RC {running:+d}  TC {true_count:+.1f}", get_font("sans", 16, True), COLOR_TEXT_WHITE, panel.centerx, panel.centery, center=True)
+    return panel
 
 
 def draw_bet_screen(screen: pygame.Surface, game: Game, player: Player, chips, seats, start_button_rect):
@@ -608,15 +838,13 @@ def draw_bet_screen(screen: pygame.Surface, game: Game, player: Player, chips, s
         screen.blit(dealer_image_surface, (dealer_img_x, dealer_img_y))
         
         # Redessiner l'arc de cercle marron par-dessus pour l'effet de profondeur
-        colors = get_table_colors()
-        table_rect = pygame.Rect(-200, HEIGHT // 2 - 120, WIDTH + 400, HEIGHT + 200)
-        pygame.draw.ellipse(screen, COLOR_WOOD_RAIL, table_rect)
-        felt_rect = table_rect.inflate(-60, -60)
-        pygame.draw.ellipse(screen, colors['felt'], felt_rect)
+        draw_table_front(screen)
     
     draw_shadow_text(screen, "CHOISISSEZ VOTRE PLACE & MISE", get_font("serif", 40, True), COLOR_GOLD, WIDTH//2, 50, center=True)
 
     mouse_pos = pygame.mouse.get_pos()
+    # Zones modifiables pendant la mise : places, mise totale, bouton, jetons, solde
+    dirty = []
 
     # Sieges - afficher les mises sur chaque place
     for i, seat in enumerate(SEAT_POSITIONS):
@@ -646,11 +874,12 @@ def draw_bet_screen(screen: pygame.Surface, game: Game, player: Player, chips, s
             col_txt = (100, 100, 100)
             
         draw_shadow_text(screen, f"P{i+1}", get_font("sans", 20, True), col_txt, cx, cy, center=True)
+        dirty.append(pygame.Rect(cx - rad, cy - rad, rad * 2, rad * 2).union(rect))
         
         # Afficher la mise sur cette place
         if has_bet:
             bet_y = cy + 50
-            draw_shadow_text(screen, f"${game.seat_bets[i]}", get_font("sans", 16, True), COLOR_GOLD, cx, bet_y, center=True)
+            dirty.append(draw_shadow_text(screen, f"${game.seat_bets[i]}", get_font("sans", 16, True), COLOR_GOLD, cx, bet_y, center=True))
 
     # Zone de contrôle bas
     
@@ -661,25 +890,29 @@ def draw_bet_screen(screen: pygame.Surface, game: Game, player: Player, chips, s
         bet_text = f"MISE TOTALE: ${total_bet} ({active_seats} place{'s' if active_seats > 1 else ''})"
     else:
         bet_text = "Sélectionnez une place et ajoutez des jetons"
-    draw_shadow_text(screen, bet_text, get_font("sans", 24, True), COLOR_TEXT_WHITE, WIDTH//2, HEIGHT - 180, center=True)
+    dirty.append(draw_shadow_text(screen, bet_text, get_font("sans", 24, True), COLOR_TEXT_WHITE, WIDTH//2, HEIGHT - 180, center=True))
     
     # bouton distribuer
     is_valid = total_bet > 0
-    draw_vip_button(screen, start_button_rect, "DISTRIBUER", start_button_rect.collidepoint(mouse_pos), is_active=is_valid)
+    dirty.append(draw_vip_button(screen, start_button_rect, "DISTRIBUER", start_button_rect.collidepoint(mouse_pos), is_active=is_valid))
     
     # jetons 
     for chip in chips:
+        glow_rect = pygame.Rect(chip["rect"].centerx - 47, chip["rect"].centery - 47, 95, 95)
         if chip["rect"].collidepoint(mouse_pos):
             glow = pygame.Surface((95, 95), pygame.SRCALPHA)
             pygame.draw.circle(glow, (255, 255, 255, 40), (47, 47), 47)
-            screen.blit(glow, (chip["rect"].centerx - 47, chip["rect"].centery - 47))
+            screen.blit(glow, glow_rect)
         screen.blit(chip["image"], chip["rect"])
+        dirty.append(glow_rect.union(chip["rect"]))
 
     # Afficher le solde en haut à gauche pour qu'il soit toujours visible
     solde_panel = pygame.Rect(20, 20, 200, 40)
     pygame.draw.rect(screen, (20, 25, 30), solde_panel, border_radius=10)
     pygame.draw.rect(screen, COLOR_WOOD_RAIL, solde_panel, 2, border_radius=10)
     draw_shadow_text(screen, f"SOLDE: ${player.balance}", get_font("sans", 18, True), COLOR_GOLD, solde_panel.centerx, solde_panel.centery, center=True)
+    dirty.append(solde_panel)
+    return dirty
 
 
 def draw_settings_screen(screen: pygame.Surface, game: Game):
@@ -690,7 +923,6 @@ def draw_settings_screen(screen: pygame.Surface, game: Game):
     
     draw_shadow_text(screen, "PARAMÈTRES", get_font("serif", 40, True), COLOR_GOLD, WIDTH//2, 120, center=True)
     
-    config = get_config_manager()
     mouse_pos = pygame.mouse.get_pos()
     
     y_start = 220
@@ -703,14 +935,14 @@ def draw_settings_screen(screen: pygame.Surface, game: Game):
     
     # 1. Musique ON/OFF
     music_rect = pygame.Rect(x_center, y_start, control_width, control_height)
-    music_on = config.get('features.music_enabled', True)
+    music_on = MUSIC_ENABLED.value
     music_hover = music_rect.collidepoint(mouse_pos)
     draw_toggle_button(screen, music_rect, music_on, "Musique", music_hover)
     controls.append(('toggle', 'features.music_enabled', music_rect))
     
     # 2. Volume de la musique
     volume_rect = pygame.Rect(x_center, y_start + y_spacing, control_width, control_height)
-    volume = config.get('features.music_volume', 0.5)
+    volume = MUSIC_VOLUME.value
     volume_hover = volume_rect.collidepoint(mouse_pos)
     draw_slider(screen, volume_rect, volume, 0.0, 1.0, "Volume", False, volume_hover)
     controls.append(('slider', 'features.music_volume', volume_rect, 0.0, 1.0))
@@ -724,7 +956,7 @@ def draw_settings_screen(screen: pygame.Surface, game: Game):
     # 4. Thème de la table
     theme_rect = pygame.Rect(x_center, y_start + y_spacing * 3, control_width, control_height)
     themes = ["Vert", "Bleu", "Rouge", "Noir"]
-    current_theme = config.get('ui.table_theme', 'green')
+    current_theme = TABLE_THEME.value
     theme_map = {"green": 0, "blue": 1, "red": 2, "black": 3}
     theme_index = theme_map.get(current_theme, 0)
     theme_hover = theme_rect.collidepoint(mouse_pos)
@@ -734,6 +966,8 @@ def draw_settings_screen(screen: pygame.Surface, game: Game):
     game.settings_controls = controls
     
     draw_shadow_text(screen, "ESC pour retour", get_font("sans", 18), COLOR_TEXT_GREY, WIDTH//2, 620, center=True)
+    # Tous les contrôles sont dans le cadre
+    return [box]
 
 
 def draw_stats_screen(screen: pygame.Surface, player: Player):
@@ -755,6 +989,8 @@ def draw_stats_screen(screen: pygame.Surface, player: Player):
     draw_stat("Blackjacks", player.blackjacks, grid_x + spacing_x//2, grid_y + spacing_y//2, COLOR_GOLD_LIGHT)
 
     draw_shadow_text(screen, "ESC pour retour", get_font("sans", 18), COLOR_TEXT_GREY, WIDTH//2, HEIGHT - 50, center=True)
+    # Écran fixe : aucune zone à rafraîchir tant qu'il reste affiché
+    return []
 
 
 def draw_clicker_screen(screen: pygame.Surface, player: Player, click_button_rect, total_clicks):
@@ -767,11 +1003,11 @@ def draw_clicker_screen(screen: pygame.Surface, player: Player, click_button_rec
     
     # Affichage du solde actuel
     balance_text = f"Solde: ${player.balance}"
-    draw_shadow_text(screen, balance_text, get_font("serif", 40, True), COLOR_GOLD_LIGHT, WIDTH//2, 220, center=True)
+    balance_rect = draw_shadow_text(screen, balance_text, get_font("serif", 40, True), COLOR_GOLD_LIGHT, WIDTH//2, 220, center=True)
     
     # Affichage du nombre de clics
     clicks_text = f"Clics: {total_clicks}"
-    draw_shadow_text(screen, clicks_text, get_font("sans", 28), COLOR_TEXT_WHITE, WIDTH//2, 280, center=True)
+    clicks_rect = draw_shadow_text(screen, clicks_text, get_font("sans", 28), COLOR_TEXT_WHITE, WIDTH//2, 280, center=True)
     
     # Bouton de clic géant
     mouse_pos = pygame.mouse.get_pos()
@@ -796,6 +1032,7 @@ def draw_clicker_screen(screen: pygame.Surface, player: Player, click_button_rec
     # Instructions
     draw_shadow_text(screen, "Cliquez sur le bouton pour gagner 1$ par clic!", get_font("sans", 20), COLOR_TEXT_GREY, WIDTH//2, HEIGHT - 120, center=True)
     draw_shadow_text(screen, "ESC pour retour au menu", get_font("sans", 18), COLOR_TEXT_GREY, WIDTH//2, HEIGHT - 50, center=True)
+    return [balance_rect, clicks_rect, click_button_rect.union(click_button_rect.move(0, shadow_offset))]
 
 
 #  main loop
@@ -818,7 +1055,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
                 if click_button_rect.collidepoint(pos):
                     player.earn_money(1)
                     total_clicks += 1
-                    player.save()  # Sauvegarder après chaque clic
+                    save_player(player)  # Sauvegarder après chaque clic
             
             elif game.state == GameState.PLAYER_TURN:
                 # Gestion des clics sur les boutons d'action
@@ -892,7 +1129,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
                                         if os.path.exists(MUSIC_FILE):
                                             try:
                                                 pygame.mixer.music.load(MUSIC_FILE)
-                                                pygame.mixer.music.set_volume(config.get('features.music_volume', 0.5))
+                                                pygame.mixer.music.set_volume(MUSIC_VOLUME.value)
                                                 pygame.mixer.music.play(-1)
                                             except: pass
                                     else:  # On vient de la désactiver
@@ -925,7 +1162,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
                                 if config_key == 'reset_stats':
                                     # Réinitialiser les statistiques du joueur
                                     player.reset_stats()
-                                    player.save()
+                                    save_player(player)
 
 
         
@@ -954,6 +1191,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
 
         
         if event.type == pygame.MOUSEBUTTONUP:
+            # Le sauvegardeur différé écrit une seule fois après le geste
             if hasattr(game, 'dragging_slider'):
                 game.dragging_slider = None
 
@@ -962,7 +1200,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
                 if game.state == GameState.MENU: pygame.quit(); sys.exit()
                 elif game.state == GameState.CLICKER: 
                     game.state = GameState.MENU
-                    player.save()  # Sauvegarder avant de quitter le clicker
+                    save_player(player)  # Sauvegarder avant de quitter le clicker
                 else: game.state = GameState.MENU
             
             # Toggle musique dans les paramètres
@@ -973,7 +1211,7 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
                     if os.path.exists(MUSIC_FILE):
                         try:
                             pygame.mixer.music.load(MUSIC_FILE)
-                            pygame.mixer.music.set_volume(config.get('features.music_volume', 0.5))
+                            pygame.mixer.music.set_volume(MUSIC_VOLUME.value)
                             pygame.mixer.music.play(-1)
                         except: pass
                 else:
@@ -982,10 +1220,70 @@ def handle_input(game: Game, player: Player, chips, play_rect, sett_rect, stat_r
             # Les commandes clavier pour les actions de jeu ont été remplacées par des boutons cliquables
     return start_round, total_clicks
 
+def hand_record(res, bet, hand, game, **extra):
+    """Décrit une main terminée pour l'historique (StatsManager.record_round)."""
+    blackjack = hand.is_blackjack()
+    if res == GameResult.PLAYER_WIN:
+        result, amount = "win", int(bet * (1.5 if blackjack else 1.0))
+    elif res == GameResult.DEALER_WIN:
+        result, amount = "loss", -bet
+    else:
+        result, amount = "push", 0
+    return {"result": result, "bet": bet, "amount": amount, "blackjack": blackjack,
+            "player_value": hand.get_value(), "dealer_value": game.dealer_hand.get_value(),
+            **extra}
+
+def save_player(player: Player):
+    """Programme la sauvegarde du joueur sans écrire sur le disque dans la boucle d'affichage."""
+    if player_saver is None:
+        player.save()
+    else:
+        player_saver.schedule(player.to_dict())
+
+def init_storage():
+    """Active le stockage SQLite si la configuration le demande (storage.backend)."""
+    config = get_config_manager()
+    if config.get('storage.backend', 'json') != 'sqlite':
+        return
+    try:
+        # Chemin relatif de la configuration : résolu depuis le répertoire des données
+        store = SQLiteStore(os.path.join(DATA_DIR, config.get('storage.database', DB_FILE)))
+    except Exception as e:
+        print(f"Erreur lors de l'ouverture de la base: {e}")
+        return
+    Player.store = store
+    StatsManager.use_store(store)
+    atexit.register(store.close)
+
 def main():
     screen, clock = init_pygame()
+    init_storage()
     player = Player.load()
-    game = Game(num_decks=1)
+    # Écritures fusionnées dans un thread de fond, dernière écriture à la sortie
+    global player_saver
+    player_saver = WriteBehindSaver(Player.save_data, interval=SAVE_INTERVAL)
+    num_decks = get_config_manager().get('game.num_decks', 1)
+    # Carte de coupe et sabot suivant préparé en fond : le remélange
+    # se fait entre deux manches, sans bloquer l'affichage
+    game = Game(num_decks=num_decks,
+                penetration=get_config_manager().get('game.penetration', 0.75),
+                background_shuffle=True)
+    # Table de stratégie chargée (ou générée) en fond : le premier lancement n'attend pas
+    get_basic_strategy(num_decks, wait=False)
+    # Compteur de cartes abonné au sabot (aucun parcours du sabot à l'affichage)
+    global card_counter
+    card_counter = CardCounter(SYSTEMS.get(get_config_manager().get('features.count_system', 'Hi-Lo'), SYSTEMS['Hi-Lo']), game.deck)
+    # Timing et couleurs appliqués au démarrage puis à chaque modification
+    config = get_config_manager()
+    apply_timing('timing', config.get('timing'))
+    apply_palette('palette', config.get('palette'))
+    config.subscribe(apply_timing, 'timing')
+    config.subscribe(apply_palette, 'palette')
+    # Fond de table pré-rendu, reconstruit après un changement de thème ou de couleurs
+    config.subscribe(invalidate_table_layers, 'ui')
+    config.subscribe(invalidate_table_layers, 'palette')
+    if config.get('features.watch_config', False):
+        config.watch()
     
     btn_w, btn_h = 280, 60
     play_rect = pygame.Rect(WIDTH//2 - btn_w//2, 380, btn_w, btn_h)
@@ -1009,9 +1307,17 @@ def main():
         chips.append({"value": val, "image": img, "rect": r})
         
     start_rect = pygame.Rect(WIDTH//2 - 120, HEIGHT - 160, 240, 50)
+    # Signature et zones dynamiques de la dernière image affichée
+    last_signature = None
+    last_dirty = None
 
     while True:
         dt = clock.tick(FPS) / 1000.0
+        # Rien ne bouge sans entrée : l'affichage ne dépend que des événements et de l'état
+        had_input = pygame.event.peek()
+        exposed = pygame.event.peek(pygame.VIDEOEXPOSE)
+        # Sections rechargées par la surveillance du fichier, appliquées entre deux images
+        config.dispatch_pending()
         game.update(dt)
         should_start, total_clicks = handle_input(game, player, chips, play_rect, sett_rect, stat_rect, clicker_rect, start_rect, click_button_rect, total_clicks)
         
@@ -1025,14 +1331,15 @@ def main():
                 game.deal_initial_cards()
             
         ct = game.frame_counter
-        if game.state == GameState.INITIAL_DEAL and ct > 1.0: game.state = GameState.PLAYER_TURN
-        if game.state == GameState.DEALER_REVEAL and ct - game.last_action_time > 1.0:
+        if game.state == GameState.INITIAL_DEAL and ct > TIMING['initial_deal_duration']: game.state = GameState.PLAYER_TURN
+        if game.state == GameState.DEALER_REVEAL and ct - game.last_action_time > TIMING['dealer_reveal_duration']:
             game.state = GameState.DEALER_TURN; game.dealer_play()
-        if game.state == GameState.DEALER_TURN and ct - game.last_action_time > 1.0:
+        if game.state == GameState.DEALER_TURN and ct - game.last_action_time > TIMING['dealer_turn_duration']:
             game.state = GameState.RESULT_SCREEN
             
         if game.state == GameState.RESULT_SCREEN and not getattr(game, "money_processed", False):
             game.money_processed = True
+            round_hands = []  # historique de la manche, écrit en une fois
             
             # Multi-seat: traiter chaque place active
             if game.active_seats:
@@ -1048,8 +1355,11 @@ def main():
                         player.lose_hand(bet)
                     else:
                         player.push_hand()
+                    round_hands.append(hand_record(res, bet, hand, game, seat=seat_idx))
             elif game.has_surrendered:
                 player.lose_hand(game.player_bet // 2)
+                round_hands.append({"result": "loss", "bet": game.player_bet,
+                                    "amount": -(game.player_bet // 2), "surrender": True})
             elif len(game.hands) > 1:
                 for i, h in enumerate(game.hands):
                     res = game.hand_results[i]; bet = game.hand_bets[i]
@@ -1058,6 +1368,7 @@ def main():
                         player.win_hand(int(bet * mult))
                     elif res == GameResult.DEALER_WIN: player.lose_hand(bet)
                     else: player.push_hand()
+                    round_hands.append(hand_record(res, bet, h, game))
             else:
                 res = game.result
                 if res == GameResult.PLAYER_WIN:
@@ -1065,19 +1376,34 @@ def main():
                     player.win_hand(int(game.hand_bets[0] * mult))
                 elif res == GameResult.DEALER_WIN: player.lose_hand(game.hand_bets[0])
                 else: player.push_hand()
-            player.save()
+                round_hands.append(hand_record(res, game.hand_bets[0], game.hands[0], game))
+            StatsManager.record_round(round_hands)
+            save_player(player)
             
         if game.state != GameState.RESULT_SCREEN:
             game.money_processed = False
 
-        if game.state == GameState.MENU: draw_main_menu(screen, player, play_rect, sett_rect, stat_rect, clicker_rect)
-        elif game.state == GameState.CLICKER: draw_clicker_screen(screen, player, click_button_rect, total_clicks)
-        elif game.state == GameState.BETTING: draw_bet_screen(screen, game, player, chips, SEAT_POSITIONS, start_rect)
-        elif game.state == GameState.SETTINGS: draw_settings_screen(screen, game)
-        elif game.state == GameState.STATS: draw_stats_screen(screen, player)
-        else: draw_game_screen(screen, game, player, game.state in [GameState.DEALER_TURN, GameState.RESULT_SCREEN], chips, SEAT_POSITIONS)
+        # Image identique à la précédente (aucune entrée, même état, même configuration,
+        # table de stratégie toujours dans le même état de chargement) : sautée
+        signature = (game.state, config.version,
+                     get_basic_strategy(game.deck.num_decks, wait=False) is not None)
+        if DIRTY_RENDERING.value and not had_input and signature == last_signature:
+            continue
+
+        if game.state == GameState.MENU: dirty = draw_main_menu(screen, player, play_rect, sett_rect, stat_rect, clicker_rect)
+        elif game.state == GameState.CLICKER: dirty = draw_clicker_screen(screen, player, click_button_rect, total_clicks)
+        elif game.state == GameState.BETTING: dirty = draw_bet_screen(screen, game, player, chips, SEAT_POSITIONS, start_rect)
+        elif game.state == GameState.SETTINGS: dirty = draw_settings_screen(screen, game)
+        elif game.state == GameState.STATS: dirty = draw_stats_screen(screen, player)
+        else: dirty = draw_game_screen(screen, game, player, game.state in [GameState.DEALER_TURN, GameState.RESULT_SCREEN], chips, SEAT_POSITIONS)
         
-        pygame.display.flip()
+        # Même écran : seules les zones dynamiques, anciennes et nouvelles, sont envoyées ;
+        # changement d'écran ou de configuration : image complète
+        if DIRTY_RENDERING.value and signature == last_signature and last_dirty is not None and not exposed:
+            pygame.display.update(last_dirty + dirty)
+        else:
+            pygame.display.flip()
+        last_signature, last_dirty = signature, dirty
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
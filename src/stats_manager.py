@@ -1,31 +1,79 @@
 """
 Gestionnaire de statistiques avancées pour le Blackjack.
 Permet d'enregistrer, analyser et exporter les stats du joueur.
+
+L'historique des mains est un journal JSON Lines (une main par ligne) :
+ajouter une main est un simple ajout en fin de fichier, et la lecture se
+fait en flux, ligne par ligne. La fenêtre de rétention (MAX_HISTORY mains)
+est appliquée par un compactage périodique dans un thread de fond. Les
+mains enregistrées sont écrites par un WriteBehindSaver : la boucle
+d'affichage ne touche jamais au disque.
+
+Avec un stockage SQLite (``StatsManager.use_store``), l'historique est
+écrit dans la base : il n'est plus limité et les agrégats sont calculés
+par SQL. La ligne du joueur (table players) appartient alors à Player,
+seul à l'écrire ; les stats de StatsManager sont agrégées depuis les mains.
 """
 
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+
+from core.persistence import (DEFAULT_BACKUPS, WriteBehindSaver, atomic_write,
+                              atomic_write_json, load_json)
+
+#: Répertoire des fichiers de stats (parent de src, comme Player.SAVE_FILE)
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
 
 class StatsManager:
     """Gère les statistiques détaillées du joueur."""
     
-    STATS_FILE = "player_stats.json"
-    HISTORY_FILE = "player_history.json"
+    STATS_FILE = os.path.join(DATA_DIR, "player_stats.json")
+    HISTORY_FILE = os.path.join(DATA_DIR, "player_history.jsonl")
+    #: Ancien historique (liste JSON complète), migré au premier accès
+    LEGACY_HISTORY_FILE = os.path.join(DATA_DIR, "player_history.json")
+    #: Nombre de mains conservées dans l'historique
+    MAX_HISTORY = 1000
+    #: Lignes tolérées au-delà de MAX_HISTORY avant un compactage
+    COMPACTION_SLACK = 500
+    
+    _history_lock = threading.RLock()
+    _history_lines: Optional[int] = None
+    _compaction: Optional[threading.Thread] = None
+    #: Mains en attente d'écriture, et le thread qui les écrit
+    _pending_hands: List[Dict[str, Any]] = []
+    _pending_lock = threading.Lock()
+    _history_saver: Optional[WriteBehindSaver] = None
+    #: Stockage SQLite actif (None : fichiers JSON)
+    _store = None
+    
+    @staticmethod
+    def use_store(store) -> None:
+        """Active un stockage SQLite à la place des fichiers JSON.
+        
+        Args:
+            store (SQLiteStore): Base à utiliser, ou None pour revenir aux fichiers
+        """
+        StatsManager._store = store
     
     @staticmethod
     def load_stats() -> Dict[str, Any]:
-        """Charge les statistiques du fichier JSON."""
-        if os.path.exists(StatsManager.STATS_FILE):
-            try:
-                with open(StatsManager.STATS_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Erreur lors du chargement des stats: {e}")
-                return StatsManager.get_default_stats()
-        return StatsManager.get_default_stats()
+        """Charge les statistiques du fichier JSON.
+        
+        Avec SQLite, les stats sont agrégées depuis l'historique de la base.
+        """
+        if StatsManager._store is not None:
+            StatsManager.flush_history()
+            return StatsManager._store.stats()
+        # Un fichier tronqué est remplacé par sa dernière copie de secours
+        stats = load_json(StatsManager.STATS_FILE)
+        if stats is None:
+            return StatsManager.get_default_stats()
+        return stats
     
     @staticmethod
     def get_default_stats() -> Dict[str, Any]:
@@ -45,46 +93,163 @@ class StatsManager:
     
     @staticmethod
     def save_stats(stats: Dict[str, Any]) -> None:
-        """Sauvegarde les statistiques dans le fichier JSON."""
+        """Sauvegarde les statistiques dans le fichier JSON.
+        
+        Avec SQLite, rien n'est écrit : la ligne du joueur appartient à
+        Player (``Player.save_data``) et les stats sont calculées depuis
+        l'historique.
+        """
+        if StatsManager._store is not None:
+            return
         stats["updated_at"] = datetime.now().isoformat()
         try:
-            with open(StatsManager.STATS_FILE, 'w') as f:
-                json.dump(stats, f, indent=2)
+            atomic_write_json(StatsManager.STATS_FILE, stats, backups=DEFAULT_BACKUPS)
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des stats: {e}")
     
+    @staticmethod
+    def _migrate_legacy_history() -> None:
+        """Convertit l'ancien historique JSON en journal JSON Lines."""
+        legacy = StatsManager.LEGACY_HISTORY_FILE
+        if not os.path.exists(legacy) or os.path.exists(StatsManager.HISTORY_FILE):
+            return
+        try:
+            with open(legacy, 'r') as f:
+                history = json.load(f)
+            atomic_write(StatsManager.HISTORY_FILE, lambda f: f.writelines(
+                json.dumps(hand_data, separators=(',', ':')) + "\n"
+                for hand_data in history[-StatsManager.MAX_HISTORY:]))
+            os.remove(legacy)
+        except Exception as e:
+            print(f"Erreur lors de la migration de l'historique: {e}")
+    
+    @staticmethod
+    def iter_history() -> Iterator[Dict[str, Any]]:
+        """Parcourt l'historique en flux, de la plus ancienne main à la plus récente.
+        
+        Les mains en attente d'écriture sont d'abord écrites. Les lignes
+        illisibles (par exemple une écriture interrompue) sont ignorées.
+        """
+        StatsManager.flush_history()
+        if StatsManager._store is not None:
+            yield from StatsManager._store.iter_history()
+            return
+        yield from StatsManager._read_history_file()
+    
+    @staticmethod
+    def _read_history_file() -> Iterator[Dict[str, Any]]:
+        """Parcourt le journal JSON Lines tel qu'il est sur le disque."""
+        StatsManager._migrate_legacy_history()
+        if not os.path.exists(StatsManager.HISTORY_FILE):
+            return
+        try:
+            with open(StatsManager.HISTORY_FILE, 'r') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError as e:
+            print(f"Erreur lors du chargement de l'historique: {e}")
+    
     @staticmethod
     def load_history() -> List[Dict[str, Any]]:
-        """Charge l'historique des mains jouées."""
-        if os.path.exists(StatsManager.HISTORY_FILE):
-            try:
-                with open(StatsManager.HISTORY_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Erreur lors du chargement de l'historique: {e}")
-                return []
-        return []
+        """Charge les MAX_HISTORY dernières mains jouées."""
+        if StatsManager._store is not None:
+            StatsManager.flush_history()
+            return list(StatsManager._store.iter_history(StatsManager.MAX_HISTORY))
+        return list(deque(StatsManager.iter_history(), maxlen=StatsManager.MAX_HISTORY))
     
     @staticmethod
     def add_to_history(hand_data: Dict[str, Any]) -> None:
-        """Ajoute une main à l'historique."""
-        history = StatsManager.load_history()
-        hand_data["timestamp"] = datetime.now().isoformat()
-        history.append(hand_data)
+        """Ajoute une main à la fin de l'historique (sans relire le fichier)."""
+        StatsManager.record_round([hand_data])
+    
+    @staticmethod
+    def record_round(hands: List[Dict[str, Any]]) -> None:
+        """Ajoute les mains d'une manche à l'historique, sans écrire sur le disque.
         
-        # Garder seulement les 1000 dernières mains
-        if len(history) > 1000:
-            history = history[-1000:]
+        Les mains (copiées et horodatées) sont écrites par un thread de fond ;
+        celles programmées entre deux écritures sont ajoutées en une seule
+        fois. Avec SQLite, elles sont insérées en lot dans une transaction.
+        """
+        timestamp = datetime.now().isoformat()
+        records = [dict(hand_data, timestamp=timestamp) for hand_data in hands]
+        with StatsManager._pending_lock:
+            StatsManager._pending_hands.extend(records)
+            if StatsManager._history_saver is None:
+                StatsManager._history_saver = WriteBehindSaver(StatsManager._write_pending)
+            saver = StatsManager._history_saver
+        saver.schedule(len(records))
+    
+    @staticmethod
+    def flush_history() -> None:
+        """Écrit immédiatement les mains en attente, dans le thread appelant."""
+        if StatsManager._history_saver is not None:
+            StatsManager._history_saver.flush()
+    
+    @staticmethod
+    def _write_pending(_) -> None:
+        """Écrit toutes les mains en attente (appelé par le thread d'écriture)."""
+        with StatsManager._pending_lock:
+            hands, StatsManager._pending_hands = StatsManager._pending_hands, []
+        if not hands:
+            return
+        if StatsManager._store is not None:
+            try:
+                StatsManager._store.record_round(hands)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de l'historique: {e}")
+            return
+        lines = "".join(json.dumps(hand_data, separators=(',', ':')) + "\n" for hand_data in hands)
         
-        try:
-            with open(StatsManager.HISTORY_FILE, 'w') as f:
-                json.dump(history, f, indent=2)
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde de l'historique: {e}")
+        with StatsManager._history_lock:
+            StatsManager._migrate_legacy_history()
+            if StatsManager._history_lines is None:
+                StatsManager._history_lines = sum(1 for _ in StatsManager._read_history_file())
+            try:
+                with open(StatsManager.HISTORY_FILE, 'a') as f:
+                    f.write(lines)
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde de l'historique: {e}")
+                return
+            StatsManager._history_lines += len(hands)
+            
+            # Compactage en fond quand la fenêtre de rétention est dépassée
+            limit = StatsManager.MAX_HISTORY + StatsManager.COMPACTION_SLACK
+            running = StatsManager._compaction is not None and StatsManager._compaction.is_alive()
+            if StatsManager._history_lines > limit and not running:
+                StatsManager._compaction = threading.Thread(
+                    target=StatsManager.compact_history, daemon=True)
+                StatsManager._compaction.start()
     
     @staticmethod
-    def get_stats_summary(stats: Dict[str, Any]) -> Dict[str, Any]:
-        """Calcule les statistiques récapitulatives."""
+    def compact_history() -> None:
+        """Réécrit l'historique en ne gardant que les MAX_HISTORY dernières mains.
+        
+        Le fichier est réécrit dans un fichier temporaire puis remplacé
+        atomiquement ; le thread d'écriture attend la fin du compactage
+        avant d'ajouter les mains suivantes (record_round n'attend jamais).
+        """
+        with StatsManager._history_lock:
+            history = deque(StatsManager._read_history_file(), maxlen=StatsManager.MAX_HISTORY)
+            try:
+                atomic_write(StatsManager.HISTORY_FILE, lambda f: f.writelines(
+                    json.dumps(hand_data, separators=(',', ':')) + "\n" for hand_data in history))
+                StatsManager._history_lines = len(history)
+            except Exception as e:
+                print(f"Erreur lors du compactage de l'historique: {e}")
+    
+    @staticmethod
+    def get_stats_summary(stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Calcule les statistiques récapitulatives.
+        
+        Sans argument, les compteurs sont agrégés par SQL sur tout
+        l'historique avec un stockage SQLite, et lus dans les stats
+        sauvegardées sinon.
+        """
+        if stats is None:
+            stats = StatsManager.load_stats()
         total_hands = stats.get("total_hands", 0)
         wins = stats.get("wins", 0)
         losses = stats.get("losses", 0)
@@ -144,29 +309,56 @@ class StatsManager:
         default_stats = StatsManager.get_default_stats()
         StatsManager.save_stats(default_stats)
         
-        # Effacer l'historique aussi
-        try:
-            if os.path.exists(StatsManager.HISTORY_FILE):
-                os.remove(StatsManager.HISTORY_FILE)
-        except Exception as e:
-            print(f"Erreur lors de la suppression de l'historique: {e}")
+        # Effacer l'historique aussi, mains en attente comprises
+        StatsManager.flush_history()
+        if StatsManager._store is not None:
+            try:
+                StatsManager._store.reset()
+            except Exception as e:
+                print(f"Erreur lors de la suppression de l'historique: {e}")
+            return
+        with StatsManager._history_lock:
+            try:
+                for filename in (StatsManager.HISTORY_FILE, StatsManager.LEGACY_HISTORY_FILE):
+                    if os.path.exists(filename):
+                        os.remove(filename)
+                StatsManager._history_lines = 0
+            except Exception as e:
+                print(f"Erreur lors de la suppression de l'historique: {e}")
     
     @staticmethod
-    def get_session_stats(history: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calcule les stats pour la session actuelle (dernières N mains)."""
-        if not history:
-            return {}
+    def get_session_stats(history: Optional[Iterable[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Calcule les stats pour la session actuelle (dernières N mains).
+        
+        Les mains sont agrégées en un seul passage ; sans argument,
+        l'historique retenu est lu en flux depuis le fichier. Avec un
+        stockage SQLite, la session est celle de la base, agrégée par SQL.
+        """
+        if history is None and StatsManager._store is not None:
+            StatsManager.flush_history()
+            return StatsManager._store.session_stats()
+        if history is None:
+            history = StatsManager.load_history()
         
-        session_wins = sum(1 for h in history if h.get("result") == "win")
-        session_losses = sum(1 for h in history if h.get("result") == "loss")
-        session_pushes = sum(1 for h in history if h.get("result") == "push")
-        session_money = sum(h.get("amount", 0) for h in history)
+        hands = session_wins = session_losses = session_pushes = session_money = 0
+        for h in history:
+            hands += 1
+            result = h.get("result")
+            if result == "win":
+                session_wins += 1
+            elif result == "loss":
+                session_losses += 1
+            elif result == "push":
+                session_pushes += 1
+            session_money += h.get("amount", 0)
         
+        if not hands:
+            return {}
         return {
-            "hands": len(history),
+            "hands": hands,
             "wins": session_wins,
             "losses": session_losses,
             "pushes": session_pushes,
             "total_money": session_money,
-            "win_rate": (session_wins / len(history) * 100) if history else 0
+            "win_rate": session_wins / hands * 100
         }
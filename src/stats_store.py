@@ -0,0 +1,311 @@
+"""
+Stockage SQLite des statistiques et de l'historique des mains (optionnel).
+
+Alternative aux fichiers JSON de StatsManager et de Player : une base
+SQLite en mode WAL avec trois tables indexées (joueurs, sessions, mains).
+Les mains d'une manche sont insérées en lot dans une seule transaction,
+l'historique n'est jamais réécrit ni tronqué, et les agrégats (récapitulatif,
+stats de session) sont calculés par SQL, sans charger l'historique.
+
+Le stockage est activé par la configuration (``storage.backend = "sqlite"``) ;
+les fichiers JSON restent le stockage par défaut.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+#: Répertoire des données (parent de src, comme StatsManager.STATS_FILE)
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#: Fichier de base de données par défaut
+DB_FILE = os.path.join(DATA_DIR, "blackjack.db")
+
+#: Nom du joueur par défaut
+DEFAULT_PLAYER = "Player"
+
+#: Colonnes de compteurs de la table players (stats de Player et de StatsManager)
+PLAYER_COLUMNS = (
+    "balance", "initial_balance", "total_hands", "wins", "losses", "pushes",
+    "blackjacks", "total_wagered", "total_won", "total_money_won", "total_money_lost",
+)
+
+#: Colonnes dédiées de la table hands (le reste de la main est gardé en JSON)
+HAND_COLUMNS = ("result", "bet", "amount", "blackjack")
+
+#: Nombre de mains lues à la fois par iter_history
+HISTORY_BATCH = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    balance INTEGER NOT NULL DEFAULT 1000,
+    initial_balance INTEGER NOT NULL DEFAULT 1000,
+    total_hands INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    pushes INTEGER NOT NULL DEFAULT 0,
+    blackjacks INTEGER NOT NULL DEFAULT 0,
+    total_wagered INTEGER NOT NULL DEFAULT 0,
+    total_won INTEGER NOT NULL DEFAULT 0,
+    total_money_won INTEGER NOT NULL DEFAULT 0,
+    total_money_lost INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    started_at TEXT NOT NULL,
+    ended_at TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_player ON sessions(player_id, id);
+CREATE TABLE IF NOT EXISTS hands (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    session_id INTEGER REFERENCES sessions(id),
+    timestamp TEXT NOT NULL,
+    result TEXT,
+    bet INTEGER NOT NULL DEFAULT 0,
+    amount INTEGER NOT NULL DEFAULT 0,
+    blackjack INTEGER NOT NULL DEFAULT 0,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS hands_player ON hands(player_id, id);
+CREATE INDEX IF NOT EXISTS hands_session ON hands(session_id, result);
+"""
+
+#: Agrégats d'une série de mains, calculés par SQLite
+_AGGREGATE = """
+SELECT COUNT(*),
+       COALESCE(SUM(result = 'win'), 0),
+       COALESCE(SUM(result = 'loss'), 0),
+       COALESCE(SUM(result = 'push'), 0),
+       COALESCE(SUM(blackjack), 0),
+       COALESCE(SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END), 0),
+       COALESCE(SUM(CASE WHEN amount < 0 THEN -amount ELSE 0 END), 0)
+FROM hands
+"""
+
+
+class SQLiteStore:
+    """Base SQLite des joueurs, sessions et mains jouées.
+
+    La connexion est partagée entre threads (sauvegardes en fond) et
+    protégée par un verrou. Le mode WAL laisse les lectures se faire
+    pendant une écriture, et ``synchronous=NORMAL`` évite une
+    synchronisation disque à chaque transaction.
+
+    Attributes:
+        path (str): Chemin de la base
+        player (str): Nom du joueur courant
+        session_id (int): Session en cours (créée à la première manche)
+
+    Examples:
+        >>> store = SQLiteStore("blackjack.db")
+        >>> store.record_round([{"result": "win", "bet": 10, "amount": 10}])
+        >>> store.stats()["wins"]
+        1
+    """
+
+    def __init__(self, path: str = DB_FILE, player: str = DEFAULT_PLAYER):
+        """Ouvre (ou crée) la base et son schéma.
+
+        Args:
+            path (str, optional): Chemin de la base. Par défaut DB_FILE.
+            player (str, optional): Nom du joueur courant. Par défaut "Player".
+        """
+        self.path = path
+        self.player = player
+        self.session_id: Optional[int] = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+        self._player_id = self._get_player_id(player)
+
+    def close(self) -> None:
+        """Termine la session en cours et ferme la base."""
+        with self._lock:
+            if self.session_id is not None:
+                with self._conn:
+                    self._conn.execute("UPDATE sessions SET ended_at = ? WHERE id = ?",
+                                       (datetime.now().isoformat(), self.session_id))
+                self.session_id = None
+            self._conn.close()
+
+    def _get_player_id(self, name: str) -> int:
+        """Retourne l'identifiant d'un joueur, créé s'il n'existe pas."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO players (name, created_at) VALUES (?, ?)",
+                               (name, datetime.now().isoformat()))
+            return self._conn.execute("SELECT id FROM players WHERE name = ?",
+                                      (name,)).fetchone()[0]
+
+    def load_player(self) -> Optional[Dict[str, Any]]:
+        """Charge la ligne du joueur courant.
+
+        Returns:
+            dict: Nom, compteurs et dates du joueur, ou None s'il n'a
+                encore jamais été sauvegardé
+        """
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM players WHERE id = ?", (self._player_id,))
+            row = cursor.fetchone()
+        names = [column[0] for column in cursor.description]
+        data = dict(zip(names, row))
+        if data["updated_at"] is None:
+            return None
+        del data["id"]
+        return data
+
+    def save_player(self, data: Dict[str, Any]) -> None:
+        """Met à jour les compteurs du joueur courant.
+
+        Seules les colonnes connues (PLAYER_COLUMNS) présentes dans data
+        sont écrites, ce qui accepte aussi bien ``Player.to_dict()`` que
+        les stats de StatsManager.
+
+        Args:
+            data (dict): Compteurs à enregistrer
+        """
+        columns = [column for column in PLAYER_COLUMNS if column in data]
+        assignments = "".join(f"{column} = ?, " for column in columns)
+        values = [data[column] for column in columns]
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE players SET {assignments}updated_at = ? WHERE id = ?",
+                               values + [datetime.now().isoformat(), self._player_id])
+
+    def record_round(self, hands: Iterable[Dict[str, Any]]) -> None:
+        """Enregistre les mains d'une manche en une seule transaction.
+
+        Args:
+            hands (Iterable[dict]): Mains jouées ; ``result``, ``bet``,
+                ``amount`` et ``blackjack`` sont des colonnes, les autres
+                clés sont conservées en JSON
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for hand_data in hands:
+            extra = {key: value for key, value in hand_data.items()
+                     if key not in HAND_COLUMNS and key != "timestamp"}
+            rows.append((self._player_id, hand_data.get("timestamp", now),
+                         hand_data.get("result"), hand_data.get("bet", 0),
+                         hand_data.get("amount", 0), int(bool(hand_data.get("blackjack"))),
+                         json.dumps(extra, separators=(',', ':')) if extra else None))
+        if not rows:
+            return
+        with self._lock, self._conn:
+            if self.session_id is None:
+                self.session_id = self._conn.execute(
+                    "INSERT INTO sessions (player_id, started_at) VALUES (?, ?)",
+                    (self._player_id, now)).lastrowid
+            self._conn.executemany(
+                "INSERT INTO hands (player_id, session_id, timestamp, result, bet, amount, "
+                "blackjack, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [row[:1] + (self.session_id,) + row[1:] for row in rows])
+
+    def iter_history(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Parcourt l'historique du joueur, de la plus ancienne main à la plus récente.
+
+        Args:
+            limit (int, optional): Ne parcourt que les ``limit`` dernières mains
+
+        Yields:
+            dict: Une main, telle qu'enregistrée par record_round
+        """
+        query = ("SELECT id, timestamp, result, bet, amount, blackjack, data "
+                 "FROM hands WHERE player_id = ?")
+        params: List[Any] = [self._player_id]
+        if limit is not None:
+            query = f"SELECT * FROM ({query} ORDER BY id DESC LIMIT ?)"
+            params.append(limit)
+        cursor = self._conn.cursor()
+        with self._lock:
+            cursor.execute(query + " ORDER BY id", params)
+        while True:
+            # Lecture par paquets : le verrou n'est pas gardé pendant l'itération
+            with self._lock:
+                rows = cursor.fetchmany(HISTORY_BATCH)
+            if not rows:
+                return
+            for _, timestamp, result, bet, amount, blackjack, data in rows:
+                hand_data = json.loads(data) if data else {}
+                hand_data.update(result=result, bet=bet, amount=amount,
+                                 blackjack=bool(blackjack), timestamp=timestamp)
+                yield hand_data
+
+    def count_hands(self) -> int:
+        """Retourne le nombre de mains enregistrées pour le joueur."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM hands WHERE player_id = ?",
+                                      (self._player_id,)).fetchone()[0]
+
+    def _aggregate(self, where: str, params) -> tuple:
+        """Exécute la requête d'agrégation sur une sélection de mains."""
+        with self._lock:
+            return self._conn.execute(f"{_AGGREGATE} WHERE {where}", params).fetchone()
+
+    def stats(self) -> Dict[str, Any]:
+        """Agrège tout l'historique du joueur (format des stats de StatsManager).
+
+        Returns:
+            dict: Compteurs de mains et de gains calculés par SQL
+        """
+        hands, wins, losses, pushes, blackjacks, won, lost = self._aggregate(
+            "player_id = ?", (self._player_id,))
+        return {
+            "name": self.player,
+            "wins": wins,
+            "losses": losses,
+            "pushes": pushes,
+            "blackjacks": blackjacks,
+            "total_hands": hands,
+            "total_money_won": won,
+            "total_money_lost": lost,
+        }
+
+    def session_stats(self, session_id: Optional[int] = None) -> Dict[str, Any]:
+        """Agrège les mains d'une session (format de get_session_stats).
+
+        Args:
+            session_id (int, optional): Session à agréger. Par défaut,
+                la session en cours.
+
+        Returns:
+            dict: Stats de la session, vide si aucune main n'a été jouée
+        """
+        session_id = self.session_id if session_id is None else session_id
+        if session_id is None:
+            return {}
+        hands, wins, losses, pushes, _, won, lost = self._aggregate(
+            "session_id = ?", (session_id,))
+        if not hands:
+            return {}
+        return {
+            "hands": hands,
+            "wins": wins,
+            "losses": losses,
+            "pushes": pushes,
+            "total_money": won - lost,
+            "win_rate": wins / hands * 100
+        }
+
+    def reset(self) -> None:
+        """Efface l'historique et les sessions du joueur et remet ses compteurs à zéro."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM hands WHERE player_id = ?", (self._player_id,))
+            self._conn.execute("DELETE FROM sessions WHERE player_id = ?", (self._player_id,))
+            counters = "".join(f"{column} = 0, " for column in PLAYER_COLUMNS
+                               if column not in ("balance", "initial_balance"))
+            self._conn.execute(f"UPDATE players SET {counters}updated_at = ? WHERE id = ?",
+                               (datetime.now().isoformat(), self._player_id))
+            self.session_id = None
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide de la représentation compacte des cartes et du sabot.
+"""
+
+import pickle
+import random
+
+from core.card import Card, CARDS, CARD_VALUES, card_code
+from core.deck import Deck
+from core.game import Game, GameResult, GameState
+from core.hand import Hand
+
+
+def test_card_codes():
+    """Test les codes entiers et les tables de valeurs."""
+    print("=== Test des codes de cartes ===")
+
+    assert card_code("A", "♠") == 0
+    assert card_code("K", "♣") == 51
+    assert len(CARDS) == 52
+    for card in CARDS:
+        assert CARD_VALUES[card.code] == card.value()
+        assert Card(card.rank, card.suit) is card
+    assert Card("A", "♥").value() == 11
+    assert Card("Q", "♦").value() == 10
+    print("[OK] 52 codes cohérents avec rang, famille et valeur")
+
+
+def test_card_interning():
+    """Test que les cartes sont partagées, même après sérialisation."""
+    print("\n=== Test du partage des cartes ===")
+
+    card = Card("7", "♣")
+    assert card is Card("7", "♣")
+    assert pickle.loads(pickle.dumps(card)) is card
+    print(f"[OK] {card} est une instance unique")
+
+
+def test_shoe_cursor():
+    """Test le tirage par curseur et le remélange sur place."""
+    print("\n=== Test du sabot ===")
+
+    deck = Deck(2, random.Random(3))
+    shoe = deck.shoe
+    assert len(deck) == 104
+    drawn = deck.draw(5)
+    deck.burn(1)
+    assert len(deck) == 98
+    assert [c.code for c in drawn] == list(shoe[:5])
+
+    codes = deck.draw_many(10)
+    assert len(codes) == 10 and len(deck) == 88
+
+    deck.reset()
+    assert deck.shoe is shoe
+    assert len(deck) == 104
+    assert sorted(deck.shoe) == sorted(list(range(52)) * 2)
+    print(f"[OK] Sabot de {len(deck)} cartes remélangé sur place")
+
+
+def test_shoe_infinite():
+    """Test que le sabot se remélange quand il est vide."""
+    print("\n=== Test du sabot infini ===")
+
+    deck = Deck(1)
+    cards = deck.draw(60)
+    assert len(cards) == 60
+    assert len(deck) == 44
+    print(f"[OK] 60 cartes tirées d'un jeu de 52")
+
+
+def test_hand_incremental_totals():
+    """Test les totaux incrémentaux contre un recalcul complet."""
+    print("\n=== Test des totaux incrémentaux ===")
+
+    rng = random.Random(5)
+    for _ in range(2000):
+        hand = Hand()
+        for card in rng.sample(CARDS, rng.randint(1, 6)):
+            hand.add_card(card)
+        total = sum(card.value() for card in hand.cards)
+        aces = sum(1 for card in hand.cards if card.rank == "A")
+        while total > 21 and aces:
+            total -= 10
+            aces -= 1
+        assert hand.get_value() == total
+        assert hand.is_bust() == (total > 21)
+        assert hand.is_soft_hand() == (aces > 0)
+
+    hand = Hand()
+    hand.add_cards([Card("A", "♠"), Card("A", "♥"), Card("5", "♦")])
+    assert hand.get_value() == 17 and hand.is_soft_hand()
+    hand.clear()
+    assert hand.get_value() == 0 and not hand.is_soft_hand()
+    print("[OK] Totaux identiques au recalcul complet")
+
+
+def test_split_updates_totals():
+    """Test que le split met à jour les totaux des deux mains."""
+    print("\n=== Test du split ===")
+
+    game = Game(num_decks=1)
+    game.state = GameState.PLAYER_TURN
+    game.hands[0].add_cards([Card("8", "♠"), Card("8", "♥")])
+    assert game.can_split()
+    game.player_split()
+    for hand in game.hands:
+        assert len(hand.cards) == 2
+        assert hand.get_value() == sum(c.value() for c in hand.cards)
+        assert hand.cards[0].rank == "8"
+    print(f"[OK] Mains après split: {game.hands}")
+
+
+def test_reset_after_split():
+    """Test que reset vide la main réutilisée et annule un split."""
+    print("\n=== Test de la réinitialisation ===")
+
+    game = Game(num_decks=1, rng=3)
+    game.deal_initial_cards()
+    hand = game.hands[0]
+    game.reset()
+    assert game.hands[0] is hand and hand.cards == [] and hand.get_value() == 0
+    assert game.hand_bets == [0] and game.hand_results == [None]
+
+    game.state = GameState.PLAYER_TURN
+    game.hands[0].add_cards([Card("8", "♠"), Card("8", "♥")])
+    game.player_split()
+    game.reset()
+    assert len(game.hands) == 1 and game.hands[0].cards == []
+    assert game.hand_bets == [0] and game.hand_results == [None]
+    print("[OK] Main vidée et réutilisée, split annulé")
+
+
+def test_player_bust_loses():
+    """Test qu'un joueur qui a sauté perd, même si le croupier saute aussi."""
+    print("\n=== Test du double bust ===")
+
+    game = Game(num_decks=1)
+    game.state = GameState.DEALER_TURN
+    game.hands[0].add_cards([Card("10", "♠"), Card("8", "♥"), Card("K", "♦")])
+    game.dealer_hand.add_cards([Card("10", "♣"), Card("6", "♠"), Card("Q", "♥")])
+    game.dealer_play()
+    assert game.result == GameResult.DEALER_WIN
+    assert game.hand_results[0] == GameResult.DEALER_WIN
+    print(f"[OK] Joueur {game.hands[0].get_value()}, croupier "
+          f"{game.dealer_hand.get_value()} : {game.result.value}")
+
+
+def test_seeded_deck():
+    """Test la reproductibilité d'un sabot initialisé par une graine."""
+    print("\n=== Test du sabot reproductible ===")
+
+    assert Deck(6, rng=42).draw(30) == Deck(6, rng=random.Random(42)).draw(30)
+    game_a, game_b = Game(num_decks=2, rng="partie"), Game(num_decks=2, rng="partie")
+    game_a.deal_initial_cards()
+    game_b.deal_initial_cards()
+    assert game_a.hands[0].cards == game_b.hands[0].cards
+    assert game_a.dealer_hand.cards == game_b.dealer_hand.cards
+
+    # L'instantané rejoue les tirages, y compris après un remélange
+    deck = Deck(1, rng=7)
+    deck.draw(40)
+    state = deck.snapshot()
+    first = deck.draw(30)
+    deck.restore(state)
+    assert deck.draw(30) == first
+    print(f"[OK] Tirages rejoués: {first[:5]}")
+
+
+def test_cut_card():
+    """Test que le remélange attend la fin de la manche."""
+    print("\n=== Test de la carte de coupe ===")
+
+    events = []
+    game = Game(num_decks=1, rng=5, penetration=0.5)
+    game.deck.add_reshuffle_listener(events.append)
+    game.deck.draw(40)
+    assert game.deck.needs_shuffle and len(game.deck) == 12
+    assert events == []
+
+    # Le remélange a lieu entre deux manches, avec un nouveau sabot complet
+    game.reset()
+    assert events == [game.deck] and len(game.deck) == 52
+    assert sorted(game.deck.shoe) == list(range(52))
+    game.reset()
+    assert len(events) == 1
+
+    background = Deck(2, rng=5, background=True)
+    background.draw(104)
+    background.shuffle_if_needed()
+    assert len(background) == 104 and sorted(background.shoe) == sorted(list(range(52)) * 2)
+    print(f"[OK] {len(events)} remélange entre deux manches")
+
+
+if __name__ == "__main__":
+    print("Tests des cartes\n")
+    test_card_codes()
+    test_card_interning()
+    test_shoe_cursor()
+    test_shoe_infinite()
+    test_hand_incremental_totals()
+    test_split_updates_totals()
+    test_reset_after_split()
+    test_player_bust_loses()
+    test_seeded_deck()
+    test_cut_card()
+    print("\nTous les tests réussis!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide du gestionnaire de configuration.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from config_manager import ConfigManager
+
+
+def make_manager(directory):
+    """Crée un gestionnaire dont le fichier est dans un répertoire temporaire."""
+    class TempConfigManager(ConfigManager):
+        CONFIG_DIR = directory
+        CONFIG_FILE = os.path.join(directory, "settings.json")
+
+    TempConfigManager.SAVE_DELAY = 0.1
+    TempConfigManager.WATCH_INTERVAL = 0.05
+    return TempConfigManager()
+
+
+def test_dotted_index():
+    """Test l'index à plat des clés pointées."""
+    print("=== Test de l'index de configuration ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory)
+        assert config.get('game.fps') == 60
+        assert config.get('game') == config.config['game']
+        assert config.get('game.fps.x', 1) == 1
+        assert config.get('absent.key', 'x') == 'x'
+
+        config.set('ui.table_theme', 'blue')
+        assert config.get('ui.table_theme') == 'blue'
+        config.set('game', {'fps': 30})
+        assert config.get('game.fps') == 30 and config.get('game.width') is None
+        config.set('ui.layout.seats', 3)
+        assert config.get('ui.layout') == {'seats': 3}
+        # Index mis à jour clé par clé, identique à une reconstruction complète
+        assert config._index == dict(config._walk(config.config, ''))
+
+        config.reset_to_default()
+        assert config.get('game.fps') == 60
+        # La configuration par défaut n'est pas modifiée par les set
+        assert ConfigManager.DEFAULT_CONFIG['game']['fps'] == 60
+        config.close()
+        print("[OK] Clés résolues par l'index")
+
+
+def test_handles():
+    """Test les accès typés et leur invalidation."""
+    print("\n=== Test des ConfigHandle ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory)
+        volume = config.handle('features.music_volume', 0.5, float)
+        fps = config.handle('game.fps', 60, int)
+        assert volume.value == 0.5 and fps.value == 60
+
+        config.set('features.music_volume', "0.25")
+        assert volume.value == 0.25
+        fps.set("bad")
+        assert fps.value == 60  # conversion impossible : valeur par défaut
+        config.toggle_feature('show_hints')
+        assert config.handle('features.show_hints', True, bool).value is False
+        config.close()
+        print("[OK] Accès invalidés à chaque modification")
+
+
+def test_debounced_writes():
+    """Test qu'une rafale de set (glissement d'un slider) donne une écriture."""
+    print("\n=== Test des écritures différées ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory)
+        for step in range(50):
+            config.set('features.music_volume', step / 100)
+            assert config.get('features.music_volume') == step / 100
+        time.sleep(0.3)
+        assert config._saver.writes == 1
+        with open(config.CONFIG_FILE) as f:
+            assert json.load(f)['features']['music_volume'] == 0.49
+
+        with config.batch():
+            config.set('game.fps', 120)
+            with config.batch():
+                config.set('ui.table_theme', 'red')
+            assert not config._saver.dirty
+        assert config._saver.dirty
+        config.flush()
+        assert config._saver.writes == 2
+        with open(config.CONFIG_FILE) as f:
+            saved = json.load(f)
+        assert saved['game']['fps'] == 120 and saved['ui']['table_theme'] == 'red'
+        config.close()
+        print("[OK] 50 modifications, 1 écriture ; lot écrit en une fois")
+
+
+def test_watch_and_subscribe():
+    """Test le rechargement à chaud et la publication aux abonnés."""
+    print("\n=== Test de la surveillance du fichier ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = make_manager(directory)
+        events = []
+        config.subscribe(lambda section, values: events.append((section, values)), 'timing')
+        config.watch()
+
+        # Une écriture du gestionnaire n'est pas vue comme un changement externe
+        config.set('timing.action_delay', 0.25)
+        assert events[-1] == ('timing', config.get('timing'))
+        config.flush()
+        time.sleep(0.2)
+        assert config.dispatch_pending() == []
+
+        # Modification externe du fichier
+        with open(config.CONFIG_FILE) as f:
+            data = json.load(f)
+        data['timing']['initial_deal_duration'] = 2.5
+        with open(config.CONFIG_FILE, 'w') as f:
+            json.dump(data, f)
+        time.sleep(0.2)
+        assert config.get('timing.initial_deal_duration') == 1.0
+        assert config.dispatch_pending() == ['timing']
+        assert config.get('timing.initial_deal_duration') == 2.5
+        assert events[-1][1]['initial_deal_duration'] == 2.5
+        assert len(events) == 2
+
+        # Sections retirées du fichier : valeurs par défaut restaurées et publiées
+        config.set('ui.table_theme', 'blue')
+        config.set('game.fps', 120)
+        config.flush()
+        del data['timing'], data['game']
+        with open(config.CONFIG_FILE, 'w') as f:
+            json.dump(data, f)
+        time.sleep(0.2)
+        assert config.dispatch_pending() == ['game', 'timing', 'ui']
+        assert config.get('timing.initial_deal_duration') == 1.0
+        assert config.get('game.fps') == 60 and config.get('ui.table_theme') is None
+        assert events[-1] == ('timing', ConfigManager.DEFAULT_CONFIG['timing'])
+        config.close()
+        print("[OK] Sections rechargées, retirées et publiées")
+
+
+if __name__ == "__main__":
+    print("Tests de la configuration\n")
+    test_dotted_index()
+    test_handles()
+    test_debounced_writes()
+    test_watch_and_subscribe()
+    print("\nTous les tests réussis!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide de la persistance (écriture atomique, sauvegarde différée).
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from core.persistence import WriteBehindSaver, atomic_write_json, backup_path, load_json
+from core.player import Player
+
+
+def test_atomic_write():
+    """Test l'écriture atomique d'un fichier JSON."""
+    print("=== Test de l'écriture atomique ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_stats.json")
+        atomic_write_json(path, {"balance": 1})
+        atomic_write_json(path, {"balance": 2})
+        with open(path) as f:
+            assert json.load(f) == {"balance": 2}
+        # Aucun fichier temporaire ne reste dans le répertoire
+        assert os.listdir(directory) == ["player_stats.json"]
+        print("[OK] Fichier remplacé sans résidu")
+
+
+def test_write_behind_saver():
+    """Test la fusion des sauvegardes et l'écriture finale."""
+    print("\n=== Test de la sauvegarde différée ===")
+
+    written = []
+    saver = WriteBehindSaver(written.append, interval=0.2, flush_at_exit=False)
+    saver.schedule({"balance": 1})
+    time.sleep(0.05)
+    for balance in range(2, 50):
+        saver.schedule({"balance": balance})
+    saver.close()
+
+    # La première écriture part tout de suite, les suivantes sont fusionnées
+    assert written[0] == {"balance": 1}
+    assert written[-1] == {"balance": 49}
+    assert len(written) == 2 and saver.writes == 2
+    assert not saver.dirty
+    print(f"[OK] {49} états programmés, {len(written)} écritures")
+
+
+def test_player_save_data():
+    """Test la sauvegarde d'un joueur par le saver."""
+    print("\n=== Test de Player.save_data ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_stats.json")
+        saver = WriteBehindSaver(lambda data: Player.save_data(data, path), flush_at_exit=False)
+        player = Player(balance=500)
+        player.win_hand(25)
+        saver.schedule(player.to_dict())
+        saver.close()
+        assert Player.load(path).balance == 525
+        print("[OK] Joueur sauvegardé en fond")
+
+
+def test_backup_recovery():
+    """Test le repli sur la copie de secours d'un fichier tronqué."""
+    print("\n=== Test de la récupération ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "player_stats.json")
+        for balance in (100, 200, 300):
+            atomic_write_json(path, {"balance": balance}, backups=2)
+        with open(backup_path(path, 2)) as f:
+            assert json.load(f) == {"balance": 100}
+
+        # Arrêt brutal simulé : fichier principal tronqué
+        with open(path, 'w') as f:
+            f.write('{"bala')
+        assert load_json(path) == {"balance": 200}
+        assert Player.load(path).balance == 200
+        assert load_json(os.path.join(directory, "absent.json")) is None
+        print("[OK] Dernière copie valide chargée")
+
+
+if __name__ == "__main__":
+    print("Tests de la persistance\n")
+    test_atomic_write()
+    test_write_behind_saver()
+    test_player_save_data()
+    test_backup_recovery()
+    print("\nTous les tests réussis!")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide des calculs de probabilités.
+"""
+
+import os
+import tempfile
+import time
+
+from core.basic_strategy import BasicStrategy, _failed, _loading, basic_strategy, get_basic_strategy
+from core.card import Card
+from core.expected_value import (BackgroundActionEVs, _solve, action_evs, best_action,
+                                 game_action_evs)
+from core.game import Game, GameState, PlayerAction
+from core.probability import dealer_probabilities, game_dealer_probabilities
+from core.simulator import Simulator
+
+
+SIX_DECKS = (24, 24, 24, 24, 24, 24, 24, 24, 24, 96)
+
+
+def remove(composition, index):
+    """Retire une carte d'index donné d'une composition."""
+    counts = list(composition)
+    counts[index] -= 1
+    return tuple(counts)
+
+
+def test_dealer_small_shoe():
+    """Test un cas calculable à la main."""
+    print("=== Test des probabilités du croupier (petit sabot) ===")
+
+    # Croupier 10, reste un 6 et un 10 : 20 (1/2) ou 16 puis bust (1/2)
+    probs = dealer_probabilities(10, (0, 0, 0, 0, 0, 1, 0, 0, 0, 1))
+    assert abs(probs[20] - 0.5) < 1e-12
+    assert abs(probs["bust"] - 0.5) < 1e-12
+    print(f"[OK] {probs}")
+
+
+def test_dealer_six_decks():
+    """Test les valeurs connues pour un sabot de 6 jeux."""
+    print("\n=== Test des probabilités du croupier (6 jeux) ===")
+
+    for upcard in range(2, 12):
+        index = 0 if upcard == 11 else upcard - 1
+        probs = dealer_probabilities(upcard, remove(SIX_DECKS, index))
+        assert abs(sum(probs.values()) - 1.0) < 1e-9
+    bust_6 = dealer_probabilities(6, remove(SIX_DECKS, 5))["bust"]
+    assert 0.41 < bust_6 < 0.43
+    peeked = dealer_probabilities(11, remove(SIX_DECKS, 0), peeked=True)
+    assert peeked["blackjack"] == 0.0
+    print(f"[OK] Bust avec un 6 visible: {bust_6:.1%}")
+
+
+def test_game_probabilities():
+    """Test le calcul sur une partie en cours."""
+    print("\n=== Test des probabilités sur une partie ===")
+
+    game = Game(num_decks=1)
+    game.dealer_hand.add_cards([Card("6", "♠"), Card("K", "♥")])
+    game.state = GameState.PLAYER_TURN
+    probs = game_dealer_probabilities(game)
+    assert abs(sum(probs.values()) - 1.0) < 1e-9
+    print(f"[OK] Bust: {probs['bust']:.1%}")
+
+
+def test_action_evs_trivial():
+    """Test un sabot ne contenant que des dix."""
+    print("\n=== Test des EV (sabot de dix) ===")
+
+    # Le croupier finit forcément à 20 : rester ou tirer sur 16 perd
+    evs = action_evs([10, 6], 10, (0, 0, 0, 0, 0, 0, 0, 0, 0, 20))
+    assert evs[PlayerAction.STAND] == -1.0
+    assert evs[PlayerAction.HIT] == -1.0
+    assert evs[PlayerAction.DOUBLE] == -2.0
+    assert best_action(evs) == PlayerAction.SURRENDER
+    print(f"[OK] {evs}")
+
+
+def test_action_evs_six_decks():
+    """Test des décisions connues de la stratégie de base."""
+    print("\n=== Test des EV (6 jeux) ===")
+
+    def composition(values, upcard):
+        counts = list(SIX_DECKS)
+        for v in list(values) + [upcard]:
+            counts[0 if v == 11 else v - 1] -= 1
+        return tuple(counts)
+
+    assert best_action(action_evs([5, 6], 10, composition([5, 6], 10))) == PlayerAction.DOUBLE
+    assert best_action(action_evs([10, 2], 6, composition([10, 2], 6))) == PlayerAction.STAND
+    assert best_action(action_evs([10, 7], 11, composition([10, 7], 11), can_surrender=False)) == PlayerAction.STAND
+    assert best_action(action_evs([8, 8], 9, composition([8, 8], 9))) == PlayerAction.SPLIT
+    print("[OK] 11 double, 12 reste contre 6, 17 reste, 8-8 split")
+
+
+def test_game_action_evs():
+    """Test le calcul des EV sur une partie en cours."""
+    print("\n=== Test des EV sur une partie ===")
+
+    game = Game(num_decks=1)
+    game.state = GameState.PLAYER_TURN
+    game.hands[0].add_cards([Card("9", "♠"), Card("9", "♥")])
+    game.dealer_hand.add_cards([Card("6", "♦"), Card("K", "♣")])
+    evs = game_action_evs(game)
+    assert set(evs) == {PlayerAction.HIT, PlayerAction.STAND, PlayerAction.DOUBLE,
+                        PlayerAction.SPLIT, PlayerAction.SURRENDER}
+    print(f"[OK] Meilleure action: {best_action(evs).value}")
+
+
+def test_background_action_evs():
+    """Test le calcul des EV en fond, sans bloquer l'appelant."""
+    print("\n=== Test des EV calculées en fond ===")
+
+    game = Game(num_decks=6)
+    game.state = GameState.PLAYER_TURN
+    game.hands[0].add_cards([Card("A", "♠"), Card("A", "♥")])
+    game.dealer_hand.add_cards([Card("2", "♦"), Card("K", "♣")])
+    background = BackgroundActionEVs()
+    first = background.get(game)
+    assert background.join(timeout=30)
+    evs = background.get(game)
+    assert evs == game_action_evs(game)
+    print(f"[OK] Premier appel: {first}, puis {best_action(evs).value}")
+
+
+def test_action_evs_cold_budget():
+    """Test qu'un split calculé à froid tient dans une image (16 ms)."""
+    print("\n=== Test du temps de calcul à froid ===")
+
+    counts = list(SIX_DECKS)
+    for v in (11, 11, 6):
+        counts[0 if v == 11 else v - 1] -= 1
+    _solve.cache_clear()
+    start = time.perf_counter()
+    evs = action_evs([11, 11], 6, tuple(counts))
+    elapsed = time.perf_counter() - start
+    assert best_action(evs) == PlayerAction.SPLIT
+    print(f"[OK] A-A contre 6 (6 jeux) à froid: {elapsed * 1000:.1f} ms")
+
+
+def test_basic_strategy_table():
+    """Test des décisions connues dans la table de stratégie de base."""
+    print("\n=== Test de la table de stratégie de base (6 jeux) ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        strategy = get_basic_strategy(6, directory=directory)
+        assert get_basic_strategy(6, directory=directory) is strategy
+        filepath = os.path.join(directory, "basic_strategy_6d.bin")
+        strategy.save(filepath)
+        loaded = BasicStrategy.load(filepath)
+    assert loaded.table == strategy.table and loaded.num_decks == 6
+
+    assert strategy.lookup(11, False, None, 6) == PlayerAction.DOUBLE
+    assert strategy.lookup(11, False, None, 6, can_double=False) == PlayerAction.HIT
+    assert strategy.lookup(12, False, None, 4) == PlayerAction.STAND
+    assert strategy.lookup(16, False, None, 10) == PlayerAction.SURRENDER
+    assert strategy.lookup(16, False, None, 10, can_surrender=False) == PlayerAction.HIT
+    assert strategy.lookup(18, True, None, 9) == PlayerAction.HIT
+    assert strategy.lookup(16, False, 8, 10) == PlayerAction.SPLIT
+    assert strategy.lookup(20, False, 10, 6) == PlayerAction.STAND
+    print("[OK] 11 double, 12 reste contre 4, 16 abandonne contre 10, 8-8 split")
+
+
+def test_basic_strategy_simulation():
+    """Test la stratégie de base comme stratégie de simulation."""
+    print("\n=== Test de la stratégie de base en simulation ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        get_basic_strategy(1, directory=directory)
+    game = Game(num_decks=1)
+    game.state = GameState.PLAYER_TURN
+    game.hands[0].add_cards([Card("8", "♠"), Card("8", "♥")])
+    game.dealer_hand.add_cards([Card("10", "♦"), Card("7", "♣")])
+    assert basic_strategy(game) == PlayerAction.SPLIT
+
+    result = Simulator(basic_strategy, num_decks=1).run(2000)
+    assert result.rounds == 2000
+    print(f"[OK] {result}")
+
+
+def test_basic_strategy_background():
+    """Test le chargement de la table en fond, sans bloquer l'appelant."""
+    print("\n=== Test du chargement de la stratégie en fond ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        assert get_basic_strategy(2, directory=directory, wait=False) is None
+        _loading[2].join()
+        strategy = get_basic_strategy(2, wait=False)
+        assert strategy is not None and strategy.num_decks == 2
+        assert os.path.exists(os.path.join(directory, "basic_strategy_2d.bin"))
+    print("[OK] Table de 2 jeux générée en fond")
+
+
+def test_basic_strategy_background_failure():
+    """Test qu'un chargement en fond qui échoue n'est pas relancé à chaque appel."""
+    print("\n=== Test d'un échec du chargement en fond ===")
+
+    def fail(num_decks):
+        raise MemoryError("génération impossible")
+
+    generate = BasicStrategy.__dict__["generate"]
+    BasicStrategy.generate = staticmethod(fail)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            assert get_basic_strategy(3, directory=directory, wait=False) is None
+            _loading[3].join()
+            assert 3 in _failed
+            assert get_basic_strategy(3, directory=directory, wait=False) is None
+            assert 3 not in _loading
+    finally:
+        BasicStrategy.generate = generate
+        _failed.discard(3)
+    print("[OK] Échec enregistré, pas de nouveau thread")
+
+
+if __name__ == "__main__":
+    print("Tests des probabilités\n")
+    test_dealer_small_shoe()
+    test_dealer_six_decks()
+    test_game_probabilities()
+    test_action_evs_trivial()
+    test_action_evs_six_decks()
+    test_game_action_evs()
+    test_background_action_evs()
+    test_action_evs_cold_budget()
+    test_basic_strategy_table()
+    test_basic_strategy_simulation()
+    test_basic_strategy_background()
+    test_basic_strategy_background_failure()
+    print("\nTous les tests réussis!")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide du simulateur de parties sans interface graphique.
+"""
+
+import tempfile
+
+import pytest
+
+from core.basic_strategy import basic_strategy, get_basic_strategy
+from core.card import Card
+from core.counting import HI_LO, KO, OMEGA_II, CardCounter, bet_ramp
+from core.deck import Deck
+from core.game import PlayerAction
+from core.montecarlo import MonteCarloRunner, split_rounds
+from core.simulator import Simulator, SimulationResult
+from core.vectorized import HAS_NUMPY, VectorizedSimulator, cross_check
+
+
+def test_simulator_run():
+    """Test une série de manches avec la stratégie par défaut."""
+    print("=== Test du simulateur ===")
+
+    result = Simulator(num_decks=6).run(2000)
+    assert result.rounds == 2000
+    assert result.wins + result.losses + result.pushes == 2000
+    assert result.variance > 0
+    assert result.rounds_per_sec > 0
+    print(f"[OK] {result}")
+
+
+def test_simulator_strategy():
+    """Test une stratégie personnalisée (toujours rester)."""
+    print("\n=== Test d'une stratégie personnalisée ===")
+
+    sim = Simulator(strategy=lambda game: PlayerAction.STAND)
+    result = sim.run(500)
+    assert result.rounds == 500
+    print(f"[OK] Toujours rester: avantage maison {result.house_edge:.2%}")
+
+
+def test_house_edge_units():
+    """Test que l'avantage de la maison ne dépend pas de la mise."""
+    print("\n=== Test des unités de l'avantage maison ===")
+
+    unit = Simulator(num_decks=6, rng=7).run(1000)
+    chips = Simulator(num_decks=6, rng=7, bet=10).run(1000)
+    # Gains en jetons, avantage rapporté aux mises initiales
+    assert chips.net_units == 10 * unit.net_units
+    assert chips.wagered == 10 * unit.wagered == 10000
+    assert abs(chips.house_edge - unit.house_edge) < 1e-12
+    print(f"[OK] Avantage maison {unit.house_edge:.2%} pour une mise de 1 ou 10")
+
+
+def test_simulator_surrender():
+    """Test que l'abandon coûte exactement la moitié de la mise."""
+    print("\n=== Test de l'abandon ===")
+
+    sim = Simulator(strategy=lambda game: PlayerAction.SURRENDER)
+    nets = {sim.play_round() for _ in range(200)}
+    # Abandon (-0.5) ou manche réglée dès la distribution (Blackjack, égalité)
+    assert nets <= {-0.5, -1, 0, 1.5}
+    assert -0.5 in nets
+    print(f"[OK] Gains possibles: {sorted(nets)}")
+
+
+def test_result_merge():
+    """Test la fusion de deux résultats partiels."""
+    print("\n=== Test de la fusion des résultats ===")
+
+    a = Simulator().run(300)
+    b = Simulator().run(200)
+    merged = SimulationResult().merge(a).merge(b)
+    assert merged.rounds == 500
+    assert merged.net_units == a.net_units + b.net_units
+    assert merged.sum_squares == a.sum_squares + b.sum_squares
+    print(f"[OK] Fusion: {merged.rounds} manches")
+
+
+def test_montecarlo_reproducible():
+    """Test qu'une graine donne le même résultat quel que soit le nombre de processus."""
+    print("\n=== Test du Monte-Carlo multi-processus ===")
+
+    assert split_rounds(10, 3) == [4, 3, 3]
+    serial = MonteCarloRunner(workers=1, seed=42).run(2000, chunks=2)
+    parallel = MonteCarloRunner(workers=2, seed=42).run(2000)
+    assert serial.rounds == parallel.rounds == 2000
+    assert serial.net_units == parallel.net_units
+    assert serial.sum_squares == parallel.sum_squares
+    print(f"[OK] Graine 42: gain net {serial.net_units} dans les deux cas")
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy non installé")
+def test_vectorized_cross_check():
+    """Test que le simulateur NumPy concorde avec le Simulator scalaire."""
+    print("\n=== Test du simulateur vectorisé ===")
+
+    result = VectorizedSimulator(num_decks=1, seed=1).run(50000)
+    assert result.rounds == result.wins + result.losses + result.pushes == 50000
+    report = cross_check(20000, num_decks=1, seed=3)
+    assert report["agrees"], report
+    print(f"[OK] Écart {report['difference']:+.4f} ({report['z']:+.2f} erreurs types)")
+
+
+def test_card_counter():
+    """Test le compte courant et le compte vrai tenus au fil des tirages."""
+    print("\n=== Test du compteur de cartes ===")
+
+    assert sum(HI_LO.weights) == 0 and sum(OMEGA_II.weights) == 0
+    assert not KO.balanced and KO.weights[Card("7", "♠").code] == 1
+
+    deck = Deck(2, rng=11)
+    counter = CardCounter(HI_LO, deck)
+    cards = deck.draw(30) + [deck.draw_card()]
+    deck.burn(5)
+    codes = deck.draw_many(10)
+    seen = [c.code for c in cards] + list(deck.shoe[31:36]) + list(codes)
+    assert counter.running_count == sum(HI_LO.weights[code] for code in seen)
+    assert counter.cards_seen == 46
+    assert abs(counter.true_count - counter.running_count / (58 / 52)) < 1e-12
+
+    # Un jeu complet compté ramène un système équilibré à zéro
+    deck.draw(len(deck))
+    assert counter.running_count == 0
+    deck.reshuffle()
+    assert counter.cards_seen == 0
+    print(f"[OK] Compte Hi-Lo tenu sur {len(seen)} cartes")
+
+
+def test_ko_pass():
+    """Test le compte de départ KO et un passage complet du sabot."""
+    print("\n=== Test du compte KO ===")
+
+    for num_decks, irc in ((1, 0), (6, -20)):
+        deck = Deck(num_decks, rng=5)
+        counter = CardCounter(KO, deck)
+        assert counter.running_count == irc
+        deck.draw(len(deck))
+        # KO n'est pas équilibré : +4 par jeu, un sabot complet finit à +4
+        assert counter.running_count == 4
+    print("[OK] IRC 0 (1 jeu) et -20 (6 jeux), +4 en fin de sabot")
+
+
+def test_counter_restore():
+    """Test la resynchronisation du compteur après Deck.restore()."""
+    print("\n=== Test du compteur après restauration ===")
+
+    deck = Deck(2, rng=8)
+    counter = CardCounter(HI_LO, deck)
+    deck.draw(20)
+    state = deck.snapshot()
+    expected = counter.running_count
+    deck.draw(40)
+    deck.restore(state)
+    assert counter.running_count == expected and counter.cards_seen == 20
+    print(f"[OK] Compte {expected:+d} retrouvé après restauration")
+
+
+def test_bet_spread():
+    """Test une simulation avec une mise indexée sur le compte vrai."""
+    print("\n=== Test d'un étalement de mise ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        get_basic_strategy(6, directory=directory)
+    sim = Simulator(basic_strategy, num_decks=6, rng=4)
+    counter = CardCounter(HI_LO, sim.game.deck)
+    sim.betting = bet_ramp(counter, [1, 1, 2, 4, 8])
+    result = sim.run(3000)
+    assert result.rounds == 3000
+    print(f"[OK] {result}")
+
+
+if __name__ == "__main__":
+    print("Tests du simulateur\n")
+    test_simulator_run()
+    test_simulator_strategy()
+    test_house_edge_units()
+    test_simulator_surrender()
+    test_result_merge()
+    test_montecarlo_reproducible()
+    if HAS_NUMPY:
+        test_vectorized_cross_check()
+    else:
+        print("\n[SKIP] NumPy non installé")
+    test_card_counter()
+    test_ko_pass()
+    test_counter_restore()
+    test_bet_spread()
+    print("\nTous les tests réussis!")
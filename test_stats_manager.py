@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide de l'historique des mains (journal JSON Lines).
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+from core.persistence import WriteBehindSaver
+from stats_manager import StatsManager
+
+
+@contextmanager
+def temp_history():
+    """Redirige l'historique vers un répertoire temporaire, le temps du bloc.
+
+    Les chemins et le compteur de lignes de StatsManager sont rétablis en
+    sortie, même si le test échoue.
+    """
+    StatsManager.flush_history()
+    saved = (StatsManager.HISTORY_FILE, StatsManager.LEGACY_HISTORY_FILE,
+             StatsManager._history_lines)
+    with tempfile.TemporaryDirectory() as directory:
+        StatsManager.HISTORY_FILE = os.path.join(directory, "player_history.jsonl")
+        StatsManager.LEGACY_HISTORY_FILE = os.path.join(directory, "player_history.json")
+        StatsManager._history_lines = None
+        try:
+            yield directory
+        finally:
+            StatsManager.flush_history()
+            if StatsManager._compaction is not None:
+                StatsManager._compaction.join()
+            (StatsManager.HISTORY_FILE, StatsManager.LEGACY_HISTORY_FILE,
+             StatsManager._history_lines) = saved
+
+
+def test_append_and_stream():
+    """Test l'ajout en fin de journal et la lecture en flux."""
+    print("=== Test de l'historique JSON Lines ===")
+
+    with temp_history():
+        for i in range(5):
+            StatsManager.add_to_history({"result": "win" if i % 2 else "loss", "amount": 10})
+        StatsManager.flush_history()
+        with open(StatsManager.HISTORY_FILE) as f:
+            assert len(f.readlines()) == 5
+
+        history = StatsManager.load_history()
+        assert [h["result"] for h in history] == ["loss", "win", "loss", "win", "loss"]
+        stats = StatsManager.get_session_stats()
+        assert stats["hands"] == 5 and stats["wins"] == 2 and stats["total_money"] == 50
+        assert StatsManager.get_session_stats(iter(history)) == stats
+        print(f"[OK] {stats}")
+
+
+def test_compaction():
+    """Test que le compactage applique la fenêtre de rétention."""
+    print("\n=== Test du compactage ===")
+
+    with temp_history():
+        limit = StatsManager.MAX_HISTORY + StatsManager.COMPACTION_SLACK
+        for i in range(limit + 1):
+            StatsManager.add_to_history({"result": "push", "hand": i})
+        StatsManager.flush_history()
+        StatsManager._compaction.join()
+
+        history = StatsManager.load_history()
+        assert len(history) == StatsManager.MAX_HISTORY
+        assert history[-1]["hand"] == limit
+        with open(StatsManager.HISTORY_FILE) as f:
+            assert len(f.readlines()) == StatsManager.MAX_HISTORY
+        print(f"[OK] {len(history)} mains conservées")
+
+
+def test_legacy_migration():
+    """Test la migration de l'ancien historique JSON."""
+    print("\n=== Test de la migration ===")
+
+    with temp_history():
+        with open(StatsManager.LEGACY_HISTORY_FILE, 'w') as f:
+            json.dump([{"result": "win", "amount": 5}] * 3, f, indent=2)
+        StatsManager.add_to_history({"result": "loss", "amount": -5})
+        StatsManager.flush_history()
+
+        assert not os.path.exists(StatsManager.LEGACY_HISTORY_FILE)
+        assert [h["result"] for h in StatsManager.load_history()] == ["win", "win", "win", "loss"]
+        print("[OK] Ancien historique converti")
+
+
+def test_record_round_write_behind():
+    """Test que record_round n'écrit pas dans l'appelant et ne modifie pas ses mains."""
+    print("\n=== Test de l'écriture différée ===")
+
+    with temp_history():
+        hands = [{"result": "win", "amount": 10}, {"result": "loss", "amount": -10}]
+        saver = StatsManager._history_saver
+        if saver is not None:
+            saver.close()
+        StatsManager._history_saver = WriteBehindSaver(StatsManager._write_pending, interval=60,
+                                                       debounce=True)
+        try:
+            StatsManager.record_round(hands)
+            assert not os.path.exists(StatsManager.HISTORY_FILE)
+            assert "timestamp" not in hands[0] and "timestamp" not in hands[1]
+            history = StatsManager.load_history()
+            assert [h["result"] for h in history] == ["win", "loss"]
+            assert history[0]["timestamp"] == history[1]["timestamp"]
+        finally:
+            StatsManager._history_saver.close()
+            StatsManager._history_saver = None
+        print("[OK] Mains écrites en fond, dictionnaires de l'appelant intacts")
+
+
+if __name__ == "__main__":
+    print("Tests de l'historique\n")
+    test_append_and_stream()
+    test_compaction()
+    test_legacy_migration()
+    test_record_round_write_behind()
+    print("\nTous les tests réussis!")
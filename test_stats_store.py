@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test rapide du stockage SQLite des stats et de l'historique.
+"""
+
+import os
+import tempfile
+
+from core.player import Player
+from stats_manager import StatsManager
+from stats_store import SQLiteStore
+
+
+def test_round_and_aggregates():
+    """Test l'enregistrement d'une manche et les agrégats SQL."""
+    print("=== Test du stockage SQLite ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteStore(os.path.join(directory, "blackjack.db"))
+        store.record_round([
+            {"result": "win", "bet": 10, "amount": 15, "blackjack": True},
+            {"result": "loss", "bet": 20, "amount": -20, "player_value": 18},
+        ])
+        store.record_round([{"result": "push", "bet": 10, "amount": 0}])
+
+        history = list(store.iter_history())
+        assert [h["result"] for h in history] == ["win", "loss", "push"]
+        assert history[1]["player_value"] == 18
+        assert [h["result"] for h in store.iter_history(limit=2)] == ["loss", "push"]
+
+        stats = store.stats()
+        assert stats["total_hands"] == 3 and stats["blackjacks"] == 1
+        assert stats["total_money_won"] == 15 and stats["total_money_lost"] == 20
+        session = store.session_stats()
+        assert session["hands"] == 3 and session["total_money"] == -5
+        store.close()
+        print(f"[OK] {session}")
+
+
+def test_stats_manager_backend():
+    """Test StatsManager et Player sur la base SQLite."""
+    print("\n=== Test de StatsManager avec SQLite ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteStore(os.path.join(directory, "blackjack.db"))
+        StatsManager.use_store(store)
+        Player.store = store
+        try:
+            assert store.load_player() is None
+            player = Player(balance=500)
+            player.win_hand(50)
+            player.save()
+            assert Player.load().balance == 550
+            # La ligne du joueur n'est écrite que par Player
+            StatsManager.save_stats(StatsManager.get_default_stats())
+            assert store.load_player()["wins"] == 1
+
+            for i in range(StatsManager.MAX_HISTORY + 10):
+                StatsManager.add_to_history({"result": "win", "amount": 1, "hand": i})
+            # Pas de fenêtre de rétention : tout l'historique reste dans la base
+            StatsManager.flush_history()
+            assert store.count_hands() == StatsManager.MAX_HISTORY + 10
+            assert len(StatsManager.load_history()) == StatsManager.MAX_HISTORY
+
+            summary = StatsManager.get_stats_summary()
+            assert summary["total_hands"] == StatsManager.MAX_HISTORY + 10
+            assert summary["win_rate"] == 100.0
+            assert StatsManager.get_session_stats()["wins"] == StatsManager.MAX_HISTORY + 10
+
+            StatsManager.reset_stats()
+            assert store.count_hands() == 0 and StatsManager.get_session_stats() == {}
+            print(f"[OK] {summary['total_hands']} mains agrégées par SQL")
+        finally:
+            StatsManager.use_store(None)
+            Player.store = None
+            store.close()
+
+
+if __name__ == "__main__":
+    print("Tests du stockage SQLite\n")
+    test_round_and_aggregates()
+    test_stats_manager_backend()
+    print("\nTous les tests réussis!")